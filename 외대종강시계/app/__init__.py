@@ -1,28 +1,54 @@
 from flask import Flask
-import os
 from config import Config
 
-app = Flask(__name__,
-           static_folder=Config.STATIC_FOLDER,
-           template_folder=Config.TEMPLATE_FOLDER)
-
-# CSS 파일 존재 여부 확인
-css_files = [
-    'css/main.css',
-    'css/components/current-time.css',
-    'css/components/meal.css',
-    'css/components/notice-board.css',
-    'css/components/timer.css',
-    'css/themes/layout.css',
-    'css/themes/themes.css',
-    'css/themes/transitions.css',
-    'css/responsive.css'
-]
-
-print("\nChecking CSS files:")
-for css_file in css_files:
-    file_path = os.path.join(Config.STATIC_FOLDER, css_file)
-    print(f"{css_file}: {'EXISTS' if os.path.exists(file_path) else 'MISSING'}")
-
-# routes import should be after app initialization
-from app import routes
\ No newline at end of file
+"""
+HUFS 종강시계 애플리케이션 패키지
+- create_app(): 애플리케이션 팩토리
+- 크롤러 등 무거운 모듈은 첫 사용 시 import (app.warmup 으로 미리 불러올 수 있음)
+- 정적 파일 검사는 빌드 단계로 이동: python -m app.build
+"""
+
+
+def create_app(config=Config, warm_up=None):
+    """
+    Flask 애플리케이션 생성
+    Args:
+        config: 정적/템플릿 경로, WARMUP_ON_CREATE 등을 가진 설정 객체
+        warm_up (bool): 생성 직후 warm_up() 실행 여부 (기본값 config.WARMUP_ON_CREATE)
+    Returns:
+        Flask: 라우트와 미들웨어가 등록된 애플리케이션
+    """
+    from app.admission import init_admission
+    from app.encoding import FastJSONProvider
+    from app.compression import init_compression
+    from app.profiling import init_profiling
+    from app.routes import bp
+    from app.tenancy import init_tenancy
+
+    app = Flask(__name__,
+               static_folder=config.STATIC_FOLDER,
+               template_folder=config.TEMPLATE_FOLDER)
+    app.json = FastJSONProvider(app)
+    init_admission(app)
+    init_compression(app)
+    init_profiling(app)
+    init_tenancy(app)
+    app.register_blueprint(bp)
+
+    if config.WARMUP_ON_CREATE if warm_up is None else warm_up:
+        from app.warmup import warm_up as run_warm_up
+        run_warm_up(app)
+    return app
+
+
+_default_app = None
+
+
+def __getattr__(name):
+    # 기존 코드의 `from app import app` 호환 (처음 접근할 때 생성)
+    global _default_app
+    if name == 'app':
+        if _default_app is None:
+            _default_app = create_app()
+        return _default_app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
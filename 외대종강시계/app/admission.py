@@ -0,0 +1,221 @@
+import math
+import threading
+import time
+from collections import OrderedDict
+
+from flask import g, jsonify, request
+
+from config import Config
+
+"""
+요청 수락 제어 (admission control)
+- 클라이언트(IP)별 경로 토큰 버킷: 한도를 넘으면 429 + Retry-After
+- 전체 동시 처리 수 상한: 넘으면 짧게 대기열에서 기다리고, 대기열이 차거나 대기 시간을 넘으면 503 + Retry-After
+- 우선 경로(기본 '/')는 예약된 슬롯까지 쓸 수 있어 과부하 중에도 메인 페이지가 빠르게 응답
+- 수락/거절 수와 동시 처리 수, 대기열 길이는 /metrics 의 admission 항목으로 제공
+"""
+
+
+class AdmissionController:
+    """클라이언트별 속도 제한 + 전체 동시 처리 수 제한"""
+
+    def __init__(self, limits, max_concurrent, reserved=0, priority_paths=(),
+                 max_queue=0, queue_timeout=0.0, max_clients=10000):
+        """
+        Args:
+            limits (dict): 경로 접두사 -> (초당 요청 수, 최대 버스트), 가장 길게 일치하는 접두사 적용
+            max_concurrent (int): 전체 동시 처리 수 상한
+            reserved (int): 우선 경로 전용으로 남겨 두는 슬롯 수
+            priority_paths (tuple): 우선 경로 (정확히 일치)
+            max_queue (int): 슬롯을 기다릴 수 있는 최대 요청 수
+            queue_timeout (float): 슬롯을 기다리는 최대 시간 (초)
+            max_clients (int): 토큰 버킷을 보관할 최대 클라이언트 수 (오래된 것부터 제거)
+        """
+        self.limits = limits
+        self.max_concurrent = max_concurrent
+        self.reserved = reserved
+        self.priority_paths = set(priority_paths)
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.max_clients = max_clients
+        self._buckets = OrderedDict()  # (클라이언트, 접두사) -> [토큰 수, 마지막 갱신 시각]
+        self._bucket_lock = threading.Lock()
+        self._slots = threading.Condition()
+        self._inflight = 0
+        self._queued = 0
+        self._metrics = {
+            'admitted': 0,
+            'admitted_priority': 0,
+            'queued': 0,
+            'rate_limited': 0,
+            'shed': 0,
+            'max_inflight': 0,
+            'max_queue_depth': 0,
+        }
+        self._rate_limited_by_route = {}  # 경로 접두사 -> 429 수
+        self._shed_by_route = {}          # 경로 -> 503 수
+
+    def _limit_for(self, path):
+        matches = [prefix for prefix in self.limits if path.startswith(prefix)]
+        return max(matches, key=len) if matches else None
+
+    def _take_token(self, client, prefix):
+        """
+        클라이언트의 경로 토큰 하나 사용
+        Returns:
+            float: 0 이면 수락, 양수면 다음 토큰까지 남은 시간 (초)
+        """
+        rate, burst = self.limits[prefix]
+        now = time.monotonic()
+        key = (client, prefix)
+        with self._bucket_lock:
+            bucket = self._buckets.pop(key, None) or [float(burst), now]
+            bucket[0] = min(float(burst), bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+            self._buckets[key] = bucket  # 최근 사용 순서 유지
+            if len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+            if bucket[0] >= 1:
+                bucket[0] -= 1
+                return 0.0
+            return (1 - bucket[0]) / rate
+
+    def _count_rate_limited(self, prefix):
+        with self._slots:
+            self._metrics['rate_limited'] += 1
+            self._rate_limited_by_route[prefix] = self._rate_limited_by_route.get(prefix, 0) + 1
+
+    def admit(self, client, path, wait=True):
+        """
+        요청 수락 여부 결정 (수락하면 반드시 release() 호출)
+        Args:
+            client (str): 클라이언트 식별자 (IP)
+            path (str): 요청 경로
+            wait (bool): 슬롯이 없을 때 대기열에서 기다릴지 여부 (이벤트 루프에서는 False)
+        Returns:
+            tuple or None: 수락이면 None, 거절이면 (상태 코드, Retry-After 초)
+        """
+        prefix = self._limit_for(path)
+        if prefix is not None:
+            retry_after = self._take_token(client, prefix)
+            if retry_after:
+                self._count_rate_limited(prefix)
+                return 429, max(1, math.ceil(retry_after))
+
+        priority = path in self.priority_paths
+        limit = self.max_concurrent if priority else self.max_concurrent - self.reserved
+        with self._slots:
+            if self._inflight >= limit and not priority and wait and self._queued < self.max_queue:
+                # 잠시 기다렸다가 슬롯이 나면 처리
+                self._queued += 1
+                self._metrics['queued'] += 1
+                self._metrics['max_queue_depth'] = max(self._metrics['max_queue_depth'], self._queued)
+                deadline = time.monotonic() + self.queue_timeout
+                try:
+                    while self._inflight >= limit:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0 or not self._slots.wait(remaining):
+                            break
+                finally:
+                    self._queued -= 1
+            if self._inflight >= limit:
+                self._metrics['shed'] += 1
+                route = prefix or path
+                self._shed_by_route[route] = self._shed_by_route.get(route, 0) + 1
+                return 503, Config.ADMISSION_RETRY_AFTER
+            self._inflight += 1
+            self._metrics['admitted_priority' if priority else 'admitted'] += 1
+            self._metrics['max_inflight'] = max(self._metrics['max_inflight'], self._inflight)
+        return None
+
+    def release(self):
+        """수락한 요청 처리 완료"""
+        with self._slots:
+            self._inflight -= 1
+            self._slots.notify()
+
+    def get_stats(self):
+        """
+        수락 제어 지표
+        Returns:
+            dict: 수락/대기/거절 수, 현재 동시 처리 수와 대기열 길이,
+                  경로별 속도 제한(429) 수와 과부하 거절(503) 수
+        """
+        with self._slots:
+            stats = dict(self._metrics)
+            stats['inflight'] = self._inflight
+            stats['queue_depth'] = self._queued
+            stats['rate_limited_by_route'] = dict(self._rate_limited_by_route)
+            stats['shed_by_route'] = dict(self._shed_by_route)
+        with self._bucket_lock:
+            stats['tracked_clients'] = len(self._buckets)
+        return stats
+
+
+_controller = None
+_controller_lock = threading.Lock()
+
+
+def get_admission_controller():
+    """프로세스 공용 수락 제어기 반환 (Config 의 ADMISSION_* 설정 사용)"""
+    global _controller
+    if _controller is None:
+        with _controller_lock:
+            if _controller is None:
+                _controller = AdmissionController(
+                    Config.ADMISSION_RATE_LIMITS,
+                    Config.ADMISSION_MAX_CONCURRENT,
+                    reserved=Config.ADMISSION_PRIORITY_RESERVED,
+                    priority_paths=Config.ADMISSION_PRIORITY_PATHS,
+                    max_queue=Config.ADMISSION_MAX_QUEUE,
+                    queue_timeout=Config.ADMISSION_QUEUE_TIMEOUT,
+                    max_clients=Config.ADMISSION_MAX_CLIENTS)
+    return _controller
+
+
+def client_id(remote_addr, forwarded_for=None):
+    """
+    클라이언트 식별자
+    - ADMISSION_TRUST_PROXY 가 켜져 있으면 X-Forwarded-For 의 마지막 주소 사용
+      (앞쪽 주소는 클라이언트가 마음대로 넣을 수 있으므로 신뢰하는 프록시 한 단계가 붙인 값만 사용)
+    """
+    if Config.ADMISSION_TRUST_PROXY and forwarded_for:
+        forwarded = forwarded_for.rsplit(',', 1)[-1].strip()
+        if forwarded:
+            return forwarded
+    return remote_addr or 'unknown'
+
+
+def rejection_body(status):
+    """거절 응답 JSON"""
+    if status == 429:
+        return {'error': 'rate_limited', 'message': '요청이 너무 잦습니다. 잠시 후 다시 시도하세요'}
+    return {'error': 'overloaded', 'message': '서버가 혼잡합니다. 잠시 후 다시 시도하세요'}
+
+
+def init_admission(app):
+    """
+    Flask 앱에 수락 제어 훅 등록
+    Args:
+        app (Flask): 대상 애플리케이션
+    """
+    if not Config.ADMISSION_ENABLED:
+        return
+    controller = get_admission_controller()
+
+    @app.before_request
+    def admit_request():
+        client = client_id(request.remote_addr, request.headers.get('X-Forwarded-For'))
+        rejected = controller.admit(client, request.path)
+        if rejected is not None:
+            status, retry_after = rejected
+            response = jsonify(rejection_body(status))
+            response.status_code = status
+            response.headers['Retry-After'] = str(retry_after)
+            return response
+        g.admitted = True
+
+    @app.teardown_request
+    def release_request(exc):
+        if g.pop('admitted', False):
+            controller.release()
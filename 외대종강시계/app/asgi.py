@@ -0,0 +1,164 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from urllib.parse import parse_qs
+
+from asgiref.wsgi import WsgiToAsgi
+
+from app import create_app
+from app.admission import client_id, get_admission_controller, rejection_body
+from app.compression import compress_body
+from app.encoding import dumps
+from app.models.tenants import get_tenants
+from app.payloads import (build_update_payload, build_notices_payload, build_schedule_payload,
+                          parse_writer_filter, WRITER_FEED_LIMIT)
+from config import Config
+
+"""
+ASGI 비동기 서빙 모드
+- 폴링이 잦은 /update, /notices, /schedule 은 이벤트 루프에서 직접 처리
+- 크롤링 등 블로킹 작업은 크기가 제한된 스레드 풀에서 실행
+- 그 외 경로(/, 정적 파일 등)는 기존 Flask 앱으로 위임
+- 테넌트는 Flask 와 같이 경로 접두사(/seoul/update) 또는 Host 로 결정
+- 실행 예: uvicorn app.asgi:application --workers 2
+"""
+
+
+class AsyncHUFSApp:
+    """
+    HUFS 종강시계 ASGI 애플리케이션
+    - 대기 중인 연결은 스레드를 점유하지 않음
+    - 같은 작업이 동시에 요청되면 한 번만 실행하고 결과를 공유
+    """
+
+    def __init__(self, wsgi_app, max_workers=Config.ASYNC_CRAWL_WORKERS):
+        """
+        Args:
+            wsgi_app (Flask): 위임할 WSGI 애플리케이션
+            max_workers (int): 블로킹 작업용 스레드 수
+        """
+        self.fallback = WsgiToAsgi(wsgi_app)
+        self.tenants = get_tenants()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers,
+                                           thread_name_prefix='hufs-crawl')
+        self.routes = {
+            '/update': self.update_time,
+            '/notices': self.get_notices,
+            '/schedule': self.get_schedule,
+        }
+        self._inflight = {}
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+
+        handler = None
+        if scope['type'] == 'http' and scope['method'] in ('GET', 'HEAD'):
+            request_headers = dict(scope['headers'])
+            tenant, prefix = self.tenants.resolve(request_headers.get(b'host', b'').decode('latin-1'),
+                                                  scope['path'])
+            path = scope['path'][len(prefix):]
+            handler = self.routes.get(path)
+        if handler is None:
+            await self.fallback(scope, receive, send)
+            return
+
+        # 수락 제어 (이벤트 루프를 막지 않도록 대기열 없이 바로 판단)
+        headers = [(b'content-type', b'application/json'), (b'vary', b'Accept-Encoding')]
+        admitted = not Config.ADMISSION_ENABLED
+        if not admitted:
+            client = client_id((scope.get('client') or ('unknown',))[0],
+                               request_headers.get(b'x-forwarded-for', b'').decode('latin-1'))
+            rejected = get_admission_controller().admit(client, path, wait=False)
+            if rejected is not None:
+                status, retry_after = rejected
+                headers.append((b'retry-after', str(retry_after).encode()))
+                await self._send_json(send, scope, status, dumps(rejection_body(status)), headers)
+                return
+        try:
+            query = parse_qs(scope.get('query_string', b'').decode('latin-1'))
+            status, payload = await handler(query, tenant)
+        finally:
+            if not admitted:
+                get_admission_controller().release()
+        body = dumps(payload)
+        if status == 200:
+            accept_encoding = request_headers.get(b'accept-encoding', b'').decode('latin-1')
+            body, encoding = compress_body(body, accept_encoding)
+            if encoding is not None:
+                headers.append((b'content-encoding', encoding.encode()))
+        await self._send_json(send, scope, status, body, headers)
+
+    async def _send_json(self, send, scope, status, body, headers):
+        headers.append((b'content-length', str(len(body)).encode()))
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': headers,
+        })
+        await send({
+            'type': 'http.response.body',
+            'body': b'' if scope['method'] == 'HEAD' else body,
+        })
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self.executor.shutdown(wait=False)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def run_blocking(self, key, func):
+        """
+        블로킹 함수를 스레드 풀에서 실행
+        - 같은 key 의 작업이 진행 중이면 새로 실행하지 않고 그 결과를 기다림
+        Args:
+            key (str): 작업 식별자
+            func (callable): 실행할 함수
+        Returns:
+            object: func() 반환값
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = asyncio.ensure_future(loop.run_in_executor(self.executor, func))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def update_time(self, query, tenant):
+        """실시간 시간 정보 업데이트 API (/update 와 동일한 JSON)"""
+        return 200, await self.run_blocking(f"{tenant.id}:update", partial(build_update_payload, tenant))
+
+    async def get_notices(self, query, tenant):
+        """공지사항 새로고침 API (/notices 와 동일한 JSON)"""
+        try:
+            compact = query.get('format', [''])[0] == 'compact'
+            writers = parse_writer_filter(query.get('writer', []))
+            try:
+                limit = int(query.get('limit', [WRITER_FEED_LIMIT])[0])
+            except ValueError:
+                limit = WRITER_FEED_LIMIT  # Flask 의 type=int 처럼 잘못된 값은 기본값
+            key = f"{tenant.id}:notices:{compact}:{','.join(sorted(writers))}:{limit}"
+            return 200, await self.run_blocking(key, partial(build_notices_payload, compact=compact,
+                                                             writers=writers, limit=limit, tenant=tenant))
+        except Exception as e:
+            print(f"공지사항 업데이트 실패: {str(e)}") # 디버깅용 로그
+            return 500, {
+                'error': str(e),
+                'message': '공지사항 업데이트 실패'
+            }
+
+    async def get_schedule(self, query, tenant):
+        """학사 일정 정보 제공 API (/schedule 과 동일한 JSON)"""
+        try:
+            return 200, await self.run_blocking(f"{tenant.id}:schedule", partial(build_schedule_payload, tenant))
+        except Exception as e:
+            return 500, {'error': str(e)}
+
+
+application = AsyncHUFSApp(create_app())
@@ -0,0 +1,43 @@
+import os
+import sys
+
+from config import Config
+
+"""
+빌드 단계 정적 파일 검사
+- 앱 import 시 매번 하던 CSS 파일 존재 확인을 배포 전 한 번만 실행
+    python -m app.build
+"""
+
+CSS_FILES = [
+    'css/main.css',
+    'css/components/current-time.css',
+    'css/components/meal.css',
+    'css/components/notice-board.css',
+    'css/components/timer.css',
+    'css/themes/layout.css',
+    'css/themes/themes.css',
+    'css/themes/transitions.css',
+    'css/responsive.css'
+]
+
+
+def check_assets(static_folder=Config.STATIC_FOLDER):
+    """
+    CSS 파일 존재 여부 확인
+    Returns:
+        list: 없는 파일 목록
+    """
+    print("\nChecking CSS files:")
+    missing = []
+    for css_file in CSS_FILES:
+        file_path = os.path.join(static_folder, css_file)
+        exists = os.path.exists(file_path)
+        print(f"{css_file}: {'EXISTS' if exists else 'MISSING'}")
+        if not exists:
+            missing.append(css_file)
+    return missing
+
+
+if __name__ == "__main__":
+    sys.exit(1 if check_assets() else 0)
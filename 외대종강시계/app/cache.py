@@ -0,0 +1,477 @@
+import hashlib
+import os
+import pickle
+import socket
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import partial, wraps
+
+from app.models.timesource import uses_system_time
+from config import Config
+
+"""
+공용 캐시 계층
+- Config.CACHE_TYPE 으로 백엔드 선택 (memory / filesystem / sqlite / redis)
+- 모든 백엔드가 같은 TTL 규칙을 따름
+    timeout=None: Config.CACHE_DEFAULT_TIMEOUT 적용
+    timeout=0: 만료 없음
+- 히트/미스/저장/퇴출 통계 제공
+"""
+
+
+class BaseCache:
+    """
+    캐시 백엔드 공통 부분
+    - 만료 시각 계산과 통계 집계를 담당
+    - 실제 저장은 하위 클래스의 _get/_set/_delete/_clear 가 처리
+    """
+
+    def __init__(self, default_timeout=300):
+        """
+        Args:
+            default_timeout (int): 기본 TTL (초)
+        """
+        self.default_timeout = default_timeout
+        self._stats_lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'sets': 0, 'deletes': 0, 'evictions': 0}
+
+    def _expires_at(self, timeout):
+        """
+        TTL 을 절대 만료 시각으로 변환
+        Returns:
+            float: 만료 시각 (0 이면 만료 없음)
+        """
+        if timeout is None:
+            timeout = self.default_timeout
+        return time.time() + timeout if timeout != 0 else 0
+
+    @staticmethod
+    def _is_expired(expires_at):
+        return expires_at != 0 and expires_at <= time.time()
+
+    def _count(self, name, amount=1):
+        with self._stats_lock:
+            self._stats[name] += amount
+
+    def get(self, key, default=None):
+        """
+        캐시 값 조회
+        Returns:
+            object: 저장된 값 또는 없거나 만료된 경우 default
+        """
+        found, value = self._get(key)
+        self._count('hits' if found else 'misses')
+        return value if found else default
+
+    def has(self, key):
+        """통계에 영향을 주지 않고 키 존재 여부 확인"""
+        found, _ = self._get(key)
+        return found
+
+    def set(self, key, value, timeout=None):
+        """
+        캐시 값 저장
+        Args:
+            key (str): 캐시 키
+            value (object): pickle 가능한 값
+            timeout (int): TTL (초), None 이면 기본값, 0 이면 만료 없음
+        """
+        self._set(key, value, self._expires_at(timeout))
+        self._count('sets')
+
+    def delete(self, key):
+        self._delete(key)
+        self._count('deletes')
+
+    def clear(self):
+        self._clear()
+
+    def get_or_set(self, key, factory, timeout=None):
+        """
+        캐시 값이 없으면 factory() 결과를 저장 후 반환
+        """
+        found, value = self._get(key)
+        self._count('hits' if found else 'misses')
+        if found:
+            return value
+        value = factory()
+        self.set(key, value, timeout)
+        return value
+
+    def get_stats(self):
+        """
+        캐시 통계 반환
+        Returns:
+            dict: 백엔드 이름, 히트/미스 횟수, 히트율 등
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 4) if lookups else 0.0
+        stats['backend'] = type(self).__name__
+        return stats
+
+    def _get(self, key):
+        raise NotImplementedError
+
+    def _set(self, key, value, expires_at):
+        raise NotImplementedError
+
+    def _delete(self, key):
+        raise NotImplementedError
+
+    def _clear(self):
+        raise NotImplementedError
+
+
+class MemoryCache(BaseCache):
+    """
+    프로세스 내 LRU 캐시
+    - threshold 개수를 넘으면 가장 오래 쓰지 않은 항목부터 퇴출
+    """
+
+    def __init__(self, default_timeout=300, threshold=500):
+        super().__init__(default_timeout)
+        self.threshold = threshold
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if self._is_expired(expires_at):
+                del self._data[key]
+                return False, None
+            self._data.move_to_end(key)
+            return True, value
+
+    def _set(self, key, value, expires_at):
+        evicted = 0
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.threshold:
+                self._data.popitem(last=False)
+                evicted += 1
+        if evicted:
+            self._count('evictions', evicted)
+
+    def _delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def _clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class FileSystemCache(BaseCache):
+    """
+    디렉터리 기반 캐시
+    - 키 하나당 파일 하나 (만료 시각 + pickle 데이터), 파일 이름은 키의 해시라 키끼리 겹치지 않음
+    - 임시 파일에 쓴 뒤 교체하여 여러 워커가 동시에 써도 안전
+    """
+
+    def __init__(self, cache_dir, default_timeout=300):
+        super().__init__(default_timeout)
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key):
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.cache")
+
+    def _get(self, key):
+        try:
+            with open(self._path(key), 'rb') as f:
+                expires_at, value = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError, ValueError):
+            return False, None
+        if self._is_expired(expires_at):
+            self._delete(key)
+            return False, None
+        return True, value
+
+    def _set(self, key, value, expires_at):
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((expires_at, value), f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    def _delete(self, key):
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def _clear(self):
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.cache'):
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                except FileNotFoundError:
+                    pass
+
+
+class SQLiteCache(BaseCache):
+    """
+    SQLite 파일 기반 캐시
+    - 스레드마다 별도 연결 사용
+    - WAL 모드로 여러 프로세스의 동시 읽기 허용
+    """
+
+    def __init__(self, path, default_timeout=300):
+        super().__init__(default_timeout)
+        self.path = path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._conn().execute(
+            'CREATE TABLE IF NOT EXISTS cache '
+            '(key TEXT PRIMARY KEY, expires_at REAL NOT NULL, value BLOB NOT NULL)'
+        )
+
+    def _conn(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():  # fork 된 워커는 새로 연결
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _get(self, key):
+        row = self._conn().execute(
+            'SELECT expires_at, value FROM cache WHERE key = ?', (key,)
+        ).fetchone()
+        if row is None:
+            return False, None
+        expires_at, blob = row
+        if self._is_expired(expires_at):
+            self._delete(key)
+            return False, None
+        return True, pickle.loads(blob)
+
+    def _set(self, key, value, expires_at):
+        blob = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        self._conn().execute(
+            'INSERT OR REPLACE INTO cache (key, expires_at, value) VALUES (?, ?, ?)',
+            (key, expires_at, blob)
+        )
+
+    def _delete(self, key):
+        self._conn().execute('DELETE FROM cache WHERE key = ?', (key,))
+
+    def _clear(self):
+        self._conn().execute('DELETE FROM cache')
+
+
+class RedisCache(BaseCache):
+    """
+    Redis 프로토콜(RESP) 캐시
+    - 외부 패키지 없이 소켓으로 GET/SET/DEL 명령만 사용
+    - RESP 를 말하는 로컬 대체 서버(예: 테스트용 스텁)에도 연결 가능
+    - TTL 은 서버의 PX 만료로 위임
+    """
+
+    def __init__(self, host='localhost', port=6379, db=0, key_prefix='hufs:',
+                 default_timeout=300, socket_timeout=2.0):
+        super().__init__(default_timeout)
+        self.host = host
+        self.port = port
+        self.db = db
+        self.key_prefix = key_prefix
+        self.socket_timeout = socket_timeout
+        self._local = threading.local()
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():  # fork 된 워커는 새로 연결
+            sock = socket.create_connection((self.host, self.port), self.socket_timeout)
+            conn = (sock, sock.makefile('rb'))
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+            if self.db:
+                self._command('SELECT', str(self.db))
+        return conn
+
+    def _reset(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn[1].close()
+            conn[0].close()
+            self._local.conn = None
+
+    @staticmethod
+    def _encode(*args):
+        parts = [f"*{len(args)}\r\n".encode()]
+        for arg in args:
+            if isinstance(arg, str):
+                arg = arg.encode('utf-8')
+            parts.append(b'$%d\r\n%s\r\n' % (len(arg), arg))
+        return b''.join(parts)
+
+    def _read_reply(self, reader):
+        line = reader.readline()
+        if not line:
+            raise ConnectionError("Redis 연결이 끊어졌습니다.")
+        prefix, payload = line[:1], line[1:-2]
+        if prefix == b'+':
+            return payload.decode()
+        if prefix == b'-':
+            raise RuntimeError(payload.decode())
+        if prefix == b':':
+            return int(payload)
+        if prefix == b'$':
+            length = int(payload)
+            if length < 0:
+                return None
+            data = reader.read(length + 2)
+            return data[:-2]
+        if prefix == b'*':
+            length = int(payload)
+            return None if length < 0 else [self._read_reply(reader) for _ in range(length)]
+        raise RuntimeError(f"알 수 없는 RESP 응답: {line!r}")
+
+    def _command(self, *args):
+        sock, reader = self._connection()
+        try:
+            sock.sendall(self._encode(*args))
+            return self._read_reply(reader)
+        except (OSError, ConnectionError):
+            self._reset()
+            raise
+
+    def _get(self, key):
+        try:
+            blob = self._command('GET', self.key_prefix + key)
+        except (OSError, ConnectionError) as e:
+            print(f"Redis 캐시 조회 실패: {e}")
+            return False, None
+        if blob is None:
+            return False, None
+        return True, pickle.loads(blob)
+
+    def _set(self, key, value, expires_at):
+        blob = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        args = ['SET', self.key_prefix + key, blob]
+        if expires_at:
+            args += ['PX', str(max(1, int((expires_at - time.time()) * 1000)))]
+        try:
+            self._command(*args)
+        except (OSError, ConnectionError) as e:
+            print(f"Redis 캐시 저장 실패: {e}")
+
+    def _delete(self, key):
+        try:
+            self._command('DEL', self.key_prefix + key)
+        except (OSError, ConnectionError) as e:
+            print(f"Redis 캐시 삭제 실패: {e}")
+
+    def _clear(self):
+        try:
+            keys = self._command('KEYS', self.key_prefix + '*') or []
+            if keys:
+                self._command('DEL', *keys)
+        except (OSError, ConnectionError) as e:
+            print(f"Redis 캐시 비우기 실패: {e}")
+
+
+def create_cache(config=Config, partition=None):
+    """
+    설정에 맞는 캐시 백엔드 생성
+    Args:
+        config: CACHE_* 속성을 가진 설정 객체
+        partition (str): 테넌트별 캐시 분할 이름 (None 이면 공용 캐시)
+            memory 는 CACHE_PARTITION_THRESHOLD 개로 제한된 별도 캐시, filesystem 은 하위 디렉터리,
+            sqlite 는 별도 파일, redis 는 키 접두사로 분리
+    Returns:
+        BaseCache: 선택된 캐시 백엔드
+    """
+    cache_type = config.CACHE_TYPE
+    timeout = config.CACHE_DEFAULT_TIMEOUT
+    cache_dir = config.CACHE_DIR
+    if not os.path.isabs(cache_dir):
+        cache_dir = os.path.join(config.BASE_DIR, cache_dir)
+
+    if cache_type in ('memory', 'simple'):
+        threshold = config.CACHE_THRESHOLD if partition is None else config.CACHE_PARTITION_THRESHOLD
+        return MemoryCache(timeout, threshold=threshold)
+    if cache_type == 'filesystem':
+        return FileSystemCache(cache_dir if partition is None else os.path.join(cache_dir, 'tenants', partition),
+                               timeout)
+    if cache_type == 'sqlite':
+        name = 'cache.sqlite3' if partition is None else f'cache-{partition}.sqlite3'
+        return SQLiteCache(os.path.join(cache_dir, name), timeout)
+    if cache_type == 'redis':
+        key_prefix = config.CACHE_KEY_PREFIX if partition is None else f"{config.CACHE_KEY_PREFIX}{partition}:"
+        return RedisCache(config.CACHE_REDIS_HOST, config.CACHE_REDIS_PORT,
+                          config.CACHE_REDIS_DB, key_prefix, timeout)
+    raise ValueError(f"지원하지 않는 CACHE_TYPE: {cache_type}")
+
+
+_cache = None
+_partitions = {}
+_cache_lock = threading.Lock()
+
+
+def get_cache(partition=None):
+    """
+    프로세스 공용 캐시 인스턴스 반환 (최초 호출 시 생성)
+    Args:
+        partition (str): 테넌트별 캐시 분할 이름 (Tenant.partition, 기본 테넌트는 None)
+    """
+    global _cache
+    if partition is None:
+        if _cache is None:
+            with _cache_lock:
+                if _cache is None:
+                    _cache = create_cache()
+        return _cache
+    cache = _partitions.get(partition)
+    if cache is None:
+        with _cache_lock:
+            cache = _partitions.get(partition)
+            if cache is None:
+                cache = _partitions[partition] = create_cache(partition=partition)
+    return cache
+
+
+def get_partition_stats():
+    """
+    테넌트별 캐시 분할의 히트/미스 통계
+    Returns:
+        dict: 분할 이름 -> get_stats()
+    """
+    return {partition: cache.get_stats() for partition, cache in list(_partitions.items())}
+
+
+def cached(key, timeout=None, time_dependent=False):
+    """
+    함수 반환값을 공용 캐시에 저장하는 데코레이터
+    - 렌더링된 응답 등 인자 없는 값 생성 함수에 사용
+    - 함수가 tenant 인자를 받으면 그 테넌트의 캐시 분할에 저장
+    Args:
+        key (str): 캐시 키
+        timeout (int): TTL (초)
+        time_dependent (bool): 결과가 현재 시각에 따라 달라지는 함수면 True
+            (시스템 시각이 아닌 시각 공급자가 설치된 동안에는 캐시를 거치지 않고 매번 계산)
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(tenant=None):
+            if time_dependent and not uses_system_time():
+                return func() if tenant is None else func(tenant)
+            if tenant is None:
+                return get_cache().get_or_set(key, func, timeout)
+            return get_cache(tenant.partition).get_or_set(key, partial(func, tenant), timeout)
+        return wrapper
+    return decorator
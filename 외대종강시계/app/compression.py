@@ -0,0 +1,131 @@
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+
+from flask import request
+
+from config import Config
+
+try:
+    import brotli
+except ImportError:  # brotli 가 없으면 gzip 만 사용
+    brotli = None
+
+"""
+응답 압축 미들웨어
+- Accept-Encoding 에 따라 br(brotli) 또는 gzip 선택
+- 같은 본문은 한 번만 압축하도록 압축 결과를 LRU 로 보관
+  (크롤링 시에만 바뀌는 공지사항/학사일정 응답이 대상)
+"""
+
+
+class CompressedBodyCache:
+    """
+    압축된 본문 LRU 캐시
+    - 키: (본문 해시, 인코딩)
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compress(self, body, encoding):
+        key = (hashlib.blake2b(body, digest_size=16).digest(), encoding)
+        with self._lock:
+            compressed = self._data.get(key)
+            if compressed is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return compressed
+            self.misses += 1
+
+        compressed = _compress(body, encoding)
+        with self._lock:
+            self._data[key] = compressed
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return compressed
+
+    def get_stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._data)}
+
+
+def _compress(body, encoding):
+    if encoding == 'br':
+        return brotli.compress(body, quality=Config.COMPRESS_BR_LEVEL)
+    return gzip.compress(body, compresslevel=Config.COMPRESS_LEVEL, mtime=0)
+
+
+def choose_encoding(accept_encoding):
+    """
+    Accept-Encoding 헤더에서 사용할 인코딩 선택
+    Args:
+        accept_encoding (str): 요청 헤더 값
+    Returns:
+        str or None: 'br', 'gzip' 또는 압축하지 않을 경우 None
+    """
+    accepted = {}
+    for part in (accept_encoding or '').split(','):
+        name, _, params = part.strip().partition(';')
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name.lower()] = quality
+
+    if brotli is not None and accepted.get('br', 0) > 0:
+        return 'br'
+    if accepted.get('gzip', accepted.get('*', 0)) > 0:
+        return 'gzip'
+    return None
+
+
+body_cache = CompressedBodyCache(Config.COMPRESS_CACHE_SIZE)
+
+
+def compress_body(body, accept_encoding):
+    """
+    본문을 협상된 인코딩으로 압축
+    Args:
+        body (bytes): 원본 응답 본문
+        accept_encoding (str): 요청의 Accept-Encoding 헤더 값
+    Returns:
+        tuple: (본문, 인코딩 또는 None)
+    """
+    if len(body) < Config.COMPRESS_MIN_SIZE:
+        return body, None
+    encoding = choose_encoding(accept_encoding)
+    if encoding is None:
+        return body, None
+    return body_cache.get_or_compress(body, encoding), encoding
+
+
+def init_compression(app):
+    """
+    Flask 앱에 응답 압축 after_request 훅 등록
+    Args:
+        app (Flask): 대상 애플리케이션
+    """
+    @app.after_request
+    def compress_response(response):
+        if (response.direct_passthrough
+                or response.is_streamed
+                or response.status_code != 200
+                or 'Content-Encoding' in response.headers
+                or response.mimetype not in Config.COMPRESS_MIMETYPES):
+            return response
+
+        response.vary.add('Accept-Encoding')
+        body, encoding = compress_body(response.get_data(), request.headers.get('Accept-Encoding'))
+        if encoding is not None:
+            response.set_data(body)
+            response.headers['Content-Encoding'] = encoding
+        return response
@@ -0,0 +1,46 @@
+import json
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # orjson 이 없으면 표준 json 사용
+    orjson = None
+
+"""
+빠른 JSON 직렬화
+- orjson 이 설치되어 있으면 사용하고, 없으면 표준 json 으로 대체
+- 한글을 \\uXXXX 로 이스케이프하지 않아 응답 크기가 절반 이하로 줄어듦
+- 공백 없는 compact 출력, 키 정렬 유지
+"""
+
+
+def _default(obj):
+    return DefaultJSONProvider.default(obj)
+
+
+def dumps(obj):
+    """
+    객체를 UTF-8 JSON 바이트로 직렬화
+    Args:
+        obj: 직렬화할 객체
+    Returns:
+        bytes: JSON 본문
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default,
+                            option=orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME)
+    return json.dumps(obj, default=_default, ensure_ascii=False, sort_keys=True,
+                      separators=(',', ':')).encode('utf-8')
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    jsonify 가 dumps() 를 사용하도록 하는 Flask JSON 제공자
+    - 디버그 모드에서도 들여쓰기 없이 compact 출력
+    """
+    ensure_ascii = False
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps(obj), mimetype=self.mimetype)
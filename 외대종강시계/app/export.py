@@ -0,0 +1,51 @@
+import csv
+import io
+
+from app.encoding import dumps
+from app.models.notice_store import EXPORT_COLUMNS
+
+"""
+공지사항 저장소 내보내기 (NDJSON / CSV 스트리밍)
+- 저장소에서 일정 개수씩 읽어 바로 직렬화하므로 전체 이력 크기와 무관하게 메모리 사용량 일정
+- 배치마다 한 덩어리를 내보내 WSGI 서버가 클라이언트가 받는 속도에 맞춰 다음 배치를 요청
+"""
+
+
+def iter_ndjson(batches):
+    """
+    행 배치를 NDJSON 덩어리로 변환 (한 줄에 공지사항 하나)
+    Args:
+        batches (iterable): EXPORT_COLUMNS 순서의 튜플 목록들
+    Yields:
+        bytes: 배치 하나 분량의 NDJSON
+    """
+    for rows in batches:
+        yield b''.join(dumps(dict(zip(EXPORT_COLUMNS, row))) + b'\n' for row in rows)
+
+
+def iter_csv(batches):
+    """
+    행 배치를 CSV 덩어리로 변환 (첫 덩어리에 BOM 과 헤더 포함, 엑셀에서 한글이 깨지지 않음)
+    Args:
+        batches (iterable): EXPORT_COLUMNS 순서의 튜플 목록들
+    Yields:
+        bytes: 배치 하나 분량의 CSV
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write('\ufeff')
+    writer.writerow(EXPORT_COLUMNS)
+    for rows in batches:
+        writer.writerows(rows)
+        yield buffer.getvalue().encode('utf-8')
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():  # 내보낼 행이 없으면 헤더만
+        yield buffer.getvalue().encode('utf-8')
+
+
+# 형식 이름: (MIME 타입, 파일 확장자, 변환 함수)
+EXPORT_FORMATS = {
+    'ndjson': ('application/x-ndjson', 'ndjson', iter_ndjson),
+    'csv': ('text/csv', 'csv', iter_csv),
+}
@@ -1,2 +1,24 @@
-from .clock import HUFSClock
-from .crawler.notice import HUFSNoticeCrawler
\ No newline at end of file
+import importlib
+
+"""
+모델 패키지
+- 크롤러(requests, bs4 사용)는 처음 접근할 때 import 하여 앱 시작을 가볍게 유지
+"""
+
+_EXPORTS = {
+    'HUFSClock': '.clock',
+    'HUFSNoticeCrawler': '.crawler.notice',
+    'get_notice_store': '.notice_store',
+    'get_tenant': '.tenants',
+    'get_tenants': '.tenants',
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    if name == 'crawler':
+        return importlib.import_module('.crawler', __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
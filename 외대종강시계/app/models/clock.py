@@ -5,9 +5,11 @@ import os
 # 상대 import 시도, 실패 시 절대 import
 try:
     from .crawler.schedule import HUFSScheduleCrawler
+    from .timesource import get_time_source
 except ImportError:
     sys.path.append(os.path.dirname(os.path.dirname(__file__)))
     from crawler.schedule import HUFSScheduleCrawler
+    from timesource import get_time_source
 
 class HUFSClock:
     """
@@ -15,18 +17,27 @@ class HUFSClock:
     - 학기와 방학 기간을 자동으로 판단
     - 종강/개강까지 남은 시간을 계산
     - 크롤링된 학사일정을 기반으로 동작
+    - 현재 시각은 주입 가능한 시각 공급자(time_source)에서 읽음
     """
 
-    def __init__(self):
+    def __init__(self, time_source=None, schedule_dates=None, tenant=None):
         """
         타이머 초기화
         - 학사일정 크롤러를 통해 날짜 정보 로드
         - 학기 시작/종료일을 datetime 객체로 변환
         - 현재 학기 상태 초기화
+        Args:
+            time_source: now() 를 제공하는 시각 공급자 (기본값: get_time_source())
+            schedule_dates (dict): 학사일정 (지정하면 크롤러를 사용하지 않음)
+            tenant (Tenant): 학사일정을 읽을 테넌트 (기본값: 기본 테넌트)
         """
+        self.time_source = time_source or get_time_source()
+
         # 크롤러를 통해 학사일정 로드
-        crawler = HUFSScheduleCrawler()
-        schedule_dates = crawler.get_schedule()
+        if schedule_dates is None:
+            crawler = HUFSScheduleCrawler(tenant)
+            schedule_dates = crawler.get_schedule()
+        self.schedule_dates = schedule_dates
         
         # 각 학기 시작/종료일 설정
         self.first_semester_start = self._parse_date(schedule_dates['first_start'])   # 1학기 시작일
@@ -35,18 +46,19 @@ class HUFSClock:
         self.second_semester_end = self._parse_date(schedule_dates['second_end'])     # 2학기 종료일
         
         # 초기 상태 설정
-        self.is_semester = True  # 학기 중 여부
         self.current_semester = self._determine_current_semester()  # 현재 학기 판단
+        self.is_semester = (self.current_semester != 0)  # 학기 중 여부
     
-    def _parse_date(self, date_str):
+    def _parse_date(self, date_str, year=None):
         """
         날짜 문자열을 datetime 객체로 변환
         Args:
             date_str (str): "MM.DD" 형식의 날짜 문자열
+            year (int): 연도 (기본값: 현재 연도)
         Returns:
-            datetime: 현재 연도의 해당 날짜 객체
+            datetime: 해당 연도의 날짜 객체
         """
-        current_year = datetime.now().year
+        current_year = year or self.time_source.now().year
         month, day = map(int, date_str.split('.'))
         return datetime(current_year, month, day)
     
@@ -56,7 +68,7 @@ class HUFSClock:
         Returns:
             int: 1(1학기), 2(2학기), 0(방학)
         """
-        current = datetime.now()
+        current = self.time_source.now()
         # 각 학기 기간과 현재 날짜 비교
         if self.first_semester_start <= current <= self.first_semester_end:
             return 1
@@ -73,24 +85,37 @@ class HUFSClock:
         self.current_semester = self._determine_current_semester()
         self.is_semester = (self.current_semester != 0)  # 0이 아니면 학기 중
     
+    def get_target_date(self, current=None):
+        """
+        현재 상태의 목표 날짜 (학기 중이면 종강일, 방학 중이면 다음 개강일)
+        Args:
+            current (datetime): 기준 시각 (기본값: 시각 공급자의 현재 시각)
+        Returns:
+            datetime: 목표 날짜
+        """
+        current = current or self.time_source.now()
+        
+        if self.current_semester == 1:  # 1학기
+            return self.first_semester_end
+        if self.current_semester == 2:  # 2학기
+            return self.second_semester_end
+        # 방학 중
+        if current > self.second_semester_end:  # 겨울방학 (종강 후 연말) -> 내년 1학기 개강
+            return self._parse_date(self.schedule_dates['first_start'], current.year + 1)
+        if current < self.first_semester_start:  # 겨울방학 (연초)
+            return self.first_semester_start
+        return self.second_semester_start  # 여름방학
+    
     def get_remaining_time(self):
         """
         다음 이벤트(종강/개강)까지 남은 시간 계산
         Returns:
             tuple: (남은 일수, 시간, 분, 초, 기간 타입)
         """
-        current = datetime.now()
+        current = self.time_source.now()
         
         # 현재 상태에 따른 목표 날짜 설정
-        if self.current_semester == 1:  # 1학기
-            target_date = self.first_semester_end
-        elif self.current_semester == 2:  # 2학기
-            target_date = self.second_semester_end
-        else:  # 방학 중
-            if current > self.second_semester_end:  # 겨울방학
-                target_date = self.first_semester_start
-            else:  # 여름방학
-                target_date = self.second_semester_start
+        target_date = self.get_target_date(current)
         
         # 남은 시간 계산
         remaining = target_date - current
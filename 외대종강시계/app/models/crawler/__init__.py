@@ -1,4 +1,18 @@
-# 크롤러 모듈 초기화
+# 크롤러 모듈 초기화 (각 크롤러는 처음 접근할 때 import)
 
-from .notice import HUFSNoticeCrawler
-from .schedule import HUFSScheduleCrawler
\ No newline at end of file
+import importlib
+
+_EXPORTS = {
+    'HUFSNoticeCrawler': '.notice',
+    'HUFSScheduleCrawler': '.schedule',
+    'HUFSNoticeDetailCrawler': '.detail',
+    'HUFSMealCrawler': '.meal',
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
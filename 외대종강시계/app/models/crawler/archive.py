@@ -0,0 +1,145 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import zlib
+from datetime import datetime
+
+from config import Config
+
+"""
+원본 HTML 스냅샷 보관소
+- 가져온 페이지를 내용 해시(sha256)로 이름 붙여 zlib 압축 저장
+- 내용이 같으면 파일을 다시 쓰지 않음 (바뀌지 않은 페이지는 색인 한 줄만 추가)
+- 색인(SQLite)으로 URL, 수집 시각별 조회
+- 추출 로직을 고친 뒤 보관된 HTML 로 공지사항 저장소를 다시 만들 수 있음
+    python -m app.models.crawler.archive_cli stats
+    python -m app.models.crawler.archive_cli rebuild --workers 4
+"""
+
+
+class SnapshotArchive:
+    """
+    내용 주소 기반 스냅샷 보관소
+    - objects/ab/cdef... : 압축된 원본
+    - index.sqlite3      : (url, fetched_at, sha256, 원본 크기)
+    """
+
+    def __init__(self, root):
+        """
+        Args:
+            root (str): 보관소 디렉터리
+        """
+        self.root = root
+        self.objects_dir = os.path.join(root, 'objects')
+        self._local = threading.local()
+        os.makedirs(self.objects_dir, exist_ok=True)
+        self._conn().execute(
+            'CREATE TABLE IF NOT EXISTS snapshots ('
+            'id INTEGER PRIMARY KEY AUTOINCREMENT, '
+            'url TEXT NOT NULL, '
+            'fetched_at TEXT NOT NULL, '
+            'sha256 TEXT NOT NULL, '
+            'size INTEGER NOT NULL)'
+        )
+        self._conn().execute('CREATE INDEX IF NOT EXISTS idx_snapshots_url ON snapshots (url, fetched_at)')
+
+    def _conn(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():  # fork 된 워커는 새로 연결
+            conn = sqlite3.connect(os.path.join(self.root, 'index.sqlite3'), timeout=10)
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _object_path(self, digest):
+        return os.path.join(self.objects_dir, digest[:2], digest[2:])
+
+    def store(self, url, content, fetched_at=None):
+        """
+        페이지 원본 저장
+        Args:
+            url (str): 가져온 URL
+            content (bytes): 응답 원본
+            fetched_at (str): 수집 시각 (ISO, 기본값 현재 시각)
+        Returns:
+            str: 내용 해시
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(zlib.compress(content, 6))
+            os.replace(tmp_path, path)
+
+        fetched_at = fetched_at or datetime.now().isoformat(timespec='seconds')
+        with self._conn() as conn:
+            conn.execute('INSERT INTO snapshots (url, fetched_at, sha256, size) VALUES (?, ?, ?, ?)',
+                         (url, fetched_at, digest, len(content)))
+        return digest
+
+    def load(self, digest):
+        """
+        해시로 원본 조회
+        Returns:
+            bytes: 압축 해제된 원본
+        """
+        with open(self._object_path(digest), 'rb') as f:
+            return zlib.decompress(f.read())
+
+    def iter_snapshots(self, url=None):
+        """
+        스냅샷 목록을 수집 시각 순으로 반환
+        Args:
+            url (str): 지정하면 해당 URL 만
+        Yields:
+            tuple: (url, fetched_at, sha256)
+        """
+        query = 'SELECT url, fetched_at, sha256 FROM snapshots'
+        params = ()
+        if url:
+            query += ' WHERE url = ?'
+            params = (url,)
+        yield from self._conn().execute(query + ' ORDER BY fetched_at, id', params)
+
+    def get_stats(self):
+        """
+        디스크 사용량 통계
+        Returns:
+            dict: 스냅샷 수, 고유 원본 수, 원본 총 크기, 실제 디스크 사용량, 절감률
+        """
+        conn = self._conn()
+        snapshots, raw_bytes = conn.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM snapshots').fetchone()
+        unique = conn.execute('SELECT COUNT(DISTINCT sha256) FROM snapshots').fetchone()[0]
+        stored_bytes = 0
+        for dir_path, _, file_names in os.walk(self.objects_dir):
+            stored_bytes += sum(os.path.getsize(os.path.join(dir_path, name)) for name in file_names)
+        index_bytes = os.path.getsize(os.path.join(self.root, 'index.sqlite3'))
+        return {
+            'snapshots': snapshots,
+            'unique_blobs': unique,
+            'raw_bytes': raw_bytes,
+            'stored_bytes': stored_bytes,
+            'index_bytes': index_bytes,
+            'saving_ratio': round(1 - stored_bytes / raw_bytes, 4) if raw_bytes else 0.0
+        }
+
+
+_archive = None
+_archive_lock = threading.Lock()
+
+
+def get_archive():
+    """프로세스 공용 스냅샷 보관소 반환"""
+    global _archive
+    if _archive is None:
+        with _archive_lock:
+            if _archive is None:
+                root = Config.ARCHIVE_DIR
+                if not os.path.isabs(root):
+                    root = os.path.join(Config.BASE_DIR, root)
+                _archive = SnapshotArchive(root)
+    return _archive
@@ -0,0 +1,107 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .archive import SnapshotArchive, get_archive
+
+"""
+스냅샷 보관소 명령행 도구
+- stats: 디스크 사용량 출력
+- rebuild: 보관된 공지사항 목록 페이지를 현재 추출 로직으로 다시 처리
+    python -m app.models.crawler.archive_cli rebuild --workers 4
+"""
+
+
+def _extract_snapshot(args):
+    """
+    (작업 프로세스) 스냅샷 하나에서 공지사항 추출
+    Returns:
+        tuple: (수집 시각, 공지사항 레코드 목록)
+    """
+    root, fetched_at, digest = args
+    from bs4 import BeautifulSoup
+    from .notice import HUFSNoticeCrawler
+
+    html = SnapshotArchive(root).load(digest).decode('utf-8', errors='replace')
+    crawler = HUFSNoticeCrawler()
+    soup = BeautifulSoup(html, 'html.parser')
+    records = [record for record in map(crawler._extract_notice_record, soup.find_all('tr', class_=''))
+               if record]
+    return fetched_at, records
+
+
+def rebuild_notice_store(archive, store, workers=None):
+    """
+    보관된 공지사항 목록 페이지를 현재 추출 로직으로 다시 처리해 저장소 재구성
+    - 페이지 파싱은 여러 프로세스에서 병렬 실행
+    - 저장은 수집 시각 순서대로 하여 first_seen 을 보존
+    - 임시 파일에 새로 만든 뒤 끝까지 성공했을 때만 기존 저장소 내용을 한 트랜잭션으로 교체
+      (중간에 실패/중단되어도 기존 이력은 그대로, 실행 중인 워커는 멈추지 않아도 됨)
+    Args:
+        archive (SnapshotArchive): 스냅샷 보관소
+        store (NoticeStore): 다시 채울 공지사항 저장소
+        workers (int): 작업 프로세스 수 (기본값 CPU 수)
+    Returns:
+        dict: 처리한 페이지 수, 저장된 공지사항 수, 소요 시간, 초당 페이지 수
+    """
+    from app.models.notice_store import NoticeStore
+    from .notice import HUFSNoticeCrawler
+
+    tasks = [(archive.root, fetched_at, digest)
+             for _, fetched_at, digest in archive.iter_snapshots(HUFSNoticeCrawler().base_url)]
+    start = time.perf_counter()
+    tmp_path = f'{store.path}.rebuild-{os.getpid()}'
+    for suffix in ('', '-wal', '-shm', '-journal'):
+        if os.path.exists(tmp_path + suffix):
+            os.remove(tmp_path + suffix)
+    rebuilt = NoticeStore(tmp_path)
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, len(tasks) // ((workers or os.cpu_count() or 1) * 4))
+            for fetched_at, records in executor.map(_extract_snapshot, tasks, chunksize=chunksize):
+                rebuilt.upsert_many(records, seen_at=fetched_at)
+        notices = rebuilt.count()
+        rebuilt.close()
+        store.replace_with(tmp_path)
+    finally:
+        rebuilt.close()
+        for suffix in ('', '-wal', '-shm', '-journal'):
+            if os.path.exists(tmp_path + suffix):
+                os.remove(tmp_path + suffix)
+    elapsed = time.perf_counter() - start
+    return {
+        'pages': len(tasks),
+        'notices': notices,
+        'elapsed_sec': round(elapsed, 3),
+        'pages_per_sec': round(len(tasks) / elapsed, 1) if elapsed else 0.0
+    }
+
+
+def main():
+    """스냅샷 보관소 명령행 도구"""
+    parser = argparse.ArgumentParser(description='HUFS 공지사항 스냅샷 보관소')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('stats', help='디스크 사용량 출력')
+    rebuild = sub.add_parser('rebuild', help='보관된 HTML 로 공지사항 저장소 재구성')
+    rebuild.add_argument('--workers', type=int, default=None, help='작업 프로세스 수 (기본값: CPU 수)')
+    rebuild.add_argument('--output', default=None, help='재구성할 저장소 경로 (기본값: Config.NOTICE_STORE_PATH)')
+    args = parser.parse_args()
+
+    from app.models.notice_store import NoticeStore, get_notice_store
+
+    archive = get_archive()
+    if args.command == 'rebuild':
+        store = NoticeStore(args.output) if args.output else get_notice_store()
+        result = rebuild_notice_store(archive, store, args.workers)
+        print(f"재구성 완료: 페이지 {result['pages']}개, 공지사항 {result['notices']}개, "
+              f"{result['elapsed_sec']}초 ({result['pages_per_sec']} 페이지/초)")
+
+    stats = archive.get_stats()
+    print(f"스냅샷 {stats['snapshots']}개 / 고유 원본 {stats['unique_blobs']}개")
+    print(f"원본 {stats['raw_bytes']:,} 바이트 -> 디스크 {stats['stored_bytes']:,} 바이트 "
+          f"(색인 {stats['index_bytes']:,} 바이트, 절감률 {stats['saving_ratio']:.1%})")
+
+
+if __name__ == "__main__":
+    main()
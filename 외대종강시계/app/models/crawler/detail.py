@@ -0,0 +1,170 @@
+import json
+import re
+import sqlite3
+import zlib
+from functools import partial
+
+import requests
+from bs4 import BeautifulSoup
+
+from app.models.notice_store import get_notice_store
+from app.models.search_index import get_search_index
+from app.models.tenants import get_tenant
+from .http import fetch
+from .pool import CrawlQueueFull, get_crawl_pool
+
+ARTICLE_ID_PATTERN = re.compile(r'/(\d+)/artclView\.do')
+DATETIME_PATTERN = re.compile(r'(\d{4})[.-](\d{1,2})[.-](\d{1,2})(?:\s+(\d{1,2}):(\d{2})(?::(\d{2}))?)?')
+
+
+class HUFSNoticeDetailCrawler:
+    """
+    한국외대 공지사항 상세 페이지 크롤러
+    - 새 공지사항의 artclView.do 페이지를 백그라운드에서 미리 수집
+    - 본문, 첨부파일 이름, 작성 일시를 추출해 공지사항 저장소에 압축 저장하고 본문은 검색 색인에 반영
+      (만료/축출되는 캐시가 아니라 저장소에 두므로 게시글 번호(article_id)당 한 번만 수집)
+    - 수집에 실패한 게시글은 점점 길어지는 대기 시간이 지난 뒤에만 다시 시도
+    - 요청 속도는 호스트 공용 속도 제한기의 '/bbs/' 예산을 따름
+    - 수집은 공용 크롤링 작업 풀의 백그라운드 작업으로 실행 (같은 게시글은 한 번만 예약)
+    """
+
+    def __init__(self, tenant=None):
+        """
+        크롤러 초기화
+        - tenant: 작업 풀에서 수집 작업을 예약할 테넌트 (기본값: 기본 테넌트)
+        - headers: 브라우저 에뮬레이션을 위한 헤더
+        """
+        self.tenant = tenant or get_tenant()
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        }
+
+    @staticmethod
+    def article_id_from_link(link):
+        """
+        공지사항 링크에서 게시글 번호 추출
+        Args:
+            link (str): .../bbs/hufs/2180/239886/artclView.do 형식의 링크
+        Returns:
+            int or None: 게시글 번호
+        """
+        match = ARTICLE_ID_PATTERN.search(link or '')
+        return int(match.group(1)) if match else None
+
+    def _extract_posted(self, soup):
+        """
+        상세 페이지에서 작성 일시 추출
+        Returns:
+            str or None: ISO 형식 일시
+        """
+        candidates = []
+        for dt in soup.find_all('dt'):
+            if any(label in dt.get_text() for label in ('작성일', '등록일')):
+                dd = dt.find_next_sibling('dd')
+                if dd:
+                    candidates.append(dd.get_text(' ', strip=True))
+        info = soup.find(class_=re.compile(r'artclInfo|view-util|write'))
+        if info:
+            candidates.append(info.get_text(' ', strip=True))
+
+        for text in candidates:
+            match = DATETIME_PATTERN.search(text)
+            if match:
+                year, month, day, hour, minute, second = (int(v or 0) for v in match.groups())
+                return f"{year:04d}-{month:02d}-{day:02d}T{hour:02d}:{minute:02d}:{second:02d}"
+        return None
+
+    def _extract_detail(self, html):
+        """
+        상세 페이지 HTML 에서 정보 추출
+        Args:
+            html (str): artclView.do 응답 본문
+        Returns:
+            dict: body(본문), attachments(첨부파일 이름 목록), posted(작성 일시)
+        """
+        soup = BeautifulSoup(html, 'html.parser')
+        body_tag = soup.find('div', class_='artclView') or soup.find('div', class_='view-con')
+        body = body_tag.get_text('\n', strip=True) if body_tag else ''
+
+        attachments = []
+        for link_tag in soup.find_all('a', href=re.compile(r'download\.do')):
+            name = link_tag.get_text(strip=True)
+            if name and name not in attachments:
+                attachments.append(name)
+
+        return {
+            'body': body,
+            'attachments': attachments,
+            'posted': self._extract_posted(soup)
+        }
+
+    def fetch_detail(self, link):
+        """
+        상세 페이지를 수집해 압축 저장 (실패하면 다음 시도 시각 기록)
+        Args:
+            link (str): 공지사항 상세 페이지 링크
+        Returns:
+            dict or None: 추출된 상세 정보 또는 실패 시 None
+        """
+        article_id = self.article_id_from_link(link)
+        if article_id is None:
+            return None
+
+        store = get_notice_store()
+        try:
+            response = fetch(link, self.headers)
+        except requests.RequestException as e:
+            print(f"공지사항 상세 크롤링 실패({article_id}): {e}")
+            try:
+                store.record_detail_failure(article_id)
+            except sqlite3.Error as e:
+                print(f"공지사항 상세 실패 기록 실패({article_id}): {e}")
+            return None
+
+        detail = self._extract_detail(response.text)
+        detail['article_id'] = article_id
+        detail['link'] = link
+        blob = zlib.compress(json.dumps(detail, ensure_ascii=False).encode('utf-8'))
+        try:
+            store.save_detail(article_id, blob)
+        except sqlite3.Error as e:
+            print(f"공지사항 상세 저장 실패({article_id}): {e}")
+        get_search_index().add_body(article_id, detail['body'])
+        return detail
+
+    def get_detail(self, article_id):
+        """
+        저장소에서 상세 정보 조회 (외부 요청 없음)
+        Returns:
+            dict or None: 상세 정보 또는 아직 수집되지 않은 경우 None
+        """
+        blob = get_notice_store().get_detail(article_id)
+        if blob is None:
+            return None
+        return json.loads(zlib.decompress(blob).decode('utf-8'))
+
+    def prefetch(self, notices):
+        """
+        아직 수집하지 않은 공지사항의 상세 페이지를 백그라운드로 수집 (실패한 게시글은 다음 시도 시각 이후)
+        Args:
+            notices (list): get_notices() 결과 목록
+        Returns:
+            int: 새로 예약된 수집 작업 수 (작업 풀 대기열이 가득 차면 나머지는 다음 크롤링 때 예약)
+        """
+        links = {}
+        for notice in notices:
+            article_id = self.article_id_from_link(notice.get('link'))
+            if article_id is not None:
+                links[article_id] = notice['link']
+        due = get_notice_store().details_due(list(links))
+        pool = get_crawl_pool()
+        scheduled = 0
+        for article_id, link in links.items():
+            if article_id not in due:
+                continue
+            try:
+                pool.submit(self.tenant.id, f"detail:{article_id}", partial(self.fetch_detail, link))
+            except CrawlQueueFull:
+                break
+            scheduled += 1
+        return scheduled
@@ -0,0 +1,62 @@
+import sqlite3
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+
+from config import Config
+from .archive import get_archive
+from .ratelimit import get_rate_limiter
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+
+def parse_retry_after(value):
+    """
+    Retry-After 헤더 해석
+    Args:
+        value (str): 초 단위 숫자 또는 HTTP 날짜
+    Returns:
+        float or None: 대기 시간 (초)
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def fetch(url, headers=None):
+    """
+    크롤링 대상 사이트(각 테넌트의 학교 홈페이지)로 나가는 모든 요청의 공통 진입점
+    - 호스트 전체 속도 제한기를 통과한 뒤 요청 (대상 호스트별 예산)
+    - 429/503 응답이면 Retry-After 만큼 해당 경로 예산을 멈춘 뒤 예외 발생
+    - 성공한 응답 원본은 스냅샷 보관소에 저장
+    Args:
+        url (str): 요청 URL
+        headers (dict): 요청 헤더 (없으면 기본 User-Agent)
+    Returns:
+        requests.Response: 성공한 응답
+    Raises:
+        requests.RequestException: 요청 실패, 한도 초과 등
+    """
+    limiter = get_rate_limiter()
+    limiter.acquire(url)
+    response = requests.get(url, headers=headers or DEFAULT_HEADERS, timeout=Config.REQUEST_TIMEOUT)
+    if response.status_code in (429, 503):
+        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+        limiter.penalize(url, retry_after if retry_after is not None else Config.RATE_LIMIT_DEFAULT_BACKOFF)
+    response.raise_for_status()
+    if Config.ARCHIVE_ENABLED:
+        try:
+            get_archive().store(url, response.content)
+        except (OSError, sqlite3.Error) as e:
+            print(f"스냅샷 저장 실패: {e}")
+    return response
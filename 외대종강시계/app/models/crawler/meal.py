@@ -0,0 +1,268 @@
+import re
+import threading
+from datetime import datetime, timedelta
+
+import requests
+from bs4 import BeautifulSoup
+
+from app.cache import get_cache
+from app.models.tenants import get_tenant
+from app.models.timesource import get_time_source
+from app.profiling import profiled, span
+from config import Config
+from .http import fetch
+from .pool import CrawlQueueFull, get_crawl_pool
+
+PRICE_PATTERN = re.compile(r'\d{1,3}(?:,\d{3})*\s*원')
+TIME_PATTERN = re.compile(r'\d{1,2}:\d{2}\s*~\s*\d{1,2}:\d{2}')
+
+
+def week_key(day):
+    """
+    ISO 주차 키
+    Args:
+        day (date): 날짜
+    Returns:
+        str: "YYYY-Www" (예: 2026-W43)
+    """
+    year, week, _ = day.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def week_range(day):
+    """날짜가 속한 주의 월요일과 일요일"""
+    monday = day - timedelta(days=day.weekday())
+    return monday, monday + timedelta(days=6)
+
+
+def meal_period(now):
+    """
+    현재 시각의 식사 구간
+    Args:
+        now (datetime): 현재 시각
+    Returns:
+        tuple: (식사 이름 또는 None, 다음 구간 경계 datetime)
+    """
+    for name, end in Config.MEAL_PERIODS:
+        hour, minute = map(int, end.split(':'))
+        boundary = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if now < boundary:
+            return name, boundary
+    # 마지막 식사 이후는 자정에 날짜가 바뀌며 다음 구간 시작
+    return None, now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+
+
+class HUFSMealCrawler:
+    """
+    한국외대 학생식당 주간 메뉴 크롤러
+    - 식당별 주간 메뉴 페이지를 주 1회 크롤링해 ISO 주차 단위로 캐시
+    - 요청은 프로세스 메모리 -> 공용 캐시 순으로 처리하고 둘 다 없을 때만 크롤링
+    - 크롤링은 공용 작업 풀에서 실행하고 요청 스레드는 기다리지 않음 (같은 주는 한 번만 크롤링)
+    - 크롤링 실패도 잠시 캐시해 요청마다 외부로 재시도하지 않음
+    """
+
+    # 프로세스 메모리의 주간 메뉴 (이번 주/다음 주만 보관)
+    _weeks = {}
+    _lock = threading.Lock()
+
+    def __init__(self, tenant=None):
+        """
+        크롤러 초기화
+        - tenant: 작업 풀에서 크롤링을 맡길 테넌트 (기본값: 기본 테넌트)
+        - base_url: 주간 메뉴 페이지 URL (startDt, endDt, caf_id 쿼리 사용)
+        - cafeterias: 식당 코드 -> 이름
+        - cache_prefix: 공용 캐시 키 접두사 (뒤에 ISO 주차)
+        """
+        self.tenant = tenant or get_tenant()
+        self.base_url = "https://wis.hufs.ac.kr/jsp/HUFS/cafeteria/viewWeek.jsp"
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        }
+        self.cafeterias = Config.MEAL_CAFETERIAS
+        self.cache_prefix = 'meals:'
+
+    def _extract_week(self, html, monday):
+        """
+        주간 메뉴 표에서 날짜별 식사 추출
+        - 첫 행은 요일(월~일) 헤더, 이후 행은 식사 구분(첫 칸)과 요일별 메뉴 칸
+        - 메뉴 칸의 줄바꿈 단위로 메뉴를 나누고 가격/운영 시간은 따로 분리
+        Args:
+            html (str): 주간 메뉴 페이지 본문
+            monday (date): 주의 월요일
+        Returns:
+            dict: "YYYY-MM-DD" -> [{meal, time, price, menu}, ...]
+        """
+        soup = BeautifulSoup(html, 'html.parser')
+        days = {(monday + timedelta(days=offset)).isoformat(): [] for offset in range(7)}
+        table = soup.find('table')
+        if table is None:
+            return days
+
+        for row in table.find_all('tr')[1:]:
+            cells = row.find_all('td')
+            if len(cells) < 2:
+                continue
+            label_lines = cells[0].get_text('\n', strip=True).split('\n')
+            meal = label_lines[0]
+            label_time = TIME_PATTERN.search(' '.join(label_lines))
+            for offset, cell in enumerate(cells[1:8]):
+                lines = [line.strip() for line in cell.get_text('\n', strip=True).split('\n') if line.strip()]
+                if not lines:
+                    continue
+                text = ' '.join(lines)
+                price = PRICE_PATTERN.search(text)
+                cell_time = TIME_PATTERN.search(text)
+                served = cell_time or label_time
+                menu = [line for line in lines
+                        if not PRICE_PATTERN.fullmatch(line) and not TIME_PATTERN.fullmatch(line)]
+                days[(monday + timedelta(days=offset)).isoformat()].append({
+                    'meal': meal,
+                    'time': served.group(0).replace(' ', '') if served else None,
+                    'price': price.group(0).replace(' ', '') if price else None,
+                    'menu': menu
+                })
+        return days
+
+    def _crawl_week(self, monday, sunday):
+        """
+        모든 식당의 주간 메뉴 크롤링
+        Returns:
+            tuple: (식당 목록, 실패 여부)
+        """
+        cafeterias = []
+        failed = False
+        for cafeteria_id, name in self.cafeterias.items():
+            url = (f"{self.base_url}?startDt={monday:%Y%m%d}&endDt={sunday:%Y%m%d}"
+                   f"&caf_id={cafeteria_id}")
+            try:
+                with span('meal.fetch'):
+                    response = fetch(url, self.headers)
+                with span('meal.parse'):
+                    days = self._extract_week(response.text, monday)
+            except requests.RequestException as e:
+                print(f"학식 메뉴 크롤링 실패({name}): {e}")
+                failed = True
+                days = self._extract_week('', monday)
+            cafeterias.append({'id': cafeteria_id, 'name': name, 'days': days})
+        return cafeterias, failed
+
+    def get_week(self, day=None):
+        """
+        날짜가 속한 주의 전체 메뉴
+        - 프로세스 메모리, 공용 캐시 모두 없으면 공용 작업 풀에 크롤링을 맡기고 기다리지 않음
+          (그동안은 지난 메뉴 또는 빈 메뉴를 pending=True 로 반환)
+        Args:
+            day (date): 기준 날짜 (기본값: 시각 공급자의 오늘)
+        Returns:
+            dict: {week, start, end, updated, failed: 크롤링 실패 여부, expires: 캐시 만료 시각,
+                   cafeterias: [{id, name, days}], (크롤링 중이면) pending: True}
+        """
+        now = get_time_source().now()
+        day = day or now.date()
+        key = week_key(day)
+        with self._lock:
+            cached = self._weeks.get(key)
+        if cached is not None and cached['expires'] > now:
+            return cached['week']
+
+        stale = cached['week'] if cached is not None else None
+        week = get_cache().get(self.cache_prefix + key)
+        if week is not None:
+            # 다른 워커가 저장한 값: 메모리에는 잠시만 (공용 캐시 만료 시각을 넘지 않게) 보관
+            # (캐시 TTL 은 시스템 시각 기준이라 시각 공급자로 본 expires 가 지났으면 다시 크롤링)
+            timeout = Config.MEAL_RETRY_TIMEOUT
+            if week.get('expires'):
+                remaining = datetime.fromisoformat(week['expires']) - now
+                timeout = min(timeout, int(remaining.total_seconds()))
+            if timeout > 0:
+                self._remember(key, week, now + timedelta(seconds=timeout), now)
+                return week
+            stale = week
+
+        # 같은 주의 크롤링은 작업 풀이 하나로 합침 (대기열이 가득 차면 다음 요청 때 다시 예약)
+        try:
+            get_crawl_pool().submit(self.tenant.id, self.cache_prefix + key, lambda: self._crawl(key, day))
+        except CrawlQueueFull:
+            pass
+        return dict(stale or self._empty_week(key, day), pending=True)
+
+    def _remember(self, key, week, expires, now):
+        """프로세스 메모리에 주간 메뉴 보관 (지난 주 메뉴 정리)"""
+        with self._lock:
+            self._weeks[key] = {'week': week, 'expires': expires}
+            for old_key in [old for old in self._weeks if old < week_key(now.date())]:
+                del self._weeks[old_key]
+
+    def _empty_week(self, key, day):
+        """크롤링 전 응답용 빈 주간 메뉴"""
+        monday, sunday = week_range(day)
+        return {
+            'week': key,
+            'start': monday.isoformat(),
+            'end': sunday.isoformat(),
+            'updated': None,
+            'failed': False,
+            'expires': None,
+            'cafeterias': [{'id': cafeteria_id, 'name': name, 'days': self._extract_week('', monday)}
+                           for cafeteria_id, name in self.cafeterias.items()]
+        }
+
+    def _crawl(self, key, day):
+        """
+        (작업 풀) 주간 메뉴를 크롤링해 공용 캐시와 프로세스 메모리에 저장
+        Returns:
+            dict: 주간 메뉴
+        """
+        now = get_time_source().now()
+        monday, sunday = week_range(day)
+        with profiled('crawl-meals'):
+            cafeterias, failed = self._crawl_week(monday, sunday)
+        # 성공하면 그 주가 끝날 때까지, 실패하면 잠시 뒤 다시 시도
+        week_end = datetime.combine(sunday + timedelta(days=1), datetime.min.time())
+        timeout = (Config.MEAL_RETRY_TIMEOUT if failed
+                   else max(int((week_end - now).total_seconds()), Config.MEAL_RETRY_TIMEOUT))
+        expires = now + timedelta(seconds=timeout)
+        week = {
+            'week': key,
+            'start': monday.isoformat(),
+            'end': sunday.isoformat(),
+            'updated': now.isoformat(timespec='seconds'),
+            'failed': failed,
+            'expires': expires.isoformat(timespec='seconds'),
+            'cafeterias': cafeterias
+        }
+        get_cache().set(self.cache_prefix + key, week, timeout)
+        self._remember(key, week, expires, now)
+        return week
+
+    def get_today(self):
+        """
+        오늘 메뉴와 현재 식사 구간
+        Returns:
+            tuple: ({date, current_meal, failed, pending, expires, cafeterias: [{id, name, meals}]},
+                    다음 식사 구간 경계 datetime)
+        """
+        now = get_time_source().now()
+        today = now.date().isoformat()
+        week = self.get_week(now.date())
+        current_meal, valid_until = meal_period(now)
+        return {
+            'date': today,
+            'current_meal': current_meal,
+            'failed': week.get('failed', False),
+            'pending': week.get('pending', False),
+            'expires': week.get('expires'),
+            'cafeterias': [{'id': cafeteria['id'], 'name': cafeteria['name'],
+                            'meals': cafeteria['days'].get(today, [])}
+                           for cafeteria in week['cafeterias']]
+        }, valid_until
+
+
+if __name__ == "__main__":
+    # 크롤러 테스트 코드
+    today, _ = HUFSMealCrawler().get_today()
+    for cafeteria in today['cafeterias']:
+        print("\n" + "="*20)
+        print(cafeteria['name'])
+        for meal in cafeteria['meals']:
+            print(f"{meal['meal']} {meal['time'] or ''} {meal['price'] or ''}: {', '.join(meal['menu'])}")
@@ -1,40 +1,54 @@
+import sqlite3
+
 import requests
 from bs4 import BeautifulSoup
-import json
 from datetime import datetime
 
+from app.cache import get_cache
+from app.models.notice_store import get_notice_store, parse_posted
+from app.models.search_index import get_search_index
+from app.models.tenants import get_tenant
+from app.models.writer_index import get_writer_index
+from app.notify import notify_new_notices
+from app.profiling import profiled, span
+from .detail import HUFSNoticeDetailCrawler
+from .http import fetch
+from .pool import CrawlTimeout, get_crawl_pool
+from config import Config
+
 class HUFSNoticeCrawler:
     """
     한국외대 공지사항 크롤러
     - 메인 페이지의 공지사항을 크롤링
     - 캐시 기능으로 서버 부하 감소
+    - 대상 URL/선택자는 테넌트 정의에서 읽고 캐시는 테넌트별 분할에 저장
+    - 크롤링은 공용 작업 풀에서 실행 (같은 테넌트의 동시 새로고침은 한 번만 크롤링)
     """
     
-    def __init__(self):
+    def __init__(self, tenant=None):
         """
         크롤러 초기화
+        - tenant: 크롤링할 테넌트 (기본값: 기본 테넌트)
         - base_url: 크롤링 대상 URL
         - headers: 브라우저 에뮬레이션을 위한 헤더
-        - cache_file: 캐시 저장 파일 경로
+        - cache_key: 공용 캐시에 저장할 키
         """
-        self.base_url = "https://www.hufs.ac.kr/hufs/11281/subview.do"
-        self.domain = "https://www.hufs.ac.kr"
+        self.tenant = tenant or get_tenant()
+        self.base_url = self.tenant.notice['url']
+        self.domain = self.tenant.notice.get('domain', '')
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
-        self.cache_file = 'notice_cache.json'
+        self.cache_key = 'notices'
+        self.cache_timeout = Config.NOTICE_CACHE_TIMEOUT
     
     def _load_cache(self):
         """
         캐시된 공지사항 데이터 로드
         Returns:
-            dict or None: 캐시된 데이터 또는 실패 시 None
+            dict or None: 캐시된 데이터 또는 만료/실패 시 None
         """
-        try:
-            with open(self.cache_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return None
+        return get_cache(self.tenant.partition).get(self.cache_key)
 
     def _save_cache(self, notices):
         """
@@ -47,8 +61,7 @@ class HUFSNoticeCrawler:
                 'timestamp': datetime.now().isoformat(),
                 'notices': notices
             }
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
+            get_cache(self.tenant.partition).set(self.cache_key, cache_data, self.cache_timeout)
         except Exception as e:
             print(f"캐시 저장 실패: {e}")
 
@@ -60,9 +73,23 @@ class HUFSNoticeCrawler:
         Returns:
             dict or None: 추출된 공지사항 정보 또는 실패 시 None
         """
-        title_td = row.find('td', class_='td-subject')
-        date_td = row.find('td', class_='td-date')
-        writer_td = row.find('td', class_='td-write')
+        record = self._extract_notice_record(row)
+        if record is None:
+            return None
+        del record['posted']
+        return record
+
+    def _extract_notice_record(self, row):
+        """
+        공지사항 행에서 저장소용 정보 추출 (작성 연도를 포함한 posted 추가)
+        Args:
+            row (BeautifulSoup): 공지사항 행 요소
+        Returns:
+            dict or None: date, title, writer, link, posted 또는 실패 시 None
+        """
+        title_td = row.find('td', class_=self.tenant.notice['title_class'])
+        date_td = row.find('td', class_=self.tenant.notice['date_class'])
+        writer_td = row.find('td', class_=self.tenant.notice['writer_class'])
         
         if not (title_td and date_td):
             return None
@@ -82,38 +109,85 @@ class HUFSNoticeCrawler:
             'date': date,
             'title': title,
             'writer': writer,
-            'link': self.domain + link if link else ''
+            'link': self.domain + link if link else '',
+            'posted': parse_posted(full_date)
         }
 
-    def get_notices(self):
+    def get_notices(self, use_cache=False):
         """
         공지사항 크롤링 실행
+        Args:
+            use_cache (bool): True 면 유효한 캐시가 있을 때 크롤링 생략
+        Returns:
+            list: 크롤링된 공지사항 리스트 (크롤링이 제한 시간을 넘기면 캐시된 목록 또는 빈 리스트)
+        """
+        if use_cache:
+            cached_data = self._load_cache()
+            if cached_data:
+                return cached_data['notices']
+
+        def crawl():
+            with profiled('crawl-notices'):  # 풀 스레드에서 실행되어 요청 프로파일과 따로 저장
+                return self._crawl_notices()
+        try:
+            return get_crawl_pool().run(self.tenant.id, 'notices', crawl)
+        except CrawlTimeout as e:
+            print(f"{e}: 캐시된 공지사항 사용")
+            cached_data = self._load_cache()
+            return cached_data['notices'] if cached_data else []
+
+    def _crawl_notices(self):
+        """
+        공지사항 페이지 요청, 파싱, 추출 (단계별 실행 시간 측정)
         Returns:
             list: 크롤링된 공지사항 리스트
         """
         try:
             # 공지사항 페이지 요청
-            response = requests.get(self.base_url, headers=self.headers)
-            response.raise_for_status()
+            with span('notice.fetch'):
+                response = fetch(self.base_url, self.headers)
             
             # HTML 파싱
-            soup = BeautifulSoup(response.text, 'html.parser')
-            notice_rows = soup.find_all('tr', class_='')
+            with span('notice.parse'):
+                soup = BeautifulSoup(response.text, 'html.parser')
+                notice_rows = soup.find_all('tr', class_='')
             
             # 공지사항 정보 추출
-            notices = []
-            for row in notice_rows:
-                notice_info = self._extract_notice_info(row)
-                if notice_info:
-                    notices.append(notice_info)
+            with span('notice.extract'):
+                records = []
+                for row in notice_rows:
+                    record = self._extract_notice_record(row)
+                    if record:
+                        records.append(record)
+                notices = [{key: value for key, value in record.items() if key != 'posted'}
+                           for record in records]
             
-            # 캐시 저장 및 결과 반환
+            # 저장소를 쓰지 않는 테넌트는 캐시만 저장
+            if not self.tenant.supports('archive'):
+                self._save_cache(notices)
+                return notices
+
+            # 저장소 누적, 작성자/검색 색인 갱신, 캐시 저장, 구독 알림 및 새 공지사항 상세 페이지 미리 수집
+            # (저장소 오류(디스크 부족, 잠금 시간 초과 등)가 있어도 크롤링 결과는 캐시하고 반환)
+            new_ids = None
+            try:
+                with span('notice.store'):
+                    new_ids = get_notice_store().upsert_many(records)
+                    get_writer_index().update(records)
+                    get_search_index().update(records)
+            except sqlite3.Error as e:
+                print(f"공지사항 저장소 갱신 실패({self.tenant.id}): {e}")
             self._save_cache(notices)
+            if Config.NOTIFY_ENABLED and new_ids is not None:
+                notify_new_notices(records, new_ids)
+            if Config.DETAIL_PREFETCH_ENABLED:
+                HUFSNoticeDetailCrawler(self.tenant).prefetch(notices)
             return notices
 
         except requests.RequestException as e:
-            print(f"공지사항 크롤링 실패: {e}")
-            return []
+            print(f"공지사항 크롤링 실패({self.tenant.id}): {e}")
+            cached_data = self._load_cache()
+            return cached_data['notices'] if cached_data else []
 
 if __name__ == "__main__":
     # 크롤러 테스트 코드
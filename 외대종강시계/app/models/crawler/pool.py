@@ -0,0 +1,208 @@
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+from config import Config
+
+"""
+모든 테넌트가 공유하는 크롤링 작업 풀
+- 스레드 수는 CRAWL_POOL_WORKERS 로 고정 (테넌트를 추가해도 스레드/프로세스가 늘지 않음)
+- 테넌트별 대기열을 돌아가며 한 작업씩 꺼내므로 한 테넌트의 작업이 몰려도 다른 테넌트가 밀리지 않음
+- 요청이 결과를 기다리는 작업(run)은 백그라운드 작업(submit)보다 먼저 처리하고,
+  백그라운드 작업은 CRAWL_POOL_RESERVED 개의 스레드를 남겨 두고만 실행
+- 같은 (테넌트, 키) 작업이 대기/실행 중이면 새로 넣지 않고 그 결과를 공유
+- 요청은 run_timeout 초까지만 기다리고, 시간을 넘긴 작업은 계속 실행되어 다음 요청이 결과를 씀
+- 작업은 풀 스레드에서 실행되므로 작업 안의 span() 은 구간 통계에는 그대로 쌓이지만
+  요청 프로파일 세션(스레드별)에는 들어가지 않음 (작업 안의 profiled() 가 따로 저장)
+"""
+
+
+class CrawlQueueFull(Exception):
+    """테넌트의 대기 작업 수가 한도를 넘음"""
+
+
+class CrawlTimeout(TimeoutError):
+    """요청이 기다리는 작업이 제한 시간 안에 끝나지 않음 (작업은 계속 실행)"""
+
+
+class CrawlPool:
+    """테넌트 간 라운드 로빈으로 작업을 나눠 실행하는 고정 크기 스레드 풀"""
+
+    def __init__(self, workers, reserved=1, max_pending=100, run_timeout=None):
+        """
+        Args:
+            workers (int): 크롤링 스레드 수
+            reserved (int): 요청이 기다리는 작업 전용으로 남겨 두는 스레드 수
+            max_pending (int): 테넌트별 최대 대기 작업 수
+            run_timeout (float): run() 이 결과를 기다리는 기본 최대 시간 (초, None 이면 무제한)
+        """
+        self.workers = max(1, workers)
+        self.reserved = max(0, min(reserved, self.workers - 1))
+        self.max_pending = max_pending
+        self.run_timeout = run_timeout
+        self._cond = threading.Condition()
+        self._queues = {}     # 테넌트 ID -> (요청 대기 작업 deque, 백그라운드 작업 deque)
+        self._ring = deque()  # 대기 작업이 있는 테넌트 ID (처리 순서)
+        self._jobs = {}       # (테넌트 ID, 키) -> Future (대기/실행 중)
+        self._background_running = 0
+        self._local = threading.local()
+        self._tenant_stats = {}
+        for index in range(self.workers):
+            threading.Thread(target=self._work, name=f'hufs-crawl-pool-{index}', daemon=True).start()
+
+    def _stats_for(self, tenant_id):
+        return self._tenant_stats.setdefault(tenant_id, {'submitted': 0, 'completed': 0, 'failed': 0,
+                                                         'dropped': 0, 'coalesced': 0})
+
+    def submit(self, tenant_id, key, func, urgent=False):
+        """
+        작업 예약
+        Args:
+            tenant_id (str): 테넌트 ID
+            key (str): 작업 식별자 (같은 테넌트 안에서 중복 실행 방지)
+            func (callable): 실행할 함수
+            urgent (bool): 요청이 결과를 기다리는 작업 여부
+        Returns:
+            Future: 작업 결과
+        Raises:
+            CrawlQueueFull: 백그라운드 작업인데 테넌트의 대기 작업이 max_pending 개 이상인 경우
+        """
+        job_key = (tenant_id, key)
+        with self._cond:
+            stats = self._stats_for(tenant_id)
+            future = self._jobs.get(job_key)
+            if future is not None:
+                stats['coalesced'] += 1
+                if urgent:
+                    self._promote(tenant_id, job_key)
+                return future
+
+            queues = self._queues.setdefault(tenant_id, (deque(), deque()))
+            if not urgent and len(queues[0]) + len(queues[1]) >= self.max_pending:
+                stats['dropped'] += 1
+                raise CrawlQueueFull(f"크롤링 대기열이 가득 찼습니다({tenant_id})")
+            future = Future()
+            self._jobs[job_key] = future
+            queues[0 if urgent else 1].append((job_key, func, future))
+            if tenant_id not in self._ring:
+                self._ring.append(tenant_id)
+            stats['submitted'] += 1
+            self._cond.notify()
+        return future
+
+    def _promote(self, tenant_id, job_key):
+        # 백그라운드로 대기 중인 작업을 요청이 기다리면 앞쪽 대기열로 옮김
+        urgent, background = self._queues.get(tenant_id, ((), ()))
+        for job in background:
+            if job[0] == job_key:
+                background.remove(job)
+                urgent.append(job)
+                self._cond.notify()
+                return
+
+    def run(self, tenant_id, key, func, timeout=None):
+        """
+        작업을 풀에서 실행하고 결과를 기다림 (풀 스레드 안에서 호출하면 바로 실행)
+        Args:
+            timeout (float): 최대 대기 시간 (초, 기본값 run_timeout)
+        Returns:
+            object: func() 반환값
+        Raises:
+            CrawlTimeout: 제한 시간 안에 끝나지 않은 경우 (작업은 계속 실행되어 결과를 캐시)
+            Exception: func() 에서 발생한 예외
+        """
+        if getattr(self._local, 'worker', False):
+            return func()
+        future = self.submit(tenant_id, key, func, urgent=True)
+        try:
+            return future.result(self.run_timeout if timeout is None else timeout)
+        except FutureTimeoutError:
+            raise CrawlTimeout(f"크롤링이 제한 시간 안에 끝나지 않았습니다({tenant_id}, {key})") from None
+
+    def _next_job(self):
+        """
+        다음 작업 선택 (요청 대기 작업 우선, 같은 종류 안에서는 테넌트 순서대로)
+        Returns:
+            tuple or None: (작업, 백그라운드 여부)
+        """
+        background_allowed = self._background_running < self.workers - self.reserved
+        for kind in (0, 1):
+            if kind == 1 and not background_allowed:
+                break
+            for _ in range(len(self._ring)):
+                tenant_id = self._ring[0]
+                self._ring.rotate(-1)
+                queues = self._queues[tenant_id]
+                if queues[kind]:
+                    job = queues[kind].popleft()
+                    if not queues[0] and not queues[1]:
+                        self._ring.remove(tenant_id)
+                    return job, kind == 1
+        return None
+
+    def _work(self):
+        self._local.worker = True
+        while True:
+            with self._cond:
+                selected = self._next_job()
+                while selected is None:
+                    self._cond.wait()
+                    selected = self._next_job()
+                (job_key, func, future), background = selected
+                if background:
+                    self._background_running += 1
+
+            failed = False
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = func()
+                except BaseException as e:
+                    failed = True
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+
+            with self._cond:
+                del self._jobs[job_key]
+                self._stats_for(job_key[0])['failed' if failed else 'completed'] += 1
+                if background:
+                    self._background_running -= 1
+                    self._cond.notify()
+
+    def get_stats(self):
+        """
+        작업 풀 지표
+        Returns:
+            dict: 스레드 수, 실행 중인 백그라운드 작업 수, 테넌트별 대기/완료/실패/버림/공유 수
+        """
+        with self._cond:
+            tenants = {}
+            for tenant_id, stats in self._tenant_stats.items():
+                queues = self._queues.get(tenant_id, ((), ()))
+                tenants[tenant_id] = dict(stats, pending=len(queues[0]) + len(queues[1]))
+            return {
+                'workers': self.workers,
+                'reserved': self.reserved,
+                'background_running': self._background_running,
+                'inflight': len(self._jobs),
+                'tenants': tenants,
+            }
+
+
+_pool = None
+_pool_pid = None
+_pool_lock = threading.Lock()
+
+
+def get_crawl_pool():
+    """프로세스 공용 크롤링 작업 풀 반환 (fork 된 워커는 새 풀 사용)"""
+    global _pool, _pool_pid
+    if _pool is None or _pool_pid != os.getpid():
+        with _pool_lock:
+            if _pool is None or _pool_pid != os.getpid():
+                _pool = CrawlPool(Config.CRAWL_POOL_WORKERS, reserved=Config.CRAWL_POOL_RESERVED,
+                                  max_pending=Config.CRAWL_POOL_MAX_PENDING,
+                                  run_timeout=Config.CRAWL_POOL_RUN_TIMEOUT)
+                _pool_pid = os.getpid()
+    return _pool
@@ -0,0 +1,232 @@
+import json
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+
+from config import Config
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    try:
+        import msvcrt
+    except ImportError:
+        msvcrt = None
+
+
+class RateLimitTimeout(requests.RequestException):
+    """허용된 대기 시간 안에 요청 토큰을 얻지 못한 경우"""
+
+
+class _HostFileLock:
+    """
+    같은 호스트의 모든 워커 프로세스가 공유하는 파일 잠금
+    - 프로세스 간: fcntl.flock (Windows 는 msvcrt.locking)
+    - 프로세스 내 스레드 간: threading.Lock
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._thread_lock = threading.Lock()
+
+    def __enter__(self):
+        self._thread_lock.acquire()
+        self._file = open(self.path, 'a+b')
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        elif msvcrt is not None:
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)
+        return self
+
+    def __exit__(self, *exc):
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self._file.close()
+            self._thread_lock.release()
+        return False
+
+
+class HostRateLimiter:
+    """
+    호스트 전체 토큰 버킷 속도 제한기
+    - 버킷 상태를 파일에 저장하고 파일 잠금으로 갱신하므로
+      같은 서버의 모든 워커 프로세스가 하나의 예산을 나눠 씀
+    - 경로 접두사별 예산: {접두사: (초당 토큰 수, 최대 버스트)}
+    - 버킷은 (요청 호스트, 접두사) 단위라 테넌트(학교)마다 따로 예산을 씀
+    - 429/503 응답의 Retry-After 동안 해당 버킷 전체를 멈춤
+    """
+
+    def __init__(self, state_path, budgets, max_wait=30.0):
+        """
+        Args:
+            state_path (str): 버킷 상태 파일 경로
+            budgets (dict): 경로 접두사별 (rate, burst)
+            max_wait (float): 토큰을 기다리는 최대 시간 (초)
+        """
+        self.state_path = state_path
+        self.budgets = budgets
+        self.max_wait = max_wait
+        self._lock = _HostFileLock(state_path + '.lock')
+        self._metrics_lock = threading.Lock()
+        self._metrics = {
+            'acquired': 0,
+            'delayed': 0,
+            'timeouts': 0,
+            'throttled': 0,
+            'total_wait': 0.0,
+            'max_wait': 0.0,
+            'waiting': 0,
+            'max_waiting': 0,
+        }
+        os.makedirs(os.path.dirname(state_path) or '.', exist_ok=True)
+
+    def _bucket_for(self, url):
+        """
+        URL 의 버킷
+        Returns:
+            tuple: (상태 파일 키 "호스트/접두사", URL 경로와 가장 길게 일치하는 예산 접두사)
+        """
+        parts = urlsplit(url)
+        path = parts.path or '/'
+        matches = [prefix for prefix in self.budgets if path.startswith(prefix)]
+        prefix = max(matches, key=len) if matches else '/'
+        return parts.netloc.lower() + prefix, prefix
+
+    def _load_state(self):
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save_state(self, state):
+        tmp_path = f"{self.state_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.state_path)
+
+    def _try_acquire(self, bucket, prefix):
+        """
+        토큰 하나 사용 시도
+        Args:
+            bucket (str): 상태 파일 키
+            prefix (str): 예산 접두사
+        Returns:
+            float: 0 이면 성공, 아니면 다시 시도하기까지 기다릴 시간 (초)
+        """
+        rate, burst = self.budgets.get(prefix, (1.0, 1))
+        with self._lock:
+            state = self._load_state()
+            now = time.time()
+            entry = state.get(bucket) or {'tokens': burst, 'updated': now, 'blocked_until': 0}
+            entry['tokens'] = min(burst, entry['tokens'] + (now - entry['updated']) * rate)
+            entry['updated'] = now
+
+            if now < entry['blocked_until']:
+                wait = entry['blocked_until'] - now
+            elif entry['tokens'] >= 1:
+                entry['tokens'] -= 1
+                wait = 0.0
+            else:
+                wait = (1 - entry['tokens']) / rate
+
+            state[bucket] = entry
+            self._save_state(state)
+        return wait
+
+    def acquire(self, url):
+        """
+        요청 전 토큰 획득 (필요하면 대기)
+        Args:
+            url (str): 요청할 URL
+        Raises:
+            RateLimitTimeout: max_wait 안에 토큰을 얻지 못한 경우
+        """
+        bucket, prefix = self._bucket_for(url)
+        started = time.monotonic()
+        waited = False
+        with self._metrics_lock:
+            self._metrics['waiting'] += 1
+            self._metrics['max_waiting'] = max(self._metrics['max_waiting'], self._metrics['waiting'])
+        try:
+            while True:
+                wait = self._try_acquire(bucket, prefix)
+                if wait == 0:
+                    break
+                if time.monotonic() - started + wait > self.max_wait:
+                    with self._metrics_lock:
+                        self._metrics['timeouts'] += 1
+                    raise RateLimitTimeout(f"요청 한도 대기 시간 초과: {url}")
+                waited = True
+                time.sleep(wait)
+        finally:
+            elapsed = time.monotonic() - started
+            with self._metrics_lock:
+                self._metrics['waiting'] -= 1
+                if waited:
+                    self._metrics['delayed'] += 1
+                    self._metrics['total_wait'] += elapsed
+                    self._metrics['max_wait'] = max(self._metrics['max_wait'], elapsed)
+        with self._metrics_lock:
+            self._metrics['acquired'] += 1
+
+    def penalize(self, url, retry_after):
+        """
+        서버가 요청을 제한했을 때 해당 버킷을 retry_after 초 동안 멈춤
+        Args:
+            url (str): 제한된 요청 URL
+            retry_after (float): 대기 시간 (초)
+        """
+        bucket, _ = self._bucket_for(url)
+        with self._lock:
+            state = self._load_state()
+            now = time.time()
+            entry = state.get(bucket) or {'tokens': 0, 'updated': now, 'blocked_until': 0}
+            entry['tokens'] = 0
+            entry['updated'] = now
+            entry['blocked_until'] = max(entry['blocked_until'], now + retry_after)
+            state[bucket] = entry
+            self._save_state(state)
+        with self._metrics_lock:
+            self._metrics['throttled'] += 1
+
+    def get_stats(self):
+        """
+        대기열/대기 시간 지표 (현재 프로세스 기준)
+        Returns:
+            dict: 획득 수, 지연 수, 평균/최대 대기 시간, 대기 중인 요청 수 등
+        """
+        with self._metrics_lock:
+            stats = dict(self._metrics)
+        stats['avg_wait'] = round(stats['total_wait'] / stats['delayed'], 4) if stats['delayed'] else 0.0
+        stats['total_wait'] = round(stats['total_wait'], 4)
+        stats['max_wait'] = round(stats['max_wait'], 4)
+        return stats
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter():
+    """프로세스 공용 속도 제한기 반환 (상태 파일은 호스트 전체가 공유)"""
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                state_path = Config.RATE_LIMIT_STATE
+                if not os.path.isabs(state_path):
+                    state_path = os.path.join(Config.BASE_DIR, state_path)
+                _limiter = HostRateLimiter(state_path, Config.RATE_LIMIT_BUDGETS,
+                                           Config.RATE_LIMIT_MAX_WAIT)
+    return _limiter
@@ -1,31 +1,45 @@
-import requests
 from bs4 import BeautifulSoup
-import json
-import os
-from datetime import datetime, timedelta
+
+from app.cache import get_cache
+from app.models.tenants import get_tenant
+from app.profiling import profiled, span
+from .http import fetch
+from .pool import CrawlTimeout, get_crawl_pool
+from config import Config
+
+# 크롤링 실패 시 사용하는 기본 학사일정
+DEFAULT_SCHEDULE = {
+    'first_start': "03.04",
+    'first_end': "06.20",
+    'second_start': "09.01",
+    'second_end': "12.19"
+}
 
 class HUFSScheduleCrawler:
     """
     한국외대 학사일정 크롤러
     - 학기 시작/종료 일자 크롤링
     - 24시간 캐시 기능으로 서버 부하 감소
+    - 대상 URL, 학사일정 링크 선택자, 일정 키워드는 테넌트 정의에서 읽음
     """
     
-    def __init__(self):
+    def __init__(self, tenant=None):
         """
         크롤러 초기화
+        - tenant: 크롤링할 테넌트 (기본값: 기본 테넌트)
         - base_url: 메인 페이지 URL (학사일정 섹션)
         - headers: 브라우저 에뮬레이션용 헤더
-        - cache_file: 캐시 파일 경로
-        - cache_duration: 캐시 유효 기간 (24시간)
+        - cache_key: 공용 캐시에 저장할 키
+        - cache_timeout: 캐시 유효 기간 (초, 기본 24시간)
         """
-        self.base_url = "https://www.hufs.ac.kr/hufs/index.do#section4"
-        self.domain = "https://www.hufs.ac.kr"
+        self.tenant = tenant or get_tenant()
+        self.base_url = self.tenant.schedule['url']
+        self.domain = self.tenant.schedule.get('domain', '')
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
-        self.cache_file = 'schedule_cache.json'
-        self.cache_duration = timedelta(hours=24)
+        self.cache_key = 'schedule'
+        self.cache_timeout = Config.SCHEDULE_CACHE_TIMEOUT
 
     def _load_cache(self):
         """
@@ -34,14 +48,7 @@ class HUFSScheduleCrawler:
             dict or None: 유효한 캐시 데이터 또는 None
         """
         try:
-            if os.path.exists(self.cache_file):
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    cache_time = datetime.fromisoformat(data['timestamp'])
-                    
-                    # 캐시 유효성 검사
-                    if cache_time + self.cache_duration > datetime.now():
-                        return data['schedule']
+            return get_cache(self.tenant.partition).get(self.cache_key)
         except Exception as e:
             print(f"캐시 로드 실패: {e}")
         return None
@@ -53,12 +60,7 @@ class HUFSScheduleCrawler:
             schedule_dates (dict): 저장할 학사일정 데이터
         """
         try:
-            cache_data = {
-                'timestamp': datetime.now().isoformat(),
-                'schedule': schedule_dates
-            }
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
+            get_cache(self.tenant.partition).set(self.cache_key, schedule_dates, self.cache_timeout)
         except Exception as e:
             print(f"캐시 저장 실패: {e}")
 
@@ -77,23 +79,20 @@ class HUFSScheduleCrawler:
             'second_end': None     # 2학기 종강일
         }
         
+        keywords = self.tenant.schedule['keywords']
         for item in content_list:
-            date_elems = item.find_all('p', class_='list-date')
-            event_elems = item.find_all('p', class_='list-content')
+            date_elems = item.find_all('p', class_=self.tenant.schedule['date_class'])
+            event_elems = item.find_all('p', class_=self.tenant.schedule['event_class'])
             
             for date, event in zip(date_elems, event_elems):
                 date_str = date.get_text(strip=True).split('~')[-1].strip()
                 event_str = event.get_text(strip=True)
                 
-                # 주요 학사일정 매칭
-                if '제1학기 개강' in event_str:
-                    schedule_dates['first_start'] = date_str
-                elif '제1학기 기말시험' in event_str:
-                    schedule_dates['first_end'] = date_str
-                elif '제2학기 개강' in event_str:
-                    schedule_dates['second_start'] = date_str
-                elif '제2학기 기말시험' in event_str:
-                    schedule_dates['second_end'] = date_str
+                # 주요 학사일정 매칭 (테넌트 정의의 키워드 순서대로 첫 번째로 일치하는 항목)
+                for field, keyword in keywords.items():
+                    if keyword in event_str:
+                        schedule_dates[field] = date_str
+                        break
                     
         return schedule_dates
 
@@ -101,48 +100,62 @@ class HUFSScheduleCrawler:
         """
         학사일정 크롤링 실행
         Returns:
-            dict: 학사일정 날짜 정보
+            dict: 학사일정 날짜 정보 (크롤링이 제한 시간을 넘기면 기본 일정)
         """
         # 캐시 확인
         cached_data = self._load_cache()
         if cached_data:
             return cached_data
 
+        def crawl():
+            with profiled('crawl-schedule'):  # 풀 스레드에서 실행되어 요청 프로파일과 따로 저장
+                return self._crawl_schedule()
+        try:
+            return get_crawl_pool().run(self.tenant.id, 'schedule', crawl)
+        except CrawlTimeout as e:
+            # 크롤링은 계속 실행되어 끝나면 캐시에 저장되므로 이번 요청만 기본 일정 사용
+            print(f"{e}: 기본 학사일정 사용")
+            return dict(self.tenant.default_schedule or DEFAULT_SCHEDULE)
+
+    def _crawl_schedule(self):
+        """
+        학사일정 페이지 요청, 파싱, 추출 (단계별 실행 시간 측정)
+        Returns:
+            dict: 학사일정 날짜 정보 (실패 시 기본 일정)
+        """
         try:
             # 메인 페이지에서 학사일정 링크 추출
-            response = requests.get(self.base_url, headers=self.headers)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            with span('schedule.fetch'):
+                response = fetch(self.base_url, self.headers)
+            with span('schedule.parse'):
+                soup = BeautifulSoup(response.text, 'html.parser')
             
-            schedule_link = soup.select_one('#top_k2wiz_GNB_11360')
+            schedule_link = soup.select_one(self.tenant.schedule['link_selector'])
             if not schedule_link:
                 raise ValueError("학사일정 링크를 찾을 수 없습니다.")
 
             # 학사일정 페이지 크롤링
             schedule_url = self.domain + schedule_link['href']
-            schedule_response = requests.get(schedule_url, headers=self.headers)
-            schedule_response.raise_for_status()
+            with span('schedule.fetch'):
+                schedule_response = fetch(schedule_url, self.headers)
             
-            schedule_soup = BeautifulSoup(schedule_response.text, 'html.parser')
-            content_wrap = schedule_soup.find('div', class_='wrap-contents')
+            with span('schedule.parse'):
+                schedule_soup = BeautifulSoup(schedule_response.text, 'html.parser')
+                content_wrap = schedule_soup.find('div', class_=self.tenant.schedule['content_class'])
             
             if not content_wrap:
                 raise ValueError("학사일정 내용을 찾을 수 없습니다.")
             
             # 학사일정 추출 및 캐시 저장
-            schedule_dates = self._extract_schedule_dates(content_wrap.find_all('li'))
+            with span('schedule.extract'):
+                schedule_dates = self._extract_schedule_dates(content_wrap.find_all('li'))
             self._save_cache(schedule_dates)
             return schedule_dates
 
         except Exception as e:
-            print(f"학사일정 크롤링 실패: {e}")
+            print(f"학사일정 크롤링 실패({self.tenant.id}): {e}")
             # 기본 일정 반환
-            default_dates = {
-                'first_start': "03.04",
-                'first_end': "06.20",
-                'second_start': "09.01",
-                'second_end': "12.19"
-            }
+            default_dates = dict(self.tenant.default_schedule or DEFAULT_SCHEDULE)
             self._save_cache(default_dates)
             return default_dates
 
@@ -0,0 +1,103 @@
+import sys
+from datetime import date
+
+from app.models.notice_store import parse_link
+from app.models.timesource import get_time_source
+
+"""
+메모리 절약형 공지사항 레코드
+- 공지사항마다 문자열 4개짜리 dict 대신 __slots__ 객체 하나로 보관
+- 링크는 게시판/게시글 번호(int)만 보관하고 직렬화할 때 도메인을 붙여 복원
+  (그렇게 복원한 링크와 다른 링크(쿼리 문자열, 다른 도메인 등)만 문자열로 따로 보관)
+- 작성일은 date 객체, 작성자와 사이트 이름은 sys.intern 으로 공유
+"""
+
+NOTICE_DOMAIN = "https://www.hufs.ac.kr"
+
+_DATE_LABELS = {}  # date -> "MM.DD" (직렬화할 때마다 문자열 포맷팅하지 않도록 공유)
+
+
+def _date_label(posted):
+    label = _DATE_LABELS.get(posted)
+    if label is None:
+        label = _DATE_LABELS[posted] = f"{posted.month:02d}.{posted.day:02d}"
+    return label
+
+
+class NoticeRecord:
+    """공지사항 하나 (직렬화 결과는 크롤러의 dict 형식과 같음)"""
+
+    __slots__ = ('article_id', 'board_id', 'site', 'posted', 'title', 'writer', '_link')
+
+    def __init__(self, article_id, board_id, site, posted, title, writer, link=None):
+        """
+        Args:
+            article_id (int): 게시글 번호
+            board_id (int): 게시판 번호
+            site (str): 링크의 사이트 이름 (예: hufs)
+            posted (date): 작성일
+            title (str): 제목
+            writer (str): 작성자(부서)
+            link (str): 원래 링크 (번호로 복원한 링크와 같으면 보관하지 않음)
+        """
+        self.article_id = article_id
+        self.board_id = board_id
+        self.site = sys.intern(site)
+        self.posted = posted
+        self.title = title
+        self.writer = sys.intern(writer)
+        self._link = None if link == self._canonical_link() else link
+
+    @classmethod
+    def from_notice(cls, notice, posted=None):
+        """
+        크롤러/저장소의 dict 에서 레코드 생성
+        Args:
+            notice (dict): date(MM.DD), title, writer, link 키 (posted 키가 있으면 작성 연도로 사용)
+            posted (str): 작성일 "YYYY-MM-DD" (없으면 notice['posted'], 그것도 없으면 MM.DD 가
+                오늘(시각 공급자 기준) 이후가 되지 않는 가장 최근 연도)
+        Returns:
+            NoticeRecord or None: 링크에서 게시글 번호를 찾지 못하거나 날짜가 잘못되면 None
+        """
+        parsed = parse_link(notice.get('link'))
+        if parsed is None:
+            return None
+        site, board_id, article_id = parsed
+        posted = posted or notice.get('posted')
+        try:
+            if posted:
+                posted_date = date.fromisoformat(posted)
+            else:
+                month, day = notice['date'].split('.')
+                today = get_time_source().now().date()
+                posted_date = date(today.year, int(month), int(day))
+                if posted_date > today:  # 1월에 본 12월 게시글
+                    posted_date = posted_date.replace(year=today.year - 1)
+        except ValueError:
+            return None
+        return cls(article_id, board_id, site, posted_date, notice['title'], notice['writer'], notice['link'])
+
+    @property
+    def date(self):
+        """목록 형식의 작성일 (MM.DD)"""
+        return _date_label(self.posted)
+
+    def _canonical_link(self):
+        return f"{NOTICE_DOMAIN}/bbs/{self.site}/{self.board_id}/{self.article_id}/artclView.do"
+
+    @property
+    def link(self):
+        """게시글 전체 URL (저장된 링크 그대로)"""
+        return self._link or self._canonical_link()
+
+    def to_dict(self):
+        """크롤러와 같은 {date, title, writer, link} dict 로 변환"""
+        return {
+            'date': _date_label(self.posted),
+            'title': self.title,
+            'writer': self.writer,
+            'link': self._link or self._canonical_link()
+        }
+
+    def __repr__(self):
+        return f"NoticeRecord({self.article_id}, {self.writer!r}, {self.title!r})"
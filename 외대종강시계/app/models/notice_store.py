@@ -0,0 +1,312 @@
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+from config import Config
+
+LINK_PATTERN = re.compile(r'/bbs/(\w+)/(\d+)/(\d+)/artclView\.do')
+EXPORT_COLUMNS = ('article_id', 'board_id', 'posted', 'date', 'title', 'writer', 'link', 'first_seen')
+
+
+def parse_link(link):
+    """
+    공지사항 링크에서 게시판/게시글 번호 추출
+    Args:
+        link (str): https://www.hufs.ac.kr/bbs/hufs/2180/239886/artclView.do 형식
+    Returns:
+        tuple or None: (사이트 이름, 게시판 번호, 게시글 번호)
+    """
+    match = LINK_PATTERN.search(link or '')
+    if not match:
+        return None
+    return match.group(1), int(match.group(2)), int(match.group(3))
+
+
+def parse_posted(full_date):
+    """
+    목록의 작성일("YYYY.MM.DD")을 ISO 날짜로 변환
+    Returns:
+        str or None: "YYYY-MM-DD"
+    """
+    try:
+        return datetime.strptime(full_date.strip(), '%Y.%m.%d').date().isoformat()
+    except (AttributeError, ValueError):
+        return None
+
+
+class NoticeStore:
+    """
+    공지사항 저장소 (SQLite)
+    - 크롤링할 때마다 본 공지사항을 게시글 번호 기준으로 누적
+    - 목록에서 사라진 공지사항도 보관되어 전체 이력 조회 가능
+    - seq: 새로 추가되거나 내용이 바뀐 게시글에 기록하는 변경 번호 (색인이 변경분만 이어받는 기준)
+    - notice_details: 미리 수집한 상세 정보(압축 JSON)와 수집 실패 횟수/다음 시도 시각
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): SQLite 파일 경로
+        """
+        self.path = path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._conn().execute(
+            'CREATE TABLE IF NOT EXISTS notices ('
+            'article_id INTEGER PRIMARY KEY, '
+            'board_id INTEGER NOT NULL, '
+            'posted TEXT, '
+            'date TEXT NOT NULL, '
+            'title TEXT NOT NULL, '
+            'writer TEXT NOT NULL, '
+            'link TEXT NOT NULL, '
+            'first_seen TEXT NOT NULL, '
+            'seq INTEGER NOT NULL DEFAULT 0)'
+        )
+        columns = {row[1] for row in self._conn().execute('PRAGMA table_info(notices)')}
+        if 'seq' not in columns:  # 변경 번호가 없던 저장소 (기존 게시글은 0)
+            self._conn().execute('ALTER TABLE notices ADD COLUMN seq INTEGER NOT NULL DEFAULT 0')
+        self._conn().execute('CREATE INDEX IF NOT EXISTS idx_notices_posted ON notices (posted)')
+        self._conn().execute('CREATE INDEX IF NOT EXISTS idx_notices_seq ON notices (seq)')
+        # 마지막 변경 번호 (게시글이 모두 바뀌거나 없어져도 줄어들지 않도록 따로 보관)
+        with self._conn() as conn:
+            conn.execute('CREATE TABLE IF NOT EXISTS notice_seq (value INTEGER NOT NULL)')
+            conn.execute('INSERT INTO notice_seq (value) SELECT COALESCE(MAX(seq), 0) FROM notices '
+                         'WHERE NOT EXISTS (SELECT 1 FROM notice_seq)')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS notice_details ('
+                'article_id INTEGER PRIMARY KEY, '
+                'detail BLOB, '
+                'failures INTEGER NOT NULL DEFAULT 0, '
+                'retry_at REAL)'
+            )
+
+    def _conn(self):
+        conn = getattr(self._local, 'conn', None)
+        # fork 된 워커는 부모의 연결을 쓰지 않고 새로 연결
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def upsert_many(self, records, seen_at=None):
+        """
+        공지사항 저장 (이미 있으면 제목/작성자 등 갱신, 처음 본 시각은 유지)
+        - 새 게시글과 내용이 바뀐 게시글에만 이번 호출의 변경 번호(seq) 기록
+        - 변경 번호는 쓰기 잠금(BEGIN IMMEDIATE) 안에서 정하므로 여러 워커가 동시에 저장해도 단조 증가
+        Args:
+            records (list): date, title, writer, link, posted 키를 가진 dict 목록
+            seen_at (str): 처음 본 시각 (ISO, 기본값 현재 시각)
+        Returns:
+            list: 새로 추가된 게시글 번호 목록
+        """
+        seen_at = seen_at or datetime.now().isoformat(timespec='seconds')
+        conn = self._conn()
+        rows = []
+        for record in records:
+            parsed = parse_link(record.get('link'))
+            if parsed is None:
+                continue
+            _, board_id, article_id = parsed
+            rows.append((article_id, board_id, record.get('posted'), record['date'],
+                         record['title'], record['writer'], record['link'], seen_at))
+        if not rows:
+            return []
+
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            conn.execute('UPDATE notice_seq SET value = value + 1')
+            seq = conn.execute('SELECT value FROM notice_seq').fetchone()[0]
+            placeholders = ','.join('?' * len(rows))
+            existing = {row[0] for row in conn.execute(
+                f'SELECT article_id FROM notices WHERE article_id IN ({placeholders})',
+                [row[0] for row in rows])}
+            conn.executemany(
+                'INSERT INTO notices (article_id, board_id, posted, date, title, writer, link, first_seen, seq) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT(article_id) DO UPDATE SET '
+                'posted = COALESCE(excluded.posted, posted), date = excluded.date, '
+                'title = excluded.title, writer = excluded.writer, link = excluded.link, seq = excluded.seq '
+                'WHERE COALESCE(excluded.posted, notices.posted) IS NOT notices.posted '
+                'OR excluded.date != notices.date OR excluded.title != notices.title '
+                'OR excluded.writer != notices.writer OR excluded.link != notices.link',
+                [row + (seq,) for row in rows])
+        return [row[0] for row in rows if row[0] not in existing]
+
+    def save_detail(self, article_id, blob):
+        """
+        상세 정보 저장 (실패 기록 초기화)
+        - 게시글에 새 변경 번호를 기록해 다른 워커의 검색 색인이 다음 sync() 에서 본문을 가져가게 함
+        Args:
+            article_id (int): 게시글 번호
+            blob (bytes): 압축한 상세 정보
+        """
+        with self._conn() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            conn.execute('INSERT OR REPLACE INTO notice_details (article_id, detail, failures, retry_at) '
+                         'VALUES (?, ?, 0, NULL)', (article_id, blob))
+            conn.execute('UPDATE notice_seq SET value = value + 1')
+            conn.execute('UPDATE notices SET seq = (SELECT value FROM notice_seq) WHERE article_id = ?',
+                         (article_id,))
+
+    def record_detail_failure(self, article_id, now=None):
+        """
+        상세 정보 수집 실패 기록 (다음 시도는 DETAIL_RETRY_SECONDS 부터 실패할 때마다 2배 뒤, 상한 DETAIL_RETRY_MAX_SECONDS)
+        Args:
+            article_id (int): 게시글 번호
+            now (float): 현재 시각 (epoch 초, 기본값 time.time())
+        Returns:
+            float: 다음 시도 시각 (epoch 초)
+        """
+        now = time.time() if now is None else now
+        with self._conn() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            row = conn.execute('SELECT failures FROM notice_details WHERE article_id = ?', (article_id,)).fetchone()
+            failures = (row[0] if row else 0) + 1
+            retry_at = now + min(Config.DETAIL_RETRY_SECONDS * 2 ** (failures - 1), Config.DETAIL_RETRY_MAX_SECONDS)
+            conn.execute('INSERT INTO notice_details (article_id, failures, retry_at) VALUES (?, ?, ?) '
+                         'ON CONFLICT(article_id) DO UPDATE SET failures = excluded.failures, '
+                         'retry_at = excluded.retry_at', (article_id, failures, retry_at))
+        return retry_at
+
+    def get_detail(self, article_id):
+        """
+        저장된 상세 정보
+        Returns:
+            bytes or None: 압축한 상세 정보 (아직 수집하지 못한 경우 None)
+        """
+        row = self._conn().execute(
+            'SELECT detail FROM notice_details WHERE article_id = ?', (article_id,)).fetchone()
+        return row[0] if row else None
+
+    def details_due(self, article_ids, now=None):
+        """
+        상세 정보를 수집해야 하는 게시글 (아직 없고, 실패했다면 다음 시도 시각이 지난 것)
+        Args:
+            article_ids (list): 게시글 번호 목록
+            now (float): 현재 시각 (epoch 초, 기본값 time.time())
+        Returns:
+            set: 수집할 게시글 번호
+        """
+        if not article_ids:
+            return set()
+        now = time.time() if now is None else now
+        placeholders = ','.join('?' * len(article_ids))
+        skipped = {row[0] for row in self._conn().execute(
+            f'SELECT article_id FROM notice_details WHERE article_id IN ({placeholders}) '
+            'AND (detail IS NOT NULL OR retry_at > ?)', [*article_ids, now])}
+        return set(article_ids) - skipped
+
+    def changed_since(self, seq):
+        """
+        변경 번호가 seq 보다 큰(그 뒤에 추가되거나 내용이 바뀐) 공지사항 조회 (seq 색인 범위 검색)
+        Returns:
+            list: (seq, posted, date, title, writer, link) 튜플 목록 (변경 순)
+        """
+        return self._conn().execute(
+            'SELECT seq, posted, date, title, writer, link FROM notices '
+            'WHERE seq > ? ORDER BY seq, article_id', (seq,)).fetchall()
+
+    def max_seq(self):
+        """마지막으로 매긴 변경 번호 (없으면 0)"""
+        return self._conn().execute('SELECT value FROM notice_seq').fetchone()[0]
+
+    def iter_batches(self, since=None, until=None, writers=None, batch_size=1000):
+        """
+        조건에 맞는 공지사항을 batch_size 개씩 읽어 반환 (전체를 메모리에 올리지 않음)
+        - 긴 읽기 트랜잭션이 다른 요청과 섞이지 않도록 별도 연결 사용 (WAL 이라 쓰기는 막지 않음)
+        Args:
+            since (str): 작성일 하한 "YYYY-MM-DD" (포함)
+            until (str): 작성일 상한 "YYYY-MM-DD" (포함)
+            writers (list): 작성자 필터
+            batch_size (int): 한 번에 읽을 행 수
+        Yields:
+            list: EXPORT_COLUMNS 순서의 튜플 목록 (게시글 번호 순)
+        """
+        conditions, params = [], []
+        if since:
+            conditions.append('posted >= ?')
+            params.append(since)
+        if until:
+            conditions.append('posted <= ?')
+            params.append(until)
+        if writers:
+            conditions.append(f"writer IN ({','.join('?' * len(writers))})")
+            params.extend(writers)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ''
+
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            cursor = conn.execute(
+                f"SELECT {', '.join(EXPORT_COLUMNS)} FROM notices{where} ORDER BY article_id", params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield rows
+        finally:
+            conn.close()
+
+    def count(self):
+        return self._conn().execute('SELECT COUNT(*) FROM notices').fetchone()[0]
+
+    def clear(self):
+        with self._conn() as conn:
+            conn.execute('DELETE FROM notices')
+
+    def close(self):
+        """
+        현재 스레드의 연결 종료 (WAL 내용을 본 파일에 반영하고 -wal/-shm 파일 정리)
+        - 다른 저장소가 이 파일을 읽어 가기(replace_with) 전에 호출
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            conn.execute('PRAGMA journal_mode=DELETE')
+            conn.close()
+        self._local.conn = None
+
+    def replace_with(self, path):
+        """
+        공지사항 전체를 다른 저장소 파일(재구성 결과)의 내용으로 교체
+        - 파일을 바꾸지 않고 같은 파일 안에서 쓰기 잠금(BEGIN IMMEDIATE) 트랜잭션 하나로 지우고 채움
+          (다른 워커의 저장은 교체 앞이나 뒤에 실행되고, 읽기는 커밋 전까지 기존 내용을 봄)
+        - 다른 프로세스가 열어 둔 연결과 -wal/-shm 파일은 그대로 사용 가능
+        - 새 게시글의 변경 번호는 기존 마지막 번호 뒤로 옮겨 실행 중인 색인이 전체를 다시 읽게 함
+        Args:
+            path (str): 재구성한 SQLite 파일 경로 (close() 된 NoticeStore 파일)
+        """
+        columns = ', '.join(EXPORT_COLUMNS)
+        conn = self._conn()
+        conn.execute('ATTACH DATABASE ? AS rebuilt', (path,))
+        try:
+            with conn:
+                conn.execute('BEGIN IMMEDIATE')
+                offset = conn.execute('SELECT value FROM notice_seq').fetchone()[0]
+                conn.execute('DELETE FROM notices')
+                conn.execute(f'INSERT INTO notices ({columns}, seq) '
+                             f'SELECT {columns}, seq + ? FROM rebuilt.notices', (offset,))
+                conn.execute('UPDATE notice_seq SET value = value + (SELECT value FROM rebuilt.notice_seq)')
+        finally:
+            conn.execute('DETACH DATABASE rebuilt')
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_notice_store():
+    """프로세스 공용 공지사항 저장소 반환"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                path = Config.NOTICE_STORE_PATH
+                if not os.path.isabs(path):
+                    path = os.path.join(Config.BASE_DIR, path)
+                _store = NoticeStore(path)
+    return _store
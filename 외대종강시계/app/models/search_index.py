@@ -0,0 +1,226 @@
+import heapq
+import math
+import re
+import threading
+import unicodedata
+from collections import Counter
+
+from app.models.notice_record import NoticeRecord
+from app.models.notice_store import get_notice_store
+from config import Config
+
+"""
+공지사항 n-gram 검색 색인
+- 한글 제목은 띄어쓰기 단위로 나누면 "신입학" 으로 "2026학년도 전기 신입학 모집" 을 찾지 못하므로
+  단어마다 글자 1~3-gram 을 색인해 단어 일부로도 검색
+- 검색어의 모든 n-gram 을 포함한 공지사항만 결과에 포함하고, 제목 일치에 가중치를 둔 TF-IDF 점수로 정렬
+- 후보가 SEARCH_MAX_CANDIDATES 를 넘는 흔한 검색어는 최신 게시글 후보만 점수 계산해 지연 시간 제한
+- 크롤링한 공지사항 제목과 미리 수집된 상세 본문을 증분 반영
+"""
+
+TOKEN_PATTERN = re.compile(r'\w+')
+TITLE_WEIGHT = 3  # 제목에서 나온 n-gram 가중치 (본문은 1)
+
+
+def ngrams(text):
+    """
+    텍스트의 글자 n-gram 빈도
+    - NFKC 정규화, 소문자 변환 후 단어(문자/숫자 연속)마다 1~3-gram 생성
+    - 1-gram 은 한 글자 검색어용
+    Args:
+        text (str): 제목 또는 본문
+    Returns:
+        Counter: n-gram -> 등장 횟수
+    """
+    grams = Counter()
+    for token in TOKEN_PATTERN.findall(unicodedata.normalize('NFKC', text).lower()):
+        for n in (1, 2, 3):
+            grams.update(token[i:i + n] for i in range(len(token) - n + 1))
+    return grams
+
+
+def _required_grams(query):
+    """검색 결과가 반드시 포함해야 하는 n-gram (단어마다 가능한 가장 긴 n-gram, 최대 3)"""
+    required = set()
+    for token in TOKEN_PATTERN.findall(unicodedata.normalize('NFKC', query).lower()):
+        n = 3 if len(token) >= 3 else len(token)
+        required.update(token[i:i + n] for i in range(len(token) - n + 1))
+    return required
+
+
+class NoticeSearchIndex:
+    """공지사항 제목/본문 n-gram 역색인 (프로세스 메모리)"""
+
+    def __init__(self, store=None):
+        """
+        Args:
+            store (NoticeStore): 색인을 채울 공지사항 저장소 (기본값 get_notice_store())
+        """
+        self.store = store
+        self._lock = threading.Lock()
+        self._postings = {}   # n-gram -> {게시글 번호: 가중 빈도}
+        self._doc_grams = {}  # 게시글 번호 -> 색인된 n-gram 목록 (다시 색인할 때 제거용)
+        self._records = {}    # 게시글 번호 -> NoticeRecord
+        self._bodies = {}     # 게시글 번호 -> 색인된 본문 앞부분 (제목만 바뀌어 다시 색인할 때 재사용)
+        self._last_seq = -1  # 이어받은 마지막 저장소 변경 번호 (변경 번호가 없던 게시글은 0)
+
+    def _index(self, record, body=None):
+        """공지사항 하나를 (다시) 색인 (body 가 없으면 이전에 색인한 본문 유지)"""
+        article_id = record.article_id
+        for gram in self._doc_grams.pop(article_id, ()):
+            postings = self._postings[gram]
+            del postings[article_id]
+            if not postings:
+                del self._postings[gram]
+
+        weights = Counter()
+        for gram, count in ngrams(record.title).items():
+            weights[gram] += count * TITLE_WEIGHT
+        if body is None:
+            body = self._bodies.get(article_id)
+        if body:
+            body = body[:Config.SEARCH_BODY_CHARS]
+            weights.update(ngrams(body))
+            self._bodies[article_id] = body
+        for gram, weight in weights.items():
+            self._postings.setdefault(gram, {})[article_id] = weight
+        self._doc_grams[article_id] = tuple(weights)
+        self._records[article_id] = record
+
+    def update(self, notices):
+        """
+        크롤링한 공지사항 제목 반영 (제목이 바뀌지 않은 공지사항은 건너뜀)
+        Args:
+            notices (list): date, title, writer, link (있으면 posted) 키를 가진 dict 목록
+        Returns:
+            int: 새로 색인한 공지사항 수
+        """
+        indexed = 0
+        with self._lock:
+            for notice in notices:
+                record = NoticeRecord.from_notice(notice)
+                if record is None:
+                    continue
+                previous = self._records.get(record.article_id)
+                if previous is not None and previous.title == record.title:
+                    self._records[record.article_id] = record
+                    continue
+                self._index(record)
+                indexed += 1
+        return indexed
+
+    def add_body(self, article_id, body):
+        """
+        상세 페이지 본문 반영 (제목이 색인된 공지사항만)
+        Args:
+            article_id (int): 게시글 번호
+            body (str): 본문 텍스트
+        """
+        with self._lock:
+            record = self._records.get(article_id)
+            if record is not None and body:
+                self._index(record, body)
+
+    def sync(self):
+        """
+        저장소에서 아직 반영하지 않은 추가/변경 게시글 이어받기 (마지막 변경 번호 이후만 조회)
+        - 처음 보는 게시글은 미리 수집된 본문이 있으면 함께 색인
+        - 제목이 바뀐 게시글은 다시 색인, 그 외 변경(작성자 등)은 레코드만 교체
+        - 본문 없이 색인된 게시글이 다시 바뀌면(다른 워커가 상세 본문을 수집한 경우 포함) 본문을 다시 확인
+        Returns:
+            int: 새로 반영한 공지사항 수
+        """
+        from app.models.crawler.detail import HUFSNoticeDetailCrawler
+
+        store = self.store or get_notice_store()
+        detail_crawler = HUFSNoticeDetailCrawler()
+        with self._lock:
+            rows = store.changed_since(self._last_seq)
+            for seq, posted, date, title, writer, link in rows:
+                record = NoticeRecord.from_notice(
+                    {'date': date, 'title': title, 'writer': writer, 'link': link}, posted)
+                if record is None:
+                    continue
+                previous = self._records.get(record.article_id)
+                same_title = previous is not None and previous.title == record.title
+                detail = None
+                if not same_title or record.article_id not in self._bodies:
+                    detail = detail_crawler.get_detail(record.article_id)  # 저장소만 조회 (외부 요청 없음)
+                if same_title and not (detail and detail['body']):
+                    self._records[record.article_id] = record
+                    continue
+                self._index(record, detail['body'] if detail else None)
+            if rows:
+                self._last_seq = rows[-1][0]
+            return len(rows)
+
+    def search(self, query, limit=20):
+        """
+        공지사항 검색
+        Args:
+            query (str): 검색어 (띄어쓰기로 여러 단어 지정 시 모두 포함한 공지사항)
+            limit (int): 최대 결과 수
+        Returns:
+            list: 점수 높은 순 [{date, title, writer, link, score}, ...]
+        """
+        required = _required_grams(query)
+        if not required:
+            return []
+
+        with self._lock:
+            postings = [self._postings.get(gram) for gram in required]
+            if not all(postings):
+                return []
+            # 가장 짧은 목록부터 교집합 (결과 후보 수에 비례)
+            postings.sort(key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                candidates.intersection_update(posting.keys())
+                if not candidates:
+                    return []
+            if len(candidates) > Config.SEARCH_MAX_CANDIDATES:
+                # 흔한 검색어는 후보가 너무 많으므로 최신 게시글부터 일부만 점수 계산
+                candidates = sorted(candidates)[-Config.SEARCH_MAX_CANDIDATES:]
+
+            # 후보는 모두 같은 n-gram 을 포함하므로 점수는 제목/본문 가중 빈도와 n-gram 희소성(idf)으로 결정
+            total = len(self._records)
+            weighted = [(posting, math.log(1 + total / len(posting))) for posting in postings]
+            top = heapq.nlargest(
+                limit,
+                ((sum(posting.get(article_id, 0) * idf for posting, idf in weighted), article_id)
+                 for article_id in candidates))
+            results = []
+            for score, article_id in top:
+                notice = self._records[article_id].to_dict()
+                notice['score'] = round(score, 2)
+                results.append(notice)
+            return results
+
+    def get_stats(self):
+        """
+        색인 크기
+        Returns:
+            dict: 공지사항 수, 본문 색인 수, n-gram 수
+        """
+        with self._lock:
+            return {
+                'notices': len(self._records),
+                'bodies': len(self._bodies),
+                'grams': len(self._postings)
+            }
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_search_index():
+    """프로세스 공용 검색 색인 반환 (처음 호출 시 저장소 전체로 채움)"""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                index = NoticeSearchIndex()
+                index.sync()
+                _index = index
+    return _index
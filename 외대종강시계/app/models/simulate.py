@@ -0,0 +1,120 @@
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta
+
+from .clock import HUFSClock
+from .crawler.schedule import DEFAULT_SCHEDULE
+from .timesource import FixedTimeSource
+
+"""
+학사일정 타이머 가속 시뮬레이션
+- 고정 시각 공급자로 1년치 시각을 초/분 단위로 빠르게 훑으며
+  get_remaining_time() / _determine_current_semester() 결과의 불변식을 검사
+    1. 남은 시간은 음수가 아님
+    2. 목표 날짜가 같으면 남은 시간은 정확히 한 간격씩 줄어듦
+    3. 기간 전환은 방학 -> 1학기 -> 방학 -> 2학기 -> 방학 순서로만 일어남
+    4. 기간 문구가 현재 학기와 일치
+- 실행 예: python -m app.models.simulate --start 2026-03-01 --days 365 --step minute
+"""
+
+STEPS = {'second': 1, 'minute': 60, 'hour': 3600}
+NEXT_SEMESTER = {0: (1, 2), 1: (0,), 2: (0,)}
+
+
+def simulate(start, days=365, step_seconds=60, schedule_dates=None, max_violations=20):
+    """
+    start 부터 days 일 동안 step_seconds 간격으로 타이머 평가
+    Args:
+        start (datetime): 시작 시각
+        days (int): 시뮬레이션 기간 (일)
+        step_seconds (int): 평가 간격 (초)
+        schedule_dates (dict): 학사일정 (기본값 DEFAULT_SCHEDULE)
+        max_violations (int): 기록할 최대 위반 수
+    Returns:
+        dict: 평가 횟수, 소요 시간, 초당 평가 수, 기간 전환 목록, 불변식 위반 목록
+    """
+    schedule_dates = schedule_dates or DEFAULT_SCHEDULE
+    source = FixedTimeSource(start)
+    step = timedelta(seconds=step_seconds)
+    end = start + timedelta(days=days)
+    clocks = {}  # 연도별 타이머 (요청마다 새로 만드는 것과 같은 결과, 날짜 계산은 연도에만 의존)
+
+    evaluations = 0
+    flips = []
+    violations = []
+    prev_target = prev_remaining = prev_semester = None
+
+    def violate(current, message):
+        if len(violations) < max_violations:
+            violations.append(f"{current.isoformat()} {message}")
+
+    started = time.perf_counter()
+    current = start
+    while current < end:
+        source.set(current)
+        clock = clocks.get(current.year)
+        if clock is None:
+            clock = clocks[current.year] = HUFSClock(source, schedule_dates)
+        clock.check_period()
+        semester = clock.current_semester
+        target = clock.get_target_date(current)
+        days_left, hours, minutes, seconds, period_type = clock.get_remaining_time()
+        remaining = days_left * 86400 + hours * 3600 + minutes * 60 + seconds
+        evaluations += 1
+
+        if remaining < 0:
+            violate(current, f"남은 시간이 음수: {remaining}초 (목표 {target})")
+        if semester != 0 and not (period_type.startswith(f"{semester}학기") or period_type.startswith("종강!")):
+            violate(current, f"{semester}학기인데 기간 문구가 '{period_type}'")
+        if semester == 0 and not period_type.startswith("다음 학기개강"):
+            violate(current, f"방학인데 기간 문구가 '{period_type}'")
+
+        if prev_target is not None:
+            if target == prev_target:
+                if prev_remaining - remaining != step_seconds:
+                    violate(current, f"남은 시간이 {prev_remaining - remaining}초 줄어듦 (기대값 {step_seconds}초)")
+            elif semester == prev_semester:
+                violate(current, f"학기 변화 없이 목표 날짜가 {prev_target} -> {target} 로 바뀜")
+            if semester != prev_semester:
+                if semester not in NEXT_SEMESTER[prev_semester]:
+                    violate(current, f"잘못된 기간 전환 {prev_semester} -> {semester}")
+                flips.append((current.isoformat(), prev_semester, semester))
+
+        prev_target, prev_remaining, prev_semester = target, remaining, semester
+        current += step
+
+    elapsed = time.perf_counter() - started
+    return {
+        'evaluations': evaluations,
+        'elapsed_sec': round(elapsed, 3),
+        'evaluations_per_sec': round(evaluations / elapsed) if elapsed else 0,
+        'flips': flips,
+        'violations': violations
+    }
+
+
+def main():
+    """시뮬레이션 명령행 도구 (불변식 위반이 있으면 종료 코드 1)"""
+    parser = argparse.ArgumentParser(description='학사일정 타이머 1년 시뮬레이션')
+    parser.add_argument('--start', default=f"{datetime.now().year}-03-01",
+                        help='시작 날짜 YYYY-MM-DD (기본값: 올해 3월 1일)')
+    parser.add_argument('--days', type=int, default=365, help='시뮬레이션 기간 (일)')
+    parser.add_argument('--step', choices=STEPS, default='minute', help='평가 간격')
+    args = parser.parse_args()
+
+    result = simulate(datetime.fromisoformat(args.start), args.days, STEPS[args.step])
+    print(f"평가 {result['evaluations']:,}회, {result['elapsed_sec']}초 "
+          f"({result['evaluations_per_sec']:,} 평가/초)")
+    for at, before, after in result['flips']:
+        print(f"  기간 전환 {at}: {before} -> {after}")
+    if result['violations']:
+        print("불변식 위반:")
+        for violation in result['violations']:
+            print(f"  {violation}")
+        sys.exit(1)
+    print("불변식 위반 없음")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,399 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+import uuid
+from collections import deque
+from datetime import datetime
+
+from config import Config
+
+"""
+공지사항 키워드 구독
+- 구독(키워드, 전달 방식, 대상)과 전달 대기열(outbox)을 SQLite 에 저장해 워커 프로세스가 공유
+- 새 공지사항 제목은 모든 구독 키워드로 만든 Aho-Corasick 오토마톤을 한 번만 통과
+  (구독 수와 무관하게 제목 길이 + 일치 수에 비례)
+- 같은 구독에 같은 공지사항은 한 번만 대기열에 들어감
+- 구독은 대상(웹훅/이메일)이 확인 링크를 열어야 활성화되며, 확인 전에는 알림을 보내지 않음
+  (확인 메시지는 대상마다 SUBSCRIPTION_CONFIRM_RESEND 초에 한 번만 보냄)
+"""
+
+CHANNELS = ('webhook', 'email')
+
+
+def normalize_keyword(text):
+    """키워드/제목 비교용 정규화 (NFKC, 소문자)"""
+    return unicodedata.normalize('NFKC', text).lower()
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick 다중 패턴 오토마톤
+    - 키워드가 수만 개여도 텍스트를 한 글자씩 한 번만 읽어 포함된 키워드를 모두 찾음
+    """
+
+    def __init__(self, keywords):
+        """
+        Args:
+            keywords (iterable): 정규화된 키워드 목록
+        """
+        self._goto = [{}]    # 상태 -> {글자: 다음 상태}
+        self._fail = [0]     # 상태 -> 실패 시 이동할 상태
+        self._output = [()]  # 상태 -> 이 상태에서 끝나는 키워드들 (실패 링크 포함)
+        for keyword in set(keywords):
+            if keyword:
+                self._add(keyword)
+        self._build()
+
+    def _add(self, keyword):
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = next_state
+        self._output[state] = (keyword,)
+
+    def _build(self):
+        # 너비 우선으로 실패 링크 계산
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                if self._output[self._fail[next_state]]:
+                    self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def find(self, text):
+        """
+        텍스트에 포함된 키워드 찾기
+        Args:
+            text (str): 정규화된 텍스트
+        Returns:
+            set: 포함된 키워드
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        found = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
+
+    def __len__(self):
+        return len(self._goto)
+
+
+class SubscriptionStore:
+    """
+    구독/전달 대기열 저장소 (SQLite)
+    - 구독이 바뀔 때마다 PRAGMA user_version 을 올려 다른 프로세스가 오토마톤을 다시 만들도록 알림
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): SQLite 파일 경로
+        """
+        self.path = path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with self._conn() as conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS subscriptions ('
+                'id INTEGER PRIMARY KEY AUTOINCREMENT, '
+                'keyword TEXT NOT NULL, '
+                'channel TEXT NOT NULL, '
+                'target TEXT NOT NULL, '
+                'created TEXT NOT NULL, '
+                'confirm_token TEXT, '
+                'confirm_sent REAL, '
+                'confirmed TEXT, '
+                'UNIQUE (keyword, channel, target))'
+            )
+            columns = {row[1] for row in conn.execute('PRAGMA table_info(subscriptions)')}
+            for column, column_type in (('confirm_token', 'TEXT'), ('confirm_sent', 'REAL'), ('confirmed', 'TEXT')):
+                if column not in columns:  # 확인 절차가 없던 저장소 (기존 구독은 다시 확인 필요)
+                    conn.execute(f'ALTER TABLE subscriptions ADD COLUMN {column} {column_type}')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_subscriptions_token ON subscriptions (confirm_token)')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS deliveries ('
+                'id INTEGER PRIMARY KEY AUTOINCREMENT, '
+                'subscription_id INTEGER NOT NULL, '
+                'article_id INTEGER NOT NULL, '
+                'keyword TEXT NOT NULL, '
+                'notice TEXT NOT NULL, '
+                'queued TEXT NOT NULL, '
+                'claim TEXT, '
+                'claimed_at REAL, '
+                'attempts INTEGER NOT NULL DEFAULT 0, '
+                'sent TEXT, '
+                'UNIQUE (subscription_id, article_id))'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_deliveries_pending ON deliveries (sent, claimed_at)')
+
+    def _conn(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():  # fork 된 워커는 새로 연결
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _bump_version(self, conn):
+        version = conn.execute('PRAGMA user_version').fetchone()[0]
+        conn.execute(f'PRAGMA user_version = {version + 1}')
+
+    def version(self):
+        """구독 목록 버전 (추가/삭제할 때마다 증가)"""
+        return self._conn().execute('PRAGMA user_version').fetchone()[0]
+
+    def add(self, keyword, channel, target):
+        """
+        구독 추가 (확인 전 상태, 이미 있으면 기존 구독 번호 반환)
+        - 같은 대상의 확인 전 구독은 확인 토큰을 함께 써서 확인 링크 하나로 모두 활성화
+        - 확인 메시지는 대상마다 SUBSCRIPTION_CONFIRM_RESEND 초에 한 번만 보내도록 토큰 반환
+        Args:
+            keyword (str): 키워드 (정규화해서 저장)
+            channel (str): 'webhook' 또는 'email'
+            target (str): 웹훅 URL 또는 이메일 주소
+        Returns:
+            tuple: (구독 번호, 확인 여부, 지금 보내야 할 확인 토큰 또는 None)
+        """
+        keyword = normalize_keyword(keyword.strip())
+        now = time.time()
+        with self._conn() as conn:
+            row = conn.execute('SELECT id, confirmed FROM subscriptions WHERE keyword = ? AND channel = ? AND target = ?',
+                               (keyword, channel, target)).fetchone()
+            if row and row[1] is not None:
+                return row[0], True, None
+            pending = conn.execute(
+                'SELECT confirm_token, confirm_sent FROM subscriptions WHERE channel = ? AND target = ? '
+                'AND confirmed IS NULL AND confirm_token IS NOT NULL ORDER BY confirm_sent DESC LIMIT 1',
+                (channel, target)).fetchone()
+            token = pending[0] if pending else uuid.uuid4().hex
+            resend = not pending or (pending[1] or 0) < now - Config.SUBSCRIPTION_CONFIRM_RESEND
+            if row:
+                subscription_id = row[0]
+                conn.execute('UPDATE subscriptions SET confirm_token = ? WHERE id = ?', (token, subscription_id))
+            else:
+                subscription_id = conn.execute(
+                    'INSERT INTO subscriptions (keyword, channel, target, created, confirm_token) '
+                    'VALUES (?, ?, ?, ?, ?)',
+                    (keyword, channel, target, datetime.now().isoformat(timespec='seconds'), token)).lastrowid
+            if resend:
+                conn.execute('UPDATE subscriptions SET confirm_sent = ? WHERE confirm_token = ?', (now, token))
+            return subscription_id, False, token if resend else None
+
+    def confirm(self, token):
+        """
+        확인 토큰으로 구독 활성화 (같은 대상의 확인 전 구독 모두)
+        Returns:
+            int: 활성화된 구독 수
+        """
+        if not token:
+            return 0
+        with self._conn() as conn:
+            cursor = conn.execute(
+                'UPDATE subscriptions SET confirmed = ?, confirm_token = NULL '
+                'WHERE confirm_token = ? AND confirmed IS NULL',
+                (datetime.now().isoformat(timespec='seconds'), token))
+            if cursor.rowcount:
+                self._bump_version(conn)
+            return cursor.rowcount
+
+    def remove(self, subscription_id, target):
+        """
+        구독 삭제 (대상이 일치할 때만)
+        Returns:
+            bool: 삭제 여부
+        """
+        with self._conn() as conn:
+            cursor = conn.execute('DELETE FROM subscriptions WHERE id = ? AND target = ?',
+                                  (subscription_id, target))
+            if not cursor.rowcount:
+                return False
+            conn.execute('DELETE FROM deliveries WHERE subscription_id = ? AND sent IS NULL', (subscription_id,))
+            self._bump_version(conn)
+            return True
+
+    def keyword_subscriptions(self):
+        """
+        키워드별 구독 번호 (확인된 구독만)
+        Returns:
+            dict: 키워드 -> 구독 번호 목록
+        """
+        subscriptions = {}
+        for subscription_id, keyword in self._conn().execute(
+                'SELECT id, keyword FROM subscriptions WHERE confirmed IS NOT NULL'):
+            subscriptions.setdefault(keyword, []).append(subscription_id)
+        return subscriptions
+
+    def enqueue(self, matches):
+        """
+        전달 대기열에 추가 (같은 구독/공지사항은 한 번만)
+        Args:
+            matches (list): (구독 번호, 게시글 번호, 키워드, 공지사항 dict) 목록
+        Returns:
+            int: 새로 추가된 수
+        """
+        queued = datetime.now().isoformat(timespec='seconds')
+        with self._conn() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                'INSERT OR IGNORE INTO deliveries (subscription_id, article_id, keyword, notice, queued) '
+                'VALUES (?, ?, ?, ?, ?)',
+                [(subscription_id, article_id, keyword, json.dumps(notice, ensure_ascii=False), queued)
+                 for subscription_id, article_id, keyword, notice in matches])
+            return conn.total_changes - before
+
+    def claim(self, limit, stale_after=None):
+        """
+        보낼 항목 선점 (다른 프로세스와 겹치지 않도록 한 번의 UPDATE 로 표시)
+        - 선점 후 stale_after 초가 지나도 완료되지 않은 항목은 다시 선점 가능
+        Args:
+            limit (int): 최대 항목 수
+            stale_after (int): 선점 만료 시간 (초, 기본값 Config.NOTIFY_RETRY_SECONDS)
+        Returns:
+            tuple: (선점 토큰, [(id, channel, target, article_id, keyword, notice dict), ...])
+        """
+        token = uuid.uuid4().hex
+        now = time.time()
+        if stale_after is None:
+            stale_after = Config.NOTIFY_RETRY_SECONDS
+        with self._conn() as conn:
+            conn.execute(
+                'UPDATE deliveries SET claim = ?, claimed_at = ? WHERE id IN ('
+                'SELECT id FROM deliveries WHERE sent IS NULL AND attempts < ? '
+                'AND (claimed_at IS NULL OR claimed_at < ?) ORDER BY id LIMIT ?)',
+                (token, now, Config.NOTIFY_MAX_ATTEMPTS, now - stale_after, limit))
+            rows = conn.execute(
+                'SELECT d.id, s.channel, s.target, d.article_id, d.keyword, d.notice FROM deliveries d '
+                'JOIN subscriptions s ON s.id = d.subscription_id WHERE d.claim = ? ORDER BY d.id',
+                (token,)).fetchall()
+        return token, [row[:5] + (json.loads(row[5]),) for row in rows]
+
+    def mark_sent(self, delivery_ids):
+        with self._conn() as conn:
+            conn.executemany('UPDATE deliveries SET sent = ? WHERE id = ?',
+                             [(datetime.now().isoformat(timespec='seconds'), delivery_id)
+                              for delivery_id in delivery_ids])
+
+    def release(self, delivery_ids):
+        """
+        전달 실패한 항목의 시도 횟수 증가
+        - 선점 시각은 남겨 두어 선점 만료 시간이 지난 뒤 재시도 (NOTIFY_MAX_ATTEMPTS 회까지)
+        """
+        with self._conn() as conn:
+            conn.executemany('UPDATE deliveries SET claim = NULL, attempts = attempts + 1 '
+                             'WHERE id = ?', [(delivery_id,) for delivery_id in delivery_ids])
+
+    def has_pending(self):
+        """아직 전달하지 못한(재시도 남은) 항목이 있는지 여부"""
+        return self._conn().execute(
+            'SELECT 1 FROM deliveries WHERE sent IS NULL AND attempts < ? LIMIT 1',
+            (Config.NOTIFY_MAX_ATTEMPTS,)).fetchone() is not None
+
+    def get_stats(self):
+        """
+        구독/대기열 현황
+        Returns:
+            dict: 구독 수, 확인 전 구독 수, 대기 중, 전달 완료, 실패(재시도 소진) 수
+        """
+        conn = self._conn()
+        pending, sent, failed = conn.execute(
+            'SELECT SUM(sent IS NULL AND attempts < ?), SUM(sent IS NOT NULL), SUM(sent IS NULL AND attempts >= ?) '
+            'FROM deliveries', (Config.NOTIFY_MAX_ATTEMPTS, Config.NOTIFY_MAX_ATTEMPTS)).fetchone()
+        return {
+            'subscriptions': conn.execute('SELECT COUNT(*) FROM subscriptions').fetchone()[0],
+            'unconfirmed': conn.execute('SELECT COUNT(*) FROM subscriptions WHERE confirmed IS NULL').fetchone()[0],
+            'pending': pending or 0,
+            'sent': sent or 0,
+            'failed': failed or 0
+        }
+
+
+class SubscriptionMatcher:
+    """
+    새 공지사항과 구독 키워드 매칭
+    - 구독 목록 버전이 바뀌었을 때만 오토마톤을 다시 만듦
+    """
+
+    def __init__(self, store):
+        """
+        Args:
+            store (SubscriptionStore): 구독 저장소
+        """
+        self.store = store
+        self._lock = threading.Lock()
+        self._version = None
+        self._automaton = KeywordAutomaton(())
+        self._subscriptions = {}
+
+    def _refresh(self):
+        version = self.store.version()
+        if version != self._version:
+            self._subscriptions = self.store.keyword_subscriptions()
+            self._automaton = KeywordAutomaton(self._subscriptions)
+            self._version = version
+
+    def match(self, notices):
+        """
+        공지사항 제목과 구독 키워드 매칭
+        Args:
+            notices (list): (게시글 번호, 공지사항 dict) 목록
+        Returns:
+            list: (구독 번호, 게시글 번호, 키워드, 공지사항 dict) 목록
+        """
+        with self._lock:
+            self._refresh()
+            automaton, subscriptions = self._automaton, self._subscriptions
+        matches = []
+        for article_id, notice in notices:
+            for keyword in automaton.find(normalize_keyword(notice['title'])):
+                for subscription_id in subscriptions[keyword]:
+                    matches.append((subscription_id, article_id, keyword, notice))
+        return matches
+
+
+_store = None
+_matcher = None
+_store_lock = threading.Lock()
+
+
+def get_subscription_store():
+    """프로세스 공용 구독 저장소 반환"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                path = Config.SUBSCRIPTION_STORE_PATH
+                if not os.path.isabs(path):
+                    path = os.path.join(Config.BASE_DIR, path)
+                _store = SubscriptionStore(path)
+    return _store
+
+
+def get_subscription_matcher():
+    """프로세스 공용 구독 매칭기 반환"""
+    global _matcher
+    if _matcher is None:
+        store = get_subscription_store()
+        with _store_lock:
+            if _matcher is None:
+                _matcher = SubscriptionMatcher(store)
+    return _matcher
@@ -0,0 +1,189 @@
+import copy
+import json
+import re
+import threading
+
+from config import Config
+
+"""
+학교/캠퍼스(테넌트) 정의
+- 크롤링 대상 URL, 선택자, 학사일정 키워드를 Config.TENANTS 와 TENANTS_FILE(JSON)에서 읽음
+- 요청은 경로 접두사 -> 호스트 이름 -> 기본 테넌트 순으로 테넌트에 연결 (딕셔너리 조회라 테넌트 수와 무관)
+- 기본 테넌트는 캐시 분할 없이 기존 캐시 키를 그대로 사용
+"""
+
+TENANT_ID_PATTERN = re.compile(r'^[a-z0-9][a-z0-9_-]*$')
+SCHEDULE_FIELDS = ('first_start', 'first_end', 'second_start', 'second_end')
+# 공지사항 저장소/색인/구독과 학식 크롤러는 프로세스에 하나뿐이라 기본 테넌트만 사용 가능
+DEFAULT_ONLY_FEATURES = frozenset({'archive', 'meals'})
+
+# K2Web 게시판/학사일정 페이지의 기본 선택자 (다르면 테넌트 정의에서 덮어씀)
+NOTICE_DEFAULTS = {
+    'title_class': 'td-subject',
+    'date_class': 'td-date',
+    'writer_class': 'td-write',
+}
+SCHEDULE_DEFAULTS = {
+    'content_class': 'wrap-contents',
+    'date_class': 'list-date',
+    'event_class': 'list-content',
+}
+
+
+class Tenant:
+    """
+    테넌트 하나의 크롤링 설정
+    - notice: 공지사항 목록 URL, 링크 도메인, 행 안의 칸 클래스
+    - schedule: 학사일정 진입 URL, 학사일정 링크 선택자, 본문/날짜/일정 클래스, 항목별 키워드
+    - partition: 공용 캐시 분할 이름 (기본 테넌트는 None)
+    """
+
+    def __init__(self, tenant_id, definition, is_default=False):
+        """
+        Args:
+            tenant_id (str): 테넌트 ID (영문 소문자, 숫자, -, _)
+            definition (dict): Config.TENANTS 형식의 정의
+            is_default (bool): 기본 테넌트 여부
+        Raises:
+            ValueError: 필수 항목이 없거나 형식이 잘못된 경우, 기본 테넌트 전용 기능을 켠 경우
+        """
+        if not TENANT_ID_PATTERN.match(tenant_id):
+            raise ValueError(f"잘못된 테넌트 ID: {tenant_id!r}")
+        notice = definition.get('notice') or {}
+        schedule = definition.get('schedule') or {}
+        keywords = schedule.get('keywords') or {}
+        missing = [name for name, value in (('notice.url', notice.get('url')),
+                                            ('schedule.url', schedule.get('url')),
+                                            ('schedule.link_selector', schedule.get('link_selector')))
+                   if not value]
+        missing += [f"schedule.keywords.{field}" for field in SCHEDULE_FIELDS if not keywords.get(field)]
+        if missing:
+            raise ValueError(f"테넌트 {tenant_id} 정의에 필요한 항목이 없습니다: {', '.join(missing)}")
+
+        path_prefix = definition.get('path_prefix') or None
+        if path_prefix is not None and (not path_prefix.startswith('/') or '/' in path_prefix[1:]):
+            raise ValueError(f"테넌트 {tenant_id} 의 path_prefix 는 '/이름' 형식이어야 합니다")
+
+        features = frozenset(definition.get('features') or ())
+        default_only = sorted(features & DEFAULT_ONLY_FEATURES)
+        if default_only and not is_default:
+            raise ValueError(f"테넌트 {tenant_id} 에는 기본 테넌트 전용 기능을 켤 수 없습니다: {', '.join(default_only)}")
+
+        self.id = tenant_id
+        self.name = definition.get('name') or tenant_id
+        self.hosts = [host.lower() for host in definition.get('hosts') or []]
+        self.path_prefix = path_prefix
+        self.features = features
+        self.notice = dict(NOTICE_DEFAULTS, **notice)
+        self.schedule = dict(SCHEDULE_DEFAULTS, **schedule)
+        self.default_schedule = definition.get('default_schedule')
+        self.is_default = is_default
+        self.partition = None if is_default else tenant_id
+
+    def supports(self, feature):
+        """기능(archive, meals) 사용 여부"""
+        return feature in self.features
+
+    def __repr__(self):
+        return f"Tenant({self.id!r})"
+
+
+class TenantRegistry:
+    """테넌트 목록과 요청 -> 테넌트 연결"""
+
+    def __init__(self, definitions, default_id):
+        """
+        Args:
+            definitions (dict): 테넌트 ID -> 정의
+            default_id (str): 기본 테넌트 ID
+        Raises:
+            ValueError: 기본 테넌트가 없거나 호스트/경로 접두사가 겹치는 경우
+        """
+        if default_id not in definitions:
+            raise ValueError(f"기본 테넌트 {default_id} 가 정의되어 있지 않습니다")
+        self.tenants = {tenant_id: Tenant(tenant_id, definition, tenant_id == default_id)
+                        for tenant_id, definition in definitions.items()}
+        self.default = self.tenants[default_id]
+        self._by_host = {}
+        self._by_prefix = {}
+        for tenant in self.tenants.values():
+            for host in tenant.hosts:
+                if self._by_host.setdefault(host, tenant) is not tenant:
+                    raise ValueError(f"호스트 {host} 가 여러 테넌트에 지정되어 있습니다")
+            if tenant.path_prefix:
+                if self._by_prefix.setdefault(tenant.path_prefix, tenant) is not tenant:
+                    raise ValueError(f"경로 접두사 {tenant.path_prefix} 가 여러 테넌트에 지정되어 있습니다")
+
+    def get(self, tenant_id=None):
+        """
+        테넌트 조회
+        Args:
+            tenant_id (str): 테넌트 ID (기본값: 기본 테넌트)
+        Raises:
+            KeyError: 없는 테넌트
+        """
+        return self.default if tenant_id is None else self.tenants[tenant_id]
+
+    def resolve(self, host, path):
+        """
+        요청의 테넌트 결정
+        Args:
+            host (str): Host 헤더 (포트 포함 가능)
+            path (str): 요청 경로
+        Returns:
+            tuple: (테넌트, 일치한 경로 접두사 또는 '')
+        """
+        if self._by_prefix and path.startswith('/'):
+            end = path.find('/', 1)
+            segment = path if end == -1 else path[:end]
+            tenant = self._by_prefix.get(segment)
+            if tenant is not None:
+                return tenant, segment
+        if self._by_host and host:
+            tenant = self._by_host.get(host.rsplit(':', 1)[0].lower())
+            if tenant is not None:
+                return tenant, ''
+        return self.default, ''
+
+    def __iter__(self):
+        return iter(self.tenants.values())
+
+
+def load_definitions(config=Config):
+    """
+    Config.TENANTS 에 TENANTS_FILE(JSON) 의 정의를 더한 테넌트 정의
+    Returns:
+        dict: 테넌트 ID -> 정의
+    Raises:
+        ValueError: 파일을 읽을 수 없거나 JSON 형식이 잘못된 경우
+    """
+    definitions = copy.deepcopy(config.TENANTS)
+    if config.TENANTS_FILE:
+        try:
+            with open(config.TENANTS_FILE, 'r', encoding='utf-8') as f:
+                extra = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            raise ValueError(f"테넌트 정의 파일을 읽을 수 없습니다({config.TENANTS_FILE}): {e}") from e
+        if not isinstance(extra, dict):
+            raise ValueError("테넌트 정의 파일은 {테넌트 ID: 정의} 형식의 JSON 객체여야 합니다")
+        definitions.update(extra)
+    return definitions
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_tenants():
+    """프로세스 공용 테넌트 목록 반환 (최초 호출 시 설정/파일에서 읽음)"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = TenantRegistry(load_definitions(), Config.DEFAULT_TENANT)
+    return _registry
+
+
+def get_tenant(tenant_id=None):
+    """테넌트 조회 (기본값: 기본 테넌트)"""
+    return get_tenants().get(tenant_id)
@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta
+
+
+class SystemTimeSource:
+    """실제 시스템 시각"""
+
+    def now(self):
+        return datetime.now()
+
+
+class FixedTimeSource:
+    """
+    고정/수동 시각 (테스트, 시뮬레이션용)
+    - set() 또는 advance() 로만 시각이 바뀜
+    """
+
+    def __init__(self, current):
+        """
+        Args:
+            current (datetime): 초기 시각
+        """
+        self.current = current
+
+    def now(self):
+        return self.current
+
+    def set(self, current):
+        self.current = current
+
+    def advance(self, **kwargs):
+        """timedelta 인자만큼 시각 이동 (예: advance(minutes=1))"""
+        self.current += timedelta(**kwargs)
+        return self.current
+
+
+_time_source = SystemTimeSource()
+
+
+def get_time_source():
+    """HUFSClock 과 라우트가 사용하는 기본 시각 공급자"""
+    return _time_source
+
+
+def uses_system_time():
+    """기본 시각 공급자가 실제 시스템 시각인지 여부 (테스트/시뮬레이션 시각이면 False)"""
+    return isinstance(_time_source, SystemTimeSource)
+
+
+def set_time_source(time_source):
+    """
+    기본 시각 공급자 교체
+    Args:
+        time_source: now() 메서드를 가진 객체
+    Returns:
+        이전 시각 공급자
+    """
+    global _time_source
+    previous, _time_source = _time_source, time_source
+    return previous
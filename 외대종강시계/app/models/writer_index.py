@@ -0,0 +1,127 @@
+import heapq
+import threading
+from bisect import insort
+
+from app.models.notice_record import NoticeRecord
+from app.models.notice_store import get_notice_store
+
+"""
+작성자(부서) 역색인
+- 작성자 이름 -> 게시글 번호 목록(오름차순)으로 공지사항을 찾아 필터 조회가 결과 수에 비례
+- 공지사항은 NoticeRecord 로 보관 (작성자 문자열 공유, 링크는 번호만 보관)
+- 크롤링할 때마다 새로 본 공지사항만 반영하고, 다른 워커가 저장/수정한 공지사항은
+  조회 시 저장소의 변경 번호(seq) 기준으로 이어받음 (기존 게시글의 작성자/제목 변경 포함)
+"""
+
+
+class WriterIndex:
+    """공지사항 작성자 역색인 (프로세스 메모리)"""
+
+    def __init__(self, store=None):
+        """
+        Args:
+            store (NoticeStore): 색인을 채울 공지사항 저장소 (기본값 get_notice_store())
+        """
+        self.store = store
+        self._lock = threading.Lock()
+        self._postings = {}  # 작성자 -> 게시글 번호 정렬 리스트
+        self._notices = {}   # 게시글 번호 -> NoticeRecord
+        self._last_seq = -1  # 이어받은 마지막 변경 번호 (변경 번호가 없던 게시글은 0)
+
+    def _add(self, record):
+        """색인에 공지사항 하나 추가 (이미 있으면 작성자가 바뀐 경우 목록 이동)"""
+        article_id, writer = record.article_id, record.writer
+        previous = self._notices.get(article_id)
+        if previous is not None and previous.writer != writer:
+            postings = self._postings[previous.writer]
+            postings.remove(article_id)
+            if not postings:
+                del self._postings[previous.writer]
+        if previous is None or previous.writer != writer:
+            insort(self._postings.setdefault(writer, []), article_id)
+        self._notices[article_id] = record
+
+    def update(self, notices):
+        """
+        크롤링한 공지사항 반영
+        Args:
+            notices (list): date, title, writer, link (있으면 posted) 키를 가진 dict 목록
+        Returns:
+            int: 반영한 공지사항 수
+        """
+        added = 0
+        with self._lock:
+            for notice in notices:
+                record = NoticeRecord.from_notice(notice)
+                if record is None:
+                    continue
+                self._add(record)
+                added += 1
+        return added
+
+    def sync(self):
+        """
+        저장소에서 아직 반영하지 않은 추가/변경 게시글 이어받기 (마지막 변경 번호 이후만 조회)
+        Returns:
+            int: 새로 반영한 공지사항 수
+        """
+        store = self.store or get_notice_store()
+        with self._lock:
+            rows = store.changed_since(self._last_seq)
+            for seq, posted, date, title, writer, link in rows:
+                record = NoticeRecord.from_notice(
+                    {'date': date, 'title': title, 'writer': writer, 'link': link}, posted)
+                if record is not None:
+                    self._add(record)
+            if rows:
+                self._last_seq = rows[-1][0]
+            return len(rows)
+
+    def query(self, writers, limit=None):
+        """
+        작성자별 공지사항 조회 (최신 게시글부터)
+        Args:
+            writers (list): 작성자 이름 목록 (하나라도 일치하면 포함)
+            limit (int): 최대 개수 (기본값 전체)
+        Returns:
+            list: 공지사항 dict 목록
+        """
+        with self._lock:
+            lists = [self._postings[writer] for writer in set(writers) if writer in self._postings]
+            merged = heapq.merge(*(reversed(postings) for postings in lists), reverse=True)
+            notices = []
+            for article_id in merged:
+                if limit is not None and len(notices) >= limit:
+                    break
+                notices.append(self._notices[article_id].to_dict())
+            return notices
+
+    def facets(self):
+        """
+        작성자별 공지사항 수
+        Returns:
+            list: [{writer, count}, ...] (많은 순)
+        """
+        with self._lock:
+            counts = [(writer, len(postings)) for writer, postings in self._postings.items()]
+        counts.sort(key=lambda item: (-item[1], item[0]))
+        return [{'writer': writer, 'count': count} for writer, count in counts]
+
+    def __len__(self):
+        return len(self._notices)
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_writer_index():
+    """프로세스 공용 작성자 역색인 반환 (처음 호출 시 저장소 전체로 채움)"""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                index = WriterIndex()
+                index.sync()
+                _index = index
+    return _index
@@ -0,0 +1,282 @@
+import ipaddress
+import os
+import smtplib
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from email.message import EmailMessage
+from urllib.parse import urlsplit
+
+import requests
+from requests.exceptions import InvalidURL
+
+from app.models.notice_store import parse_link
+from app.models.subscriptions import get_subscription_matcher, get_subscription_store
+from config import Config
+
+"""
+키워드 구독 알림 전달
+- 크롤링으로 새로 저장된 공지사항을 구독과 매칭해 전달 대기열에 넣고 백그라운드에서 묶어서 전달
+- 전달 방식(sink)은 교체 가능: register_sink('webhook', MemorySink()) 처럼 로컬 대체물로 시험
+- 전달 실패 시 대기열에 남겨 NOTIFY_RETRY_SECONDS 뒤 타이머로 재시도 (NOTIFY_MAX_ATTEMPTS 회까지)
+  크롤링할 때마다 남은 항목이 있으면 전달을 예약하므로 재시작한 프로세스도 이어서 전달
+- 웹훅은 공인 주소로만 보냄 (등록할 때와 보낼 때 모두 DNS 결과 검사, 리다이렉트 따라가지 않음)
+"""
+
+
+def check_webhook_target(url):
+    """
+    웹훅 대상 URL 검사 (내부 서비스로 요청을 보내게 하는 SSRF 방지)
+    - http(s) URL 이고 호스트의 모든 DNS 결과가 공인 주소여야 함
+      (loopback, 사설, link-local, 예약, 멀티캐스트 주소 거부)
+    Args:
+        url (str): 웹훅 URL
+    Raises:
+        InvalidURL: 허용되지 않는 대상 (ValueError, requests.RequestException 의 하위 클래스)
+    """
+    parsed = urlsplit(url)
+    if parsed.scheme not in ('http', 'https') or not parsed.hostname:
+        raise InvalidURL('웹훅 대상은 http(s) URL 이어야 합니다')
+    try:
+        port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+        infos = socket.getaddrinfo(parsed.hostname, port, proto=socket.IPPROTO_TCP)
+    except (OSError, UnicodeError, ValueError):
+        raise InvalidURL('웹훅 대상 호스트를 찾을 수 없습니다')
+    for *_, sockaddr in infos:
+        address = ipaddress.ip_address(sockaddr[0].split('%', 1)[0])
+        if getattr(address, 'ipv4_mapped', None):
+            address = address.ipv4_mapped
+        if not address.is_global or address.is_multicast:
+            raise InvalidURL('내부 네트워크 주소로는 웹훅을 보낼 수 없습니다')
+
+
+class WebhookSink:
+    """웹훅 URL 로 JSON POST (대상당 요청 한 번에 공지사항 여러 개)"""
+
+    def send(self, target, items):
+        """
+        Args:
+            target (str): 웹훅 URL
+            items (list): [{keywords, notice}, ...]
+        Raises:
+            requests.RequestException: 전달 실패 (허용되지 않는 대상 포함)
+        """
+        self._post(target, {'notices': items})
+
+    def send_confirmation(self, target, confirm_url):
+        """구독 확인 요청 전달 (대상이 confirm_url 을 열면 구독 활성화)"""
+        self._post(target, {'confirm_url': confirm_url})
+
+    def _post(self, target, payload):
+        check_webhook_target(target)  # 등록 뒤 DNS 가 바뀌었을 수 있으므로 보낼 때마다 검사
+        response = requests.post(target, json=payload, timeout=Config.REQUEST_TIMEOUT, allow_redirects=False)
+        response.raise_for_status()
+
+
+class SMTPSink:
+    """SMTP 메일 전달 (받는 사람당 메일 한 통에 공지사항 여러 개)"""
+
+    def __init__(self, host=None, port=None, sender=None):
+        """
+        Args:
+            host (str): SMTP 서버 (기본값 Config.SMTP_HOST)
+            port (int): SMTP 포트 (기본값 Config.SMTP_PORT)
+            sender (str): 보내는 사람 주소 (기본값 Config.SMTP_SENDER)
+        """
+        self.host = host or Config.SMTP_HOST
+        self.port = port or Config.SMTP_PORT
+        self.sender = sender or Config.SMTP_SENDER
+
+    def send(self, target, items):
+        """
+        Args:
+            target (str): 받는 사람 주소
+            items (list): [{keywords, notice}, ...]
+        Raises:
+            smtplib.SMTPException, OSError: 전달 실패
+        """
+        message = EmailMessage()
+        message['Subject'] = f"[HUFS 공지] 구독 키워드 공지사항 {len(items)}건"
+        message['From'] = self.sender
+        message['To'] = target
+        message.set_content('\n\n'.join(
+            f"[{', '.join(item['keywords'])}] {item['notice']['title']}\n{item['notice']['link']}" for item in items))
+        self._send(message)
+
+    def send_confirmation(self, target, confirm_url):
+        """구독 확인 메일 전달 (받는 사람이 링크를 열면 구독 활성화)"""
+        message = EmailMessage()
+        message['Subject'] = "[HUFS 공지] 키워드 구독 확인"
+        message['From'] = self.sender
+        message['To'] = target
+        message.set_content("공지사항 키워드 구독을 신청하셨다면 아래 링크를 열어 확인해 주세요.\n"
+                            "신청하지 않으셨다면 이 메일을 무시하시면 됩니다.\n\n"
+                            f"{confirm_url}")
+        self._send(message)
+
+    def _send(self, message):
+        with smtplib.SMTP(self.host, self.port, timeout=Config.REQUEST_TIMEOUT) as smtp:
+            smtp.send_message(message)
+
+
+class MemorySink:
+    """전달 내용을 메모리에 보관 (로컬 시험용 대체물)"""
+
+    def __init__(self):
+        self.sent = []           # [(대상, items), ...]
+        self.confirmations = []  # [(대상, 확인 URL), ...]
+
+    def send(self, target, items):
+        self.sent.append((target, items))
+
+    def send_confirmation(self, target, confirm_url):
+        self.confirmations.append((target, confirm_url))
+
+
+_sinks = {}
+_executor = None
+_executor_pid = None
+_flush_lock = threading.Lock()
+_flush_pending = False
+_retry_timer = None
+
+
+def get_sink(channel):
+    """전달 방식별 sink 반환 (등록된 것이 없으면 기본 webhook/SMTP)"""
+    if channel not in _sinks:
+        _sinks[channel] = WebhookSink() if channel == 'webhook' else SMTPSink()
+    return _sinks[channel]
+
+
+def register_sink(channel, sink):
+    """
+    전달 방식 교체
+    Args:
+        channel (str): 'webhook' 또는 'email'
+        sink: send(target, items) 메서드를 가진 객체
+    """
+    _sinks[channel] = sink
+
+
+def notify_new_notices(records, new_ids):
+    """
+    새로 저장된 공지사항을 구독과 매칭해 대기열에 넣고 전달 예약
+    Args:
+        records (list): 크롤링한 공지사항 dict 목록
+        new_ids (list): 저장소에 새로 추가된 게시글 번호 (NoticeStore.upsert_many 결과)
+    Returns:
+        int: 새로 대기열에 들어간 수
+    """
+    store = get_subscription_store()
+    queued = 0
+    if new_ids:
+        new_ids = set(new_ids)
+        notices = []
+        for record in records:
+            parsed = parse_link(record.get('link'))
+            if parsed and parsed[2] in new_ids:
+                notices.append((parsed[2], {field: record[field] for field in ('date', 'title', 'writer', 'link')}))
+        matches = get_subscription_matcher().match(notices)
+        queued = store.enqueue(matches) if matches else 0
+    if queued or store.has_pending():
+        schedule_flush()
+    return queued
+
+
+def flush(batch_size=None):
+    """
+    대기열을 대상별로 묶어 전달 (대기열이 빌 때까지 batch_size 개씩 반복)
+    - 한 대상의 여러 키워드에 걸린 공지사항은 키워드를 모아 한 항목으로 전달
+    Args:
+        batch_size (int): 한 번에 선점할 항목 수 (기본값 Config.NOTIFY_BATCH_SIZE)
+    Returns:
+        dict: 전달 성공/실패 항목 수
+    """
+    store = get_subscription_store()
+    result = {'sent': 0, 'failed': 0}
+    while True:
+        _, rows = store.claim(batch_size or Config.NOTIFY_BATCH_SIZE)
+        if not rows:
+            return result
+        batches = {}  # (전달 방식, 대상) -> ([delivery id], {게시글 번호: item})
+        for delivery_id, channel, target, article_id, keyword, notice in rows:
+            delivery_ids, items = batches.setdefault((channel, target), ([], {}))
+            delivery_ids.append(delivery_id)
+            items.setdefault(article_id, {'keywords': [], 'notice': notice})['keywords'].append(keyword)
+        for (channel, target), (delivery_ids, items) in batches.items():
+            try:
+                get_sink(channel).send(target, list(items.values()))
+            except (requests.RequestException, smtplib.SMTPException, OSError) as e:
+                print(f"구독 알림 전달 실패({channel} {target}): {e}")
+                store.release(delivery_ids)
+                result['failed'] += len(delivery_ids)
+                continue
+            store.mark_sent(delivery_ids)
+            result['sent'] += len(delivery_ids)
+
+
+def _get_executor():
+    # _flush_lock 을 잡은 상태에서 호출
+    global _executor, _executor_pid
+    if _executor is None or _executor_pid != os.getpid():  # fork 된 워커는 새 스레드 사용
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='hufs-notify')
+        _executor_pid = os.getpid()
+    return _executor
+
+
+def schedule_flush():
+    """백그라운드 스레드에서 flush() 실행 (이미 예약되어 있으면 새로 예약하지 않음)"""
+    global _flush_pending
+    with _flush_lock:
+        if _flush_pending:
+            return
+        executor = _get_executor()
+        _flush_pending = True
+    executor.submit(_run_flush)
+
+
+def send_confirmation(channel, target, confirm_url):
+    """
+    구독 확인 메시지를 백그라운드 스레드에서 전달 (요청 처리를 막지 않음)
+    Args:
+        channel (str): 'webhook' 또는 'email'
+        target (str): 웹훅 URL 또는 이메일 주소
+        confirm_url (str): 구독 확인 링크
+    """
+    with _flush_lock:
+        executor = _get_executor()
+    executor.submit(_run_confirmation, channel, target, confirm_url)
+
+
+def _run_confirmation(channel, target, confirm_url):
+    try:
+        get_sink(channel).send_confirmation(target, confirm_url)
+    except (requests.RequestException, smtplib.SMTPException, OSError) as e:
+        print(f"구독 확인 메시지 전달 실패({channel} {target}): {e}")
+
+
+def _schedule_retry():
+    """
+    NOTIFY_RETRY_SECONDS 뒤 flush() 다시 예약 (선점 만료를 기다리는 항목용, 타이머는 하나만)
+    """
+    global _retry_timer
+    with _flush_lock:
+        if _retry_timer is not None and _retry_timer.is_alive():  # fork 된 워커에서는 살아 있지 않음
+            return
+        # 선점 만료 시각이 지난 뒤 실행되도록 1초 여유
+        _retry_timer = threading.Timer(Config.NOTIFY_RETRY_SECONDS + 1, schedule_flush)
+        _retry_timer.daemon = True
+        _retry_timer.start()
+
+
+def _run_flush():
+    global _flush_pending
+    with _flush_lock:
+        _flush_pending = False
+    try:
+        flush()
+        if get_subscription_store().has_pending():
+            _schedule_retry()
+    except Exception as e:
+        print(f"구독 알림 전달 중 오류: {e}")
+        _schedule_retry()
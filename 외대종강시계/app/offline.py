@@ -0,0 +1,100 @@
+import hashlib
+import os
+import re
+from functools import lru_cache
+
+from config import Config
+
+"""
+오프라인 지원(서비스 워커, 웹 앱 매니페스트)
+- 앱 셸(CSS, JS, 이미지) 목록과 내용 해시로 버전 생성
+- 정적 파일이 바뀌면 버전이 바뀌어 브라우저 캐시가 교체됨
+"""
+
+IMPORT_PATTERN = re.compile(r"@import\s+(?:url\()?['\"]?([^'\")]+)['\"]?\)?")
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp', '.svg')
+
+
+def _main_css_imports():
+    """main.css 가 @import 하는 스타일시트 경로 목록"""
+    main_css = os.path.join(Config.STATIC_FOLDER, 'css', 'main.css')
+    try:
+        with open(main_css, encoding='utf-8') as f:
+            return ['css/' + path for path in IMPORT_PATTERN.findall(f.read())]
+    except FileNotFoundError:
+        return []
+
+
+@lru_cache(maxsize=1)
+def get_app_shell():
+    """
+    앱 셸 구성 파일과 버전 계산 (프로세스당 한 번)
+    Returns:
+        tuple: (버전 문자열, 정적 파일 상대 경로 목록)
+    """
+    paths = ['css/main.css', 'js/script.js'] + _main_css_imports()
+    images_dir = os.path.join(Config.STATIC_FOLDER, 'images')
+    if os.path.isdir(images_dir):
+        paths += ['images/' + name for name in sorted(os.listdir(images_dir))
+                  if name.lower().endswith(IMAGE_EXTENSIONS)]
+
+    digest = hashlib.sha1()
+    existing = []
+    for path in paths:
+        file_path = os.path.join(Config.STATIC_FOLDER, path)
+        if not os.path.exists(file_path):
+            continue
+        existing.append(path)
+        digest.update(path.encode('utf-8'))
+        with open(file_path, 'rb') as f:
+            digest.update(f.read())
+    sw_template = os.path.join(Config.TEMPLATE_FOLDER, 'sw.js')
+    if os.path.exists(sw_template):
+        with open(sw_template, 'rb') as f:
+            digest.update(f.read())
+
+    return digest.hexdigest()[:12], existing
+
+
+def get_asset_version():
+    """템플릿의 정적 파일 URL 에 붙이는 버전"""
+    return get_app_shell()[0]
+
+
+def get_precache_urls():
+    """
+    서비스 워커가 설치 시 미리 받아둘 URL 목록
+    - main.css, script.js 는 템플릿과 같은 버전 쿼리를 붙임
+    """
+    version, paths = get_app_shell()
+    versioned = {'css/main.css', 'js/script.js'}
+    urls = []
+    for path in paths:
+        url = '/static/' + path
+        urls.append(f"{url}?v={version}" if path in versioned else url)
+    return urls + ['/hufs_icon.svg', '/manifest.webmanifest']
+
+
+def build_manifest(name='HUFS'):
+    """
+    웹 앱 매니페스트 생성
+    - start_url, scope, 아이콘은 매니페스트 URL 기준 상대 경로 (경로 접두사 테넌트도 같은 내용)
+    Args:
+        name (str): 테넌트 이름
+    Returns:
+        dict: manifest.webmanifest 내용
+    """
+    return {
+        'name': f'{name} 종강시계',
+        'short_name': '종강시계',
+        'start_url': './',
+        'scope': './',
+        'display': 'standalone',
+        'background_color': '#000000',
+        'theme_color': '#002d56',
+        'icons': [{
+            'src': 'hufs_icon.svg',
+            'sizes': 'any',
+            'type': 'image/svg+xml'
+        }]
+    }
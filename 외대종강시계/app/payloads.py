@@ -0,0 +1,202 @@
+import time
+
+from app.cache import cached
+from app import models
+from app.models.timesource import get_time_source
+from app.models.search_index import get_search_index
+from app.models.writer_index import get_writer_index
+from app.profiling import span
+from config import Config
+
+"""
+API 응답 데이터 생성 함수
+- Flask 라우트(WSGI)와 비동기 서버(ASGI)가 같은 JSON 구조를 쓰도록 공유
+"""
+
+
+def build_update_payload(tenant=None):
+    """
+    /update 응답 생성
+    Args:
+        tenant (Tenant): 요청의 테넌트 (기본값: 기본 테넌트)
+    Returns:
+        dict: 남은 시간, 기간 타입, 현재 시각
+    """
+    with span('clock.init'):
+        clock = models.HUFSClock(tenant=tenant)
+    days, hours, minutes, seconds, period_type = clock.get_remaining_time()
+    current_time = get_time_source().now().strftime('%Y-%m-%d %H:%M:%S')
+
+    return {
+        'days': days,
+        'hours': hours,
+        'minutes': minutes,
+        'seconds': seconds,
+        'period_type': period_type,
+        'current_time': current_time
+    }
+
+
+NOTICE_FIELDS = ['date', 'title', 'writer', 'link']
+WRITER_FEED_LIMIT = 100  # 작성자 필터 응답의 기본 최대 공지사항 수
+
+
+def parse_writer_filter(values):
+    """
+    writer 쿼리 값 목록을 작성자 이름 목록으로 변환
+    - writer=A&writer=B 와 writer=A,B 모두 지원
+    Args:
+        values (list): 쿼리 문자열의 writer 값들
+    Returns:
+        list: 중복 없는 작성자 이름 목록 (없으면 빈 리스트)
+    """
+    writers = []
+    for value in values:
+        for writer in value.split(','):
+            writer = writer.strip()
+            if writer and writer not in writers:
+                writers.append(writer)
+    return writers
+
+
+def build_notices_payload(use_cache=False, compact=False, writers=None, limit=WRITER_FEED_LIMIT, tenant=None):
+    """
+    /notices 응답 생성 (공지사항 크롤링 포함)
+    Args:
+        use_cache (bool): 유효한 캐시가 있으면 크롤링 생략
+        compact (bool): True 면 공지사항을 필드 이름 없는 배열로 반환
+            {fields: [date, title, writer, link], notices: [[...], ...]}
+        writers (list): 작성자 필터 (지정하면 저장소 전체에서 작성자 색인으로 조회, 최신순)
+            저장소를 쓰지 않는 테넌트는 현재 목록에서만 거름
+        limit (int): 작성자 필터 응답의 최대 공지사항 수
+        tenant (Tenant): 요청의 테넌트 (기본값: 기본 테넌트)
+    Returns:
+        dict: 공지사항 목록과 갱신 시각
+    """
+    notice_crawler = models.HUFSNoticeCrawler(tenant)
+    if writers and not notice_crawler.tenant.supports('archive'):
+        wanted = set(writers)
+        notices = [notice for notice in notice_crawler.get_notices(use_cache=True)
+                   if notice['writer'] in wanted][:limit]
+    elif writers:
+        # 필터 조회는 캐시가 유효하면 크롤링 없이 색인만 사용
+        notice_crawler.get_notices(use_cache=True)
+        index = get_writer_index()
+        index.sync()
+        notices = index.query(writers, limit=limit)
+    else:
+        notices = notice_crawler.get_notices(use_cache=use_cache)
+    last_update = get_time_source().now().strftime('%Y.%m.%d %H:%M:%S')
+
+    if compact:
+        return {
+            'fields': NOTICE_FIELDS,
+            'notices': [[notice[field] for field in NOTICE_FIELDS] for notice in notices],
+            'last_update': last_update
+        }
+
+    return {
+        'notices': notices,
+        'last_update': last_update
+    }
+
+
+def build_writers_payload():
+    """
+    /notices/writers 응답 생성
+    Returns:
+        dict: 작성자별 공지사항 수 (많은 순)
+    """
+    index = get_writer_index()
+    index.sync()
+    return {'writers': index.facets()}
+
+
+def build_search_payload(query, limit=None):
+    """
+    /notices/search 응답 생성
+    Args:
+        query (str): 검색어
+        limit (int): 최대 결과 수 (기본값 Config.SEARCH_RESULT_LIMIT)
+    Returns:
+        dict: 검색어, 결과 목록(점수 높은 순), 검색 소요 시간(ms)
+    """
+    index = get_search_index()
+    index.sync()
+    started = time.perf_counter()
+    results = index.search(query, limit=limit or Config.SEARCH_RESULT_LIMIT)
+    return {
+        'query': query,
+        'results': results,
+        'took_ms': round((time.perf_counter() - started) * 1000, 2)
+    }
+
+
+def build_meals_today_payload():
+    """
+    /meals/today 응답 생성 (주간 메뉴 캐시에서 오늘 분량만)
+    Returns:
+        dict: 날짜, 현재 식사 구간, 식당별 오늘 메뉴, 다음 식사 구간 경계(valid_until)
+    """
+    payload, valid_until = models.crawler.HUFSMealCrawler().get_today()
+    payload['valid_until'] = valid_until.isoformat(timespec='seconds')
+    return payload
+
+
+def build_meals_week_payload():
+    """
+    /meals/week 응답 생성
+    Returns:
+        dict: ISO 주차, 시작/종료일, 식당별 날짜별 메뉴, 다음 식사 구간 경계(valid_until)
+    """
+    from app.models.crawler.meal import meal_period
+
+    payload = dict(models.crawler.HUFSMealCrawler().get_week())
+    payload['valid_until'] = meal_period(get_time_source().now())[1].isoformat(timespec='seconds')
+    return payload
+
+
+@cached('schedule_payload', time_dependent=True)
+def build_schedule_payload(tenant=None):
+    """
+    /schedule 응답 생성 (테넌트의 캐시 분할에 CACHE_DEFAULT_TIMEOUT 동안 보관, 시각 공급자를 바꾸면 매번 계산)
+    Returns:
+        dict: 학기 여부, 현재 학기, 종강일 또는 다음 개강일
+    """
+    with span('clock.init'):
+        clock = models.HUFSClock(tenant=tenant)
+    current_semester = clock.current_semester
+    is_semester = clock.is_semester
+
+    response = {
+        'is_semester': is_semester,
+        'current_semester': current_semester
+    }
+
+    if is_semester:
+        if current_semester == 1:
+            response['end_date'] = clock.first_semester_end.strftime('%Y년 %m월 %d일')
+        else:
+            response['end_date'] = clock.second_semester_end.strftime('%Y년 %m월 %d일')
+    else:
+        if current_semester == 0:  # 방학 중 (겨울방학이면 다음 해 1학기, 여름방학이면 2학기 개강일)
+            response['next_start_date'] = clock.get_target_date().strftime('%Y년 %m월 %d일')
+
+    return response
+
+
+@cached('timeline_payload', time_dependent=True)
+def build_timeline_payload(tenant=None):
+    """
+    /timeline 응답 생성 (브라우저가 오프라인에서 남은 시간을 직접 계산할 때 사용)
+    Returns:
+        dict: 각 학기 시작/종료 일시 (ISO 형식)
+    """
+    with span('clock.init'):
+        clock = models.HUFSClock(tenant=tenant)
+    return {
+        'first_start': clock.first_semester_start.isoformat(),
+        'first_end': clock.first_semester_end.isoformat(),
+        'second_start': clock.second_semester_start.isoformat(),
+        'second_end': clock.second_semester_end.isoformat()
+    }
@@ -0,0 +1,361 @@
+import cProfile
+import itertools
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+from flask import abort, g, jsonify, request
+
+from config import Config
+
+"""
+요청/크롤링 프로파일링
+- 기본은 꺼져 있으며, 꺼져 있을 때 span()/profiled() 는 아무 일도 하지 않음
+- 켜면 일부 요청(비율 또는 특정 경로)에 대해
+    cProfile 통계(.prof)와 flamegraph 용 collapsed stack(.folded)을 디렉터리에 저장
+- 실행 중에 /debug/profiling 으로 설정 변경 (PROFILING_TOKEN 필요)
+- 크롤링은 공용 작업 풀 스레드에서 실행되므로 크롤링 구간(notice.fetch 등)은 구간 통계에만 쌓이고
+  요청 프로파일에는 결과를 기다린 시간만 남음 (크롤링 자체는 profiled() 가 따로 저장)
+"""
+
+
+class _NullSpan:
+    """비활성 상태에서 반환되는 빈 컨텍스트 매니저"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+_active = False  # span 기록 여부 (요청 또는 크롤링 프로파일링이 켜져 있을 때만 True)
+
+
+class ProfilerSettings:
+    """
+    프로파일러 실행 설정
+    - sample_rate: 프로파일링할 요청 비율 (0.0 ~ 1.0)
+    - route: 지정 시 해당 경로(또는 엔드포인트 이름) 요청만 프로파일링
+    - crawls: 크롤링 실행도 프로파일링할지 여부
+    """
+
+    def __init__(self):
+        self.sample_rate = Config.PROFILING_SAMPLE_RATE
+        self.route = Config.PROFILING_ROUTE
+        self.crawls = Config.PROFILING_CRAWLS
+        self.output_dir = Config.PROFILING_DIR
+        self.interval = Config.PROFILING_INTERVAL
+
+    @property
+    def requests_enabled(self):
+        return self.sample_rate > 0
+
+    def as_dict(self):
+        return {
+            'sample_rate': self.sample_rate,
+            'route': self.route,
+            'crawls': self.crawls,
+            'output_dir': self.output_dir,
+            'interval': self.interval
+        }
+
+
+settings = ProfilerSettings()
+_span_stats = {}
+_span_lock = threading.Lock()
+
+
+def _parse_rate(value):
+    if isinstance(value, bool):
+        raise ValueError("sample_rate 는 0 ~ 1 사이의 숫자여야 합니다")
+    try:
+        rate = float(value)
+    except (TypeError, ValueError):
+        raise ValueError("sample_rate 는 0 ~ 1 사이의 숫자여야 합니다") from None
+    if not 0.0 <= rate <= 1.0:  # NaN 도 여기서 거절
+        raise ValueError("sample_rate 는 0 ~ 1 사이의 숫자여야 합니다")
+    return rate
+
+
+def _parse_route(value):
+    if value is None or value == '':
+        return None
+    if not isinstance(value, str):
+        raise ValueError("route 는 문자열 또는 null 이어야 합니다")
+    return value
+
+
+def _parse_flag(value):
+    if isinstance(value, bool):
+        return value
+    if value in (0, 1):
+        return bool(value)
+    if isinstance(value, str) and value.lower() in ('true', 'false', '1', '0'):
+        return value.lower() in ('true', '1')
+    raise ValueError("crawls 는 true/false 여야 합니다")
+
+
+def _parse_output_dir(value):
+    if not isinstance(value, str) or not value:
+        raise ValueError("output_dir 는 비어 있지 않은 문자열이어야 합니다")
+    return value
+
+
+def _parse_interval(value):
+    try:
+        interval = float(value)
+    except (TypeError, ValueError):
+        raise ValueError("interval 은 양수여야 합니다") from None
+    if isinstance(value, bool) or not interval > 0:
+        raise ValueError("interval 은 양수여야 합니다")
+    return interval
+
+
+# 옵션 이름 -> 값 변환/검사 함수 (잘못된 값이면 ValueError)
+_OPTION_PARSERS = {
+    'sample_rate': _parse_rate,
+    'route': _parse_route,
+    'crawls': _parse_flag,
+    'output_dir': _parse_output_dir,
+    'interval': _parse_interval,
+}
+
+
+def configure(**options):
+    """
+    실행 중 프로파일러 설정 변경
+    - 모든 값을 먼저 검사하고, 하나라도 잘못되면 아무것도 바꾸지 않음
+    Args:
+        sample_rate (float), route (str), crawls (bool), output_dir (str), interval (float)
+    Raises:
+        ValueError: 알 수 없는 옵션이거나 값이 잘못된 경우
+    """
+    global _active
+    parsed = {}
+    for name, value in options.items():
+        parser = _OPTION_PARSERS.get(name)
+        if parser is None:
+            raise ValueError(f"알 수 없는 프로파일링 옵션: {name}")
+        parsed[name] = parser(value)
+    for name, value in parsed.items():
+        setattr(settings, name, value)
+    _active = settings.requests_enabled or settings.crawls
+
+
+class _Span:
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        with _span_lock:
+            stat = _span_stats.get(self.name)
+            if stat is None:
+                stat = _span_stats[self.name] = [0, 0.0, 0.0]
+            stat[0] += 1
+            stat[1] += elapsed
+            stat[2] = max(stat[2], elapsed)
+        spans = getattr(_local, 'spans', None)
+        if spans is not None:
+            spans.append((self.name, elapsed))
+        return False
+
+
+_local = threading.local()
+_sequence = itertools.count(1)
+
+
+def span(name):
+    """
+    구간 실행 시간 측정
+    - 프로파일링이 꺼져 있으면 공유된 빈 컨텍스트를 반환 (추가 비용 없음)
+    사용 예:
+        with span('clock.init'):
+            clock = HUFSClock()
+    """
+    if not _active:
+        return _NULL_SPAN
+    return _Span(name)
+
+
+def get_span_stats():
+    """
+    구간별 누적 실행 시간
+    Returns:
+        dict: {구간 이름: {count, total_ms, avg_ms, max_ms}}
+    """
+    with _span_lock:
+        return {
+            name: {
+                'count': count,
+                'total_ms': round(total * 1000, 3),
+                'avg_ms': round(total * 1000 / count, 3),
+                'max_ms': round(peak * 1000, 3)
+            }
+            for name, (count, total, peak) in _span_stats.items()
+        }
+
+
+class _StackSampler(threading.Thread):
+    """
+    대상 스레드의 호출 스택을 주기적으로 수집
+    - 결과는 collapsed stack 형식 (flamegraph.pl, speedscope 입력용)
+    """
+
+    def __init__(self, thread_id, interval):
+        super().__init__(daemon=True, name='hufs-stack-sampler')
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+
+class _ProfileSession:
+    """cProfile 과 스택 샘플러를 함께 실행하고 결과를 파일로 저장"""
+
+    def __init__(self, label):
+        self.label = ''.join(c if c.isalnum() or c in '-_' else '_' for c in label)
+        self.profile = cProfile.Profile()
+        self.sampler = _StackSampler(threading.get_ident(), settings.interval)
+        self.start = time.perf_counter()
+        self.profiling = False
+
+    def begin(self):
+        _local.session = self
+        _local.spans = []
+        try:
+            self.profile.enable()
+            self.profiling = True
+        except ValueError:  # 다른 프로파일러가 이미 실행 중 (Python 3.12+)
+            pass
+        self.sampler.start()
+
+    def end(self):
+        if self.profiling:
+            self.profile.disable()
+        self.sampler.stop()
+        elapsed = time.perf_counter() - self.start
+        spans = getattr(_local, 'spans', None) or []
+        _local.spans = None
+        _local.session = None
+
+        output_dir = settings.output_dir
+        if not os.path.isabs(output_dir):
+            output_dir = os.path.join(Config.BASE_DIR, output_dir)
+        os.makedirs(output_dir, exist_ok=True)
+        base = os.path.join(output_dir, f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{next(_sequence)}-{self.label}")
+
+        try:
+            if self.profiling:
+                self.profile.dump_stats(base + '.prof')
+            with open(base + '.folded', 'w', encoding='utf-8') as f:
+                for stack, count in self.sampler.stacks.most_common():
+                    f.write(f"{stack} {count}\n")
+            with open(base + '.spans.json', 'w', encoding='utf-8') as f:
+                json.dump({
+                    'label': self.label,
+                    'elapsed_ms': round(elapsed * 1000, 3),
+                    'spans': [{'name': name, 'ms': round(sec * 1000, 3)} for name, sec in spans]
+                }, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            print(f"프로파일 저장 실패: {e}")
+
+
+@contextmanager
+def _profile_block(label):
+    if getattr(_local, 'session', None) is not None:
+        # 이미 프로파일링 중인 요청 안의 크롤링은 바깥 세션에 포함 (cProfile/span 목록을 덮어쓰지 않음)
+        yield
+        return
+    session = _ProfileSession(label)
+    session.begin()
+    try:
+        yield
+    finally:
+        session.end()
+
+
+def profiled(label):
+    """
+    크롤링 등 요청 밖 작업을 프로파일링
+    - settings.crawls 가 꺼져 있으면 빈 컨텍스트 반환
+    - 같은 스레드에서 이미 세션이 실행 중이면 새 세션을 만들지 않음
+      (크롤링은 공용 작업 풀 스레드에서 실행되므로 보통 요청 세션과 따로 저장됨)
+    """
+    if not settings.crawls:
+        return _NULL_SPAN
+    return _profile_block(label)
+
+
+def _should_profile():
+    if not settings.requests_enabled:
+        return False
+    if settings.route and settings.route not in (request.path, request.endpoint):
+        return False
+    return random.random() < settings.sample_rate
+
+
+def init_profiling(app):
+    """
+    Flask 앱에 요청 프로파일링 훅과 설정 API 등록
+    Args:
+        app (Flask): 대상 애플리케이션
+    """
+    configure()
+
+    @app.before_request
+    def start_request_profile():
+        if settings.requests_enabled and _should_profile():
+            g.profile_session = _ProfileSession(f"{request.endpoint or 'unknown'}")
+            g.profile_session.begin()
+
+    @app.teardown_request
+    def finish_request_profile(exc):
+        session = g.pop('profile_session', None)
+        if session is not None:
+            session.end()
+
+    @app.route('/debug/profiling', methods=['GET', 'POST'])
+    def profiling_settings():
+        """프로파일링 설정 조회/변경 API
+        - X-Profiling-Token 헤더가 Config.PROFILING_TOKEN 과 같아야 함
+        - POST JSON: {sample_rate, route, crawls}
+        """
+        if not Config.PROFILING_TOKEN or request.headers.get('X-Profiling-Token') != Config.PROFILING_TOKEN:
+            abort(404)
+        if request.method == 'POST':
+            options = request.get_json(silent=True) or {}
+            try:
+                configure(**{key: options[key] for key in ('sample_rate', 'route', 'crawls') if key in options})
+            except (ValueError, TypeError) as e:
+                return jsonify({'error': str(e)}), 400
+        return jsonify({'settings': settings.as_dict(), 'spans': get_span_stats()})
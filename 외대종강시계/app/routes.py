@@ -1,7 +1,21 @@
-from flask import render_template, jsonify
-from app.models import HUFSClock, HUFSNoticeCrawler
-from datetime import datetime
-from app import app
+from flask import (Blueprint, Response, current_app, render_template, jsonify, request,
+                   send_from_directory, stream_with_context, url_for)
+from app import models
+from app.cache import get_cache
+from app.models.timesource import get_time_source
+from app.compression import body_cache
+from app.export import EXPORT_FORMATS
+from app.payloads import (build_update_payload, build_notices_payload, build_schedule_payload,
+                          build_timeline_payload, build_writers_payload, build_search_payload,
+                          build_meals_today_payload, build_meals_week_payload,
+                          parse_writer_filter, WRITER_FEED_LIMIT)
+from app.offline import build_manifest, get_asset_version, get_app_shell, get_precache_urls
+from app.profiling import get_span_stats, span
+from app.tenancy import get_request_tenant, requires_feature
+from config import Config
+from datetime import date, datetime
+import hashlib
+import re
 
 """
 HUFS 종강시계 Flask 애플리케이션
@@ -10,35 +24,48 @@ HUFS 종강시계 Flask 애플리케이션
 - 테마 변경 기능
 """
 
-@app.route('/')
+bp = Blueprint('main', __name__)
+EMAIL_PATTERN = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+@bp.app_context_processor
+def inject_asset_version():
+    """템플릿에서 정적 파일 URL 버전(asset_version) 사용"""
+    return {'asset_version': get_asset_version()}
+
+@bp.route('/')
 def home():
     """메인 페이지 렌더링
     - 타이머 초기값 설정
     - 공지사항 초기 로드
     - 현재 시간 표시
     """
+    tenant = get_request_tenant()
+
     # 타이머 초기화
-    clock = HUFSClock()
+    with span('clock.init'):
+        clock = models.HUFSClock(tenant=tenant)
     days, hours, minutes, seconds, period_type = clock.get_remaining_time()
-    current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    current_time = get_time_source().now().strftime('%Y-%m-%d %H:%M:%S')
     
     # 공지사항 초기 로드
-    notice_crawler = HUFSNoticeCrawler()
-    notices = notice_crawler.get_notices()
-    last_update = datetime.now().strftime('%Y.%m.%d %H:%M:%S')
+    notice_crawler = models.HUFSNoticeCrawler(tenant)
+    notices = notice_crawler.get_notices(use_cache=True)
+    last_update = get_time_source().now().strftime('%Y.%m.%d %H:%M:%S')
     
     # 템플릿 렌더링
-    return render_template('index.html',
-                         days=days,
-                         hours=hours,
-                         minutes=minutes,
-                         seconds=seconds,
-                         period_type=period_type,
-                         current_time=current_time,
-                         last_update=last_update,
-                         notices=notices)
-
-@app.route('/update')
+    with span('template.render'):
+        return render_template('index.html',
+                             days=days,
+                             hours=hours,
+                             minutes=minutes,
+                             seconds=seconds,
+                             period_type=period_type,
+                             current_time=current_time,
+                             last_update=last_update,
+                             notices=notices,
+                             tenant=tenant)
+
+@bp.route('/update')
 def update_time():
     """실시간 시간 정보 업데이트 API
     Returns:
@@ -51,22 +78,15 @@ def update_time():
             current_time: 현재 시각
         }
     """
-    clock = HUFSClock()
-    days, hours, minutes, seconds, period_type = clock.get_remaining_time()
-    current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    
-    return jsonify({
-        'days': days,
-        'hours': hours,
-        'minutes': minutes,
-        'seconds': seconds,
-        'period_type': period_type,
-        'current_time': current_time
-    })
+    return jsonify(build_update_payload(get_request_tenant()))
 
-@app.route('/notices')
+@bp.route('/notices')
 def get_notices():
     """공지사항 새로고침 API
+    Query:
+        format=compact: 공지사항을 [date, title, writer, link] 배열로 반환
+        writer: 작성자(부서) 필터, 여러 번 또는 쉼표로 지정 (저장된 전체 공지사항에서 최신순)
+        limit: 작성자 필터 응답의 최대 개수 (기본 100)
     Returns:
         성공 시: {notices: 공지사항 목록, last_update: 갱신 시각}
         실패 시: {error: 오류 내용, message: 오류 메시지}, 500
@@ -74,14 +94,11 @@ def get_notices():
     try:
         print("공지사항 새로고침 요청 받음") # 디버깅용 로그
         # 공지사항 크롤링
-        notice_crawler = HUFSNoticeCrawler()
-        notices = notice_crawler.get_notices()
-        last_update = datetime.now().strftime('%Y.%m.%d %H:%M:%S')
-        
-        return jsonify({
-            'notices': notices,
-            'last_update': last_update
-        })
+        compact = request.args.get('format') == 'compact'
+        writers = parse_writer_filter(request.args.getlist('writer'))
+        limit = request.args.get('limit', WRITER_FEED_LIMIT, type=int)
+        return jsonify(build_notices_payload(compact=compact, writers=writers, limit=limit,
+                                             tenant=get_request_tenant()))
     
     except Exception as e:
         print(f"공지사항 업데이트 실패: {str(e)}") # 디버깅용 로그
@@ -90,7 +107,89 @@ def get_notices():
             'message': '공지사항 업데이트 실패'
         }), 500
 
-@app.route('/schedule')
+@bp.route('/notices/writers')
+@requires_feature('archive')
+def get_notice_writers():
+    """작성자(부서)별 공지사항 수 API
+    Returns:
+        JSON: {writers: [{writer: 작성자, count: 공지사항 수}, ...]} (많은 순)
+    """
+    return jsonify(build_writers_payload())
+
+@bp.route('/notices/search')
+@requires_feature('archive')
+def search_notices():
+    """공지사항 검색 API (제목, 수집된 상세 본문의 글자 n-gram 색인)
+    Query:
+        q: 검색어 (단어 일부 가능, 여러 단어는 모두 포함)
+        limit: 최대 결과 수 (기본 20)
+    Returns:
+        성공 시: {query, results: [{date, title, writer, link, score}, ...], took_ms}
+        검색어 없음: {error: 오류 내용, message: 오류 메시지}, 400
+    """
+    query = request.args.get('q', '').strip()
+    if not query:
+        return jsonify({
+            'error': 'empty_query',
+            'message': '검색어를 입력하세요'
+        }), 400
+    limit = request.args.get('limit', Config.SEARCH_RESULT_LIMIT, type=int)
+    return jsonify(build_search_payload(query, limit))
+
+@bp.route('/notices/export')
+@requires_feature('archive')
+def export_notices():
+    """저장된 전체 공지사항 내보내기 API (스트리밍)
+    Query:
+        format: ndjson(기본) 또는 csv
+        since, until: 작성일 범위 YYYY-MM-DD (양 끝 포함)
+        writer: 작성자(부서) 필터, 여러 번 또는 쉼표로 지정
+    Returns:
+        성공 시: NDJSON/CSV 파일 (게시글 번호 순)
+        잘못된 요청 시: {error: 오류 내용, message: 오류 메시지}, 400
+    """
+    export_format = request.args.get('format', 'ndjson')
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({
+            'error': 'invalid_format',
+            'message': f"지원하지 않는 형식입니다 ({', '.join(EXPORT_FORMATS)})"
+        }), 400
+    try:
+        # 저장소의 작성일과 문자열로 비교하므로 YYYY-MM-DD 로 맞춤 (20261019 같은 다른 ISO 표기 포함)
+        since, until = (date.fromisoformat(value).isoformat() if value else None
+                        for value in (request.args.get(name) for name in ('since', 'until')))
+    except ValueError:
+        return jsonify({
+            'error': 'invalid_date',
+            'message': '날짜는 YYYY-MM-DD 형식이어야 합니다'
+        }), 400
+
+    mimetype, extension, serialize = EXPORT_FORMATS[export_format]
+    batches = models.get_notice_store().iter_batches(
+        since=since, until=until,
+        writers=parse_writer_filter(request.args.getlist('writer')),
+        batch_size=Config.EXPORT_BATCH_SIZE)
+    filename = f"notices-{get_time_source().now():%Y%m%d}.{extension}"
+    return Response(stream_with_context(serialize(batches)), mimetype=mimetype,
+                    headers={'Content-Disposition': f'attachment; filename="{filename}"'})
+
+@bp.route('/notices/<int:article_id>')
+@requires_feature('archive')
+def get_notice_detail(article_id):
+    """공지사항 상세 정보 API (미리 수집된 캐시에서만 제공)
+    Returns:
+        성공 시: {article_id, link, body, attachments, posted}
+        미수집 시: {error: 오류 내용, message: 오류 메시지}, 404
+    """
+    detail = models.crawler.HUFSNoticeDetailCrawler().get_detail(article_id)
+    if detail is None:
+        return jsonify({
+            'error': 'not_found',
+            'message': '아직 수집되지 않은 공지사항입니다'
+        }), 404
+    return jsonify(detail)
+
+@bp.route('/schedule')
 def get_schedule():
     """학사 일정 정보 제공 API
     Returns:
@@ -102,30 +201,201 @@ def get_schedule():
         }
     """
     try:
-        clock = HUFSClock()
-        current_semester = clock.current_semester
-        is_semester = clock.is_semester
-        
-        response = {
-            'is_semester': is_semester,
-            'current_semester': current_semester
+        return jsonify(build_schedule_payload(get_request_tenant()))
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/timeline')
+def get_timeline():
+    """학기 시작/종료 일시 API (오프라인 카운트다운용)
+    Returns:
+        JSON: {first_start, first_end, second_start, second_end} (ISO 형식)
+    """
+    try:
+        return jsonify(build_timeline_payload(get_request_tenant()))
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/sw.js')
+def service_worker():
+    """서비스 워커 스크립트 (앱 셸 버전과 미리 받을 URL 목록 포함, 경로 접두사 테넌트는 접두사 아래 URL)"""
+    version, _ = get_app_shell()
+    base = request.script_root
+    script = render_template('sw.js', version=version, base=base,
+                             shell_urls=[base + url for url in get_precache_urls()])
+    response = current_app.response_class(script, mimetype='application/javascript')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['Service-Worker-Allowed'] = '/'
+    return response
+
+@bp.route('/manifest.webmanifest')
+def web_manifest():
+    """웹 앱 매니페스트"""
+    response = jsonify(build_manifest(get_request_tenant().name))
+    response.mimetype = 'application/manifest+json'
+    return response
+
+@bp.route('/hufs_icon.svg')
+def app_icon():
+    """앱 아이콘"""
+    return send_from_directory(Config.BASE_DIR, 'hufs_icon.svg', max_age=86400)
+
+def _meal_response(payload):
+    """학식 응답 (ETag, If-None-Match 면 304)
+    - 다음 식사 구간 경계와 메뉴 캐시 만료(expires) 중 빠른 시각까지 캐시 허용
+    - 크롤링에 실패했거나 크롤링 중인 메뉴는 곧 바뀌므로 no-cache (ETag 로 재검증만)
+    """
+    response = jsonify(payload)
+    response.set_etag(hashlib.sha1(response.get_data()).hexdigest()[:20], weak=True)
+    if payload.get('failed') or payload.get('pending'):
+        response.cache_control.no_cache = True
+        return response.make_conditional(request)
+    until = datetime.fromisoformat(payload['valid_until'])
+    if payload.get('expires'):
+        until = min(until, datetime.fromisoformat(payload['expires']))
+    remaining = until - get_time_source().now()
+    response.cache_control.public = True
+    response.cache_control.max_age = max(0, int(remaining.total_seconds()))
+    return response.make_conditional(request)
+
+@bp.route('/meals/today')
+@requires_feature('meals')
+def get_meals_today():
+    """오늘 학식 메뉴 API
+    Returns:
+        JSON: {
+            date: 오늘 날짜 (YYYY-MM-DD),
+            current_meal: 현재 식사 구간 (조식/중식/석식, 마지막 식사 이후 null),
+            failed: 메뉴 크롤링 실패 여부 (true 면 no-cache),
+            pending: 메뉴 크롤링 중 여부 (true 면 빈 메뉴 또는 지난 메뉴, no-cache),
+            expires: 메뉴 캐시 만료 시각,
+            cafeterias: [{id, name, meals: [{meal, time, price, menu}]}],
+            valid_until: 응답이 바뀌는 다음 식사 구간 경계
         }
-        
-        if is_semester:
-            if current_semester == 1:
-                response['end_date'] = clock.first_semester_end.strftime('%Y년 %m월 %d일')
-            else:
-                response['end_date'] = clock.second_semester_end.strftime('%Y년 %m월 %d일')
-        else:
-            if current_semester == 0:  # 방학 중
-                if datetime.now() > clock.second_semester_end:  # 겨울방학
-                    response['next_start_date'] = clock.first_semester_start.strftime('%Y년 %m월 %d일')
-                else:  # 여름방학
-                    response['next_start_date'] = clock.second_semester_start.strftime('%Y년 %m월 %d일')
-        
-        return jsonify(response)
+    """
+    try:
+        return _meal_response(build_meals_today_payload())
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@bp.route('/meals/week')
+@requires_feature('meals')
+def get_meals_week():
+    """이번 주 학식 메뉴 API
+    Returns:
+        JSON: {week: ISO 주차, start, end, updated, failed, pending, expires,
+               cafeterias: [{id, name, days: {날짜: 식사 목록}}], valid_until: 다음 식사 구간 경계}
+    """
+    try:
+        return _meal_response(build_meals_week_payload())
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/subscriptions', methods=['POST'])
+@requires_feature('archive')
+def add_subscription():
+    """키워드 구독 등록 API
+    - 웹훅은 공인 주소만 허용 (내부 네트워크 주소로 해석되는 호스트 거부)
+    - 대상에 확인 링크를 보내고, 확인 링크를 열기 전까지는 알림을 보내지 않음
+    Body (JSON):
+        keyword: 제목에 포함될 키워드 (예: 장학, 수강신청)
+        channel: 'webhook' 또는 'email'
+        target: 웹훅 URL 또는 이메일 주소
+    Returns:
+        성공 시: {id: 구독 번호, keyword, channel, target, confirmed: 확인 여부}, 201
+        잘못된 요청 시: {error: 오류 내용, message: 오류 메시지}, 400
+    """
+    from app.models.subscriptions import CHANNELS, get_subscription_store
+    from app.notify import check_webhook_target, send_confirmation
+
+    data = request.get_json(silent=True) or {}
+    keyword = str(data.get('keyword', '')).strip()
+    channel = data.get('channel')
+    target = str(data.get('target', '')).strip()
+    message = None
+    if not keyword or len(keyword) > 50:
+        message = '키워드는 1~50자여야 합니다'
+    elif channel not in CHANNELS:
+        message = f"channel 은 {', '.join(CHANNELS)} 중 하나여야 합니다"
+    elif channel == 'email' and not EMAIL_PATTERN.match(target):
+        message = '이메일 주소가 올바르지 않습니다'
+    elif channel == 'webhook':
+        try:
+            check_webhook_target(target)
+        except ValueError as e:
+            message = str(e)
+    if message:
+        return jsonify({'error': 'invalid_subscription', 'message': message}), 400
+
+    subscription_id, confirmed, token = get_subscription_store().add(keyword, channel, target)
+    if token:
+        send_confirmation(channel, target, url_for('main.confirm_subscription', token=token, _external=True))
+    return jsonify({'id': subscription_id, 'keyword': keyword, 'channel': channel, 'target': target,
+                    'confirmed': confirmed}), 201
+
+@bp.route('/subscriptions/confirm')
+@requires_feature('archive')
+def confirm_subscription():
+    """키워드 구독 확인 API (확인 메시지의 링크, ?token=)
+    Returns:
+        성공 시: {confirmed: 활성화된 구독 수}
+        없음: {error: 오류 내용, message: 오류 메시지}, 404
+    """
+    from app.models.subscriptions import get_subscription_store
+
+    confirmed = get_subscription_store().confirm(request.args.get('token', ''))
+    if not confirmed:
+        return jsonify({
+            'error': 'not_found',
+            'message': '확인할 구독이 없거나 이미 확인되었습니다'
+        }), 404
+    return jsonify({'confirmed': confirmed})
+
+@bp.route('/subscriptions/<int:subscription_id>', methods=['DELETE'])
+@requires_feature('archive')
+def remove_subscription(subscription_id):
+    """키워드 구독 해지 API (등록할 때의 target 을 ?target= 으로 함께 보내야 함)
+    Returns:
+        성공 시: {id: 구독 번호, removed: true}
+        없음: {error: 오류 내용, message: 오류 메시지}, 404
+    """
+    from app.models.subscriptions import get_subscription_store
+
+    if not get_subscription_store().remove(subscription_id, request.args.get('target', '')):
+        return jsonify({
+            'error': 'not_found',
+            'message': '구독을 찾을 수 없습니다'
+        }), 404
+    return jsonify({'id': subscription_id, 'removed': True})
+
+@bp.route('/metrics')
+def get_metrics():
+    """운영 지표 API
+    Returns:
+        JSON: {cache: 캐시 백엔드 히트/미스 통계, compression: 압축 본문 캐시 통계,
+               spans: 구간별 실행 시간, rate_limiter: 외부 요청 대기열 지표,
+               subscriptions: 구독 수, 알림 대기/전달/실패 수,
+               admission: 요청 수락/거절 수, 동시 처리 수, 대기열 길이,
+               crawl_pool: 공용 크롤링 작업 풀의 테넌트별 대기/완료 수,
+               cache_partitions: 테넌트별 캐시 분할 통계}
+    """
+    from app.admission import get_admission_controller
+    from app.cache import get_partition_stats
+    from app.models.crawler.pool import get_crawl_pool
+    from app.models.crawler.ratelimit import get_rate_limiter
+    from app.models.subscriptions import get_subscription_store
+
+    return jsonify({
+        'cache': get_cache().get_stats(),
+        'cache_partitions': get_partition_stats(),
+        'crawl_pool': get_crawl_pool().get_stats(),
+        'compression': body_cache.get_stats(),
+        'spans': get_span_stats(),
+        'rate_limiter': get_rate_limiter().get_stats(),
+        'subscriptions': get_subscription_store().get_stats(),
+        'admission': get_admission_controller().get_stats()
+    })
+
 if __name__ == '__main__':
-    app.run(debug=True)  # 개발 서버 실행 (디버그 모드)
\ No newline at end of file
+    from app import create_app
+    create_app().run(debug=True)  # 개발 서버 실행 (디버그 모드)
\ No newline at end of file
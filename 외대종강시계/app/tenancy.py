@@ -0,0 +1,78 @@
+from functools import wraps
+
+from flask import jsonify, request
+
+from app.models.tenants import get_tenants
+
+"""
+요청 -> 테넌트(학교/캠퍼스) 연결
+- WSGI 미들웨어가 경로 접두사 또는 Host 로 테넌트를 정하고 environ 에 기록
+- 경로 접두사는 SCRIPT_NAME 으로 옮기므로 라우트는 접두사 없이 그대로 동작
+  (예: /seoul/update -> SCRIPT_NAME=/seoul, PATH_INFO=/update)
+- 테넌트 결정은 딕셔너리 조회 두 번이라 테넌트 수가 늘어도 요청당 비용이 같음
+"""
+
+TENANT_ENVIRON_KEY = 'hufs.tenant'
+
+
+class TenantMiddleware:
+    """경로 접두사/호스트로 테넌트를 정하는 WSGI 미들웨어"""
+
+    def __init__(self, wsgi_app, registry=None):
+        """
+        Args:
+            wsgi_app: 감쌀 WSGI 애플리케이션
+            registry (TenantRegistry): 테넌트 목록 (기본값: get_tenants())
+        """
+        self.wsgi_app = wsgi_app
+        self.registry = registry or get_tenants()
+
+    def __call__(self, environ, start_response):
+        path = environ.get('PATH_INFO') or '/'
+        tenant, prefix = self.registry.resolve(environ.get('HTTP_HOST') or environ.get('SERVER_NAME'), path)
+        if prefix:
+            rest = path[len(prefix):]
+            script_name = environ.get('SCRIPT_NAME', '') + prefix
+            if not rest:
+                # '/seoul' -> '/seoul/' (페이지의 상대 경로 요청이 접두사 아래로 가도록)
+                query = environ.get('QUERY_STRING')
+                location = script_name + '/' + (f'?{query}' if query else '')
+                start_response('301 Moved Permanently', [('Location', location), ('Content-Length', '0')])
+                return [b'']
+            environ['SCRIPT_NAME'] = script_name
+            environ['PATH_INFO'] = rest
+        environ[TENANT_ENVIRON_KEY] = tenant
+        return self.wsgi_app(environ, start_response)
+
+
+def get_request_tenant():
+    """현재 요청의 테넌트 (미들웨어 밖에서 호출되면 기본 테넌트)"""
+    return request.environ.get(TENANT_ENVIRON_KEY) or get_tenants().default
+
+
+def requires_feature(feature):
+    """
+    테넌트가 기능(archive, meals)을 쓰지 않으면 404 를 반환하는 라우트 데코레이터
+    Args:
+        feature (str): Config.TENANTS 의 features 항목
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if not get_request_tenant().supports(feature):
+                return jsonify({
+                    'error': 'not_supported',
+                    'message': '이 학교에서는 제공하지 않는 기능입니다'
+                }), 404
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def init_tenancy(app):
+    """
+    Flask 앱에 테넌트 미들웨어 등록 (테넌트 정의 오류는 여기서 바로 발생)
+    Args:
+        app (Flask): 대상 애플리케이션
+    """
+    app.wsgi_app = TenantMiddleware(app.wsgi_app)
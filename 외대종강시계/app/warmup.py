@@ -0,0 +1,48 @@
+import gc
+import time
+
+"""
+워커 시작 전 준비 작업
+- gunicorn preload_app 과 함께 쓰면 마스터 프로세스에서 한 번만 실행되고
+  fork 된 워커들이 불러온 모듈, 학사일정, 공지사항을 copy-on-write 로 공유
+  (CACHE_TYPE = 'memory' 이면 캐시 내용도 공유됨)
+- SQLite 연결, 스레드 풀은 프로세스 ID 를 확인해 fork 후 워커에서 새로 생성
+- 캐시를 읽기만 하고 크롤링하지 않음: 마스터에서 크롤링 작업 풀 스레드, 상세 페이지 미리 수집,
+  구독 알림이 시작되면 fork 후에도 마스터가 외부 요청을 계속하고 워커가 잡힌 잠금을 물려받을 수 있음
+"""
+
+
+def warm_up(app):
+    """
+    첫 요청이 느려지지 않도록 미리 불러오기
+    - 크롤러 모듈(requests, bs4) import
+    - 캐시에 학사일정이 있는 테넌트는 /schedule, /timeline 응답을 미리 계산 (없으면 첫 요청에서 크롤링)
+    - 앱 셸 버전 계산, 템플릿 컴파일
+    Args:
+        app (Flask): 대상 애플리케이션
+    Returns:
+        float: 소요 시간 (초)
+    """
+    started = time.perf_counter()
+    from app import models, payloads
+    from app.offline import get_app_shell
+
+    from app.models.crawler.schedule import HUFSScheduleCrawler
+
+    models.HUFSNoticeCrawler  # 크롤러 모듈 import
+    for tenant in models.get_tenants():
+        try:
+            if HUFSScheduleCrawler(tenant)._load_cache() is None:
+                continue  # 캐시가 비어 있으면 크롤링하지 않음
+            payloads.build_timeline_payload(tenant)
+            payloads.build_schedule_payload(tenant)
+        except Exception as e:
+            print(f"워밍업 실패({tenant.id}): {e}")
+    get_app_shell()
+    app.jinja_env.get_template('index.html')
+
+    # fork 이후 GC 가 공유 객체를 건드려 페이지가 복사되지 않도록 고정
+    gc.collect()
+    if hasattr(gc, 'freeze'):
+        gc.freeze()
+    return time.perf_counter() - started
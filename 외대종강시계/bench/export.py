@@ -0,0 +1,61 @@
+import os
+import resource
+import tempfile
+import time
+
+from app import create_app
+from app.models import notice_store
+from app.models.notice_store import NoticeStore
+
+"""
+/notices/export 스트리밍 측정
+- 임시 저장소에 가짜 공지사항을 채우고 NDJSON/CSV 로 끝까지 받아 처리량과 최대 RSS 증가량 확인
+- 행 수를 늘려도 RSS 증가량이 거의 같으면 메모리 사용량이 일정한 것
+실행: python -m bench.export [행 수]
+"""
+
+WRITERS = ['학사종합지원센터', '국제교류팀', '장학팀', '입학처', '총무팀']
+
+
+def _fill(store, rows):
+    batch = []
+    for i in range(rows):
+        batch.append({
+            'date': f"{i % 12 + 1:02d}.{i % 28 + 1:02d}",
+            'title': f"2026학년도 공지사항 제목 {i}",
+            'writer': WRITERS[i % len(WRITERS)],
+            'link': f"https://www.hufs.ac.kr/bbs/hufs/2180/{100000 + i}/artclView.do",
+            'posted': f"2026-{i % 12 + 1:02d}-{i % 28 + 1:02d}"
+        })
+        if len(batch) == 10000:
+            store.upsert_many(batch)
+            batch = []
+    store.upsert_many(batch)
+
+
+def _max_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # Linux: KB
+
+
+def main(rows=200000):
+    with tempfile.TemporaryDirectory() as tmp:
+        store = NoticeStore(os.path.join(tmp, 'notices.sqlite3'))
+        _fill(store, rows)
+        notice_store._store = store
+        client = create_app().test_client()
+
+        print(f"행 수: {rows:,}")
+        for export_format in ('ndjson', 'csv'):
+            rss_before = _max_rss_mb()
+            started = time.perf_counter()
+            response = client.get(f'/notices/export?format={export_format}')
+            size = sum(len(chunk) for chunk in response.response)
+            response.close()
+            elapsed = time.perf_counter() - started
+            print(f"{export_format:<8}{size / 1e6:>8.1f} MB  {elapsed:>6.2f}초  "
+                  f"{rows / elapsed:>10,.0f} 행/초  최대 RSS 증가 {_max_rss_mb() - rss_before:.1f} MB")
+
+
+if __name__ == '__main__':
+    import sys
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
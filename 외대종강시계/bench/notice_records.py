@@ -0,0 +1,77 @@
+import gc
+import json
+import os
+import time
+import tracemalloc
+
+from app.encoding import dumps
+from app.models.notice_record import NoticeRecord
+from config import Config
+
+"""
+공지사항 dict 와 NoticeRecord 비교
+- 공지사항 하나당 메모리 (tracemalloc 으로 측정, 문자열 포함)
+- 전체를 응답 형식(dict 목록 JSON)으로 직렬화하는 시간
+- notice_cache.json 의 실제 공지사항을 복제해 게시글 번호만 바꿔 사용
+실행: python -m bench.notice_records [공지사항 수]
+"""
+
+WRITERS = ['학사종합지원센터', '국제교류팀', '장학팀', '입학처', '총무팀', '교무처']
+
+
+def _sample_notices():
+    with open(os.path.join(Config.BASE_DIR, 'notice_cache.json'), encoding='utf-8') as f:
+        return json.load(f)['notices']
+
+
+def _make_dicts(samples, count):
+    # 크롤링 결과처럼 공지사항마다 새 문자열을 가진 dict 생성
+    notices = []
+    for i in range(count):
+        sample = samples[i % len(samples)]
+        notices.append({
+            'date': ''.join(sample['date']),
+            'title': f"{sample['title']} ({i})",
+            'writer': ''.join(WRITERS[i % len(WRITERS)]),
+            'link': f"https://www.hufs.ac.kr/bbs/hufs/2180/{100000 + i}/artclView.do"
+        })
+    return notices
+
+
+def _measure(build):
+    # 메모리: 만든 결과가 남아 있는 동안의 추적 메모리 (중간에 버린 객체는 제외)
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main(count=100000):
+    samples = _sample_notices()
+    dicts, dict_bytes = _measure(lambda: _make_dicts(samples, count))
+    records, record_bytes = _measure(
+        lambda: [NoticeRecord.from_notice(notice, '2026-03-02') for notice in _make_dicts(samples, count)])
+
+    started = time.perf_counter()
+    [NoticeRecord.from_notice(notice, '2026-03-02') for notice in dicts]
+    build_sec = time.perf_counter() - started
+
+    started = time.perf_counter()
+    dict_json = dumps(dicts)
+    dict_sec = time.perf_counter() - started
+    started = time.perf_counter()
+    record_json = dumps([record.to_dict() for record in records])
+    record_sec = time.perf_counter() - started
+
+    print(f"공지사항 수: {count:,}")
+    print(f"{'':<14}{'바이트/공지':>12}{'직렬화(초)':>12}{'JSON(MB)':>10}")
+    print(f"{'dict':<14}{dict_bytes / count:>12.0f}{dict_sec:>12.3f}{len(dict_json) / 1e6:>10.1f}")
+    print(f"{'NoticeRecord':<14}{record_bytes / count:>12.0f}{record_sec:>12.3f}{len(record_json) / 1e6:>10.1f}")
+    print(f"dict -> NoticeRecord 변환: {build_sec:.3f}초")
+
+
+if __name__ == '__main__':
+    import sys
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,57 @@
+import json
+import os
+import random
+import statistics
+import time
+from datetime import date
+
+from app.models.notice_record import NoticeRecord
+from app.models.search_index import NoticeSearchIndex
+from config import Config
+
+"""
+공지사항 검색 색인 측정
+- notice_cache.json 제목의 단어를 섞어 만든 가짜 제목으로 색인을 채우고 검색 지연 시간 측정
+- 흔한 단어("학년도")는 후보가 많아 가장 느린 경우
+실행: python -m bench.search [공지사항 수]
+"""
+
+QUERIES = ['신입학', '장학', '학년도', '2026학년도 모집', '심폐소생술', '서울캠퍼스 교육', '학', '없는검색어']
+
+
+def _make_records(count):
+    with open(os.path.join(Config.BASE_DIR, 'notice_cache.json'), encoding='utf-8') as f:
+        samples = json.load(f)['notices']
+    words = [word for notice in samples for word in notice['title'].split()]
+    words += ['장학금', '수강신청', '등록금', '졸업', '기숙사']
+    rng = random.Random(0)
+    records = []
+    for i in range(count):
+        title = ' '.join(rng.choice(words) for _ in range(rng.randint(4, 10)))
+        records.append(NoticeRecord(100000 + i, 2180, 'hufs', date(2026, 3, 2), title, samples[i % len(samples)]['writer']))
+    return records
+
+
+def main(count=100000):
+    records = _make_records(count)
+    index = NoticeSearchIndex()
+    started = time.perf_counter()
+    with index._lock:
+        for record in records:
+            index._index(record)
+    print(f"공지사항 {count:,}개 색인: {time.perf_counter() - started:.2f}초, {index.get_stats()}")
+
+    print(f"{'검색어':<16}{'결과':>6}{'p50(ms)':>10}{'p99(ms)':>10}")
+    for query in QUERIES:
+        timings = []
+        for _ in range(50):
+            started = time.perf_counter()
+            results = index.search(query, limit=20)
+            timings.append((time.perf_counter() - started) * 1000)
+        timings.sort()
+        print(f"{query:<16}{len(results):>6}{statistics.median(timings):>10.2f}{timings[int(len(timings) * 0.99) - 1]:>10.2f}")
+
+
+if __name__ == '__main__':
+    import sys
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
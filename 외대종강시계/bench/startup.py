@@ -0,0 +1,48 @@
+import json
+import statistics
+import subprocess
+import sys
+
+"""
+앱 시작 시간 측정
+- import + create_app() 시간, 첫 요청(/update)까지 걸린 시간
+- 매번 새 프로세스에서 측정 (학사일정 캐시는 미리 채워 둠)
+실행: python -m bench.startup
+"""
+
+RUNS = 7
+
+PROBE = """
+import contextlib, io, json, sys, time
+started = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()):
+    from app import create_app
+    app = create_app()
+created = time.perf_counter()
+heavy = [name for name in ('requests', 'bs4') if name in sys.modules]
+with contextlib.redirect_stdout(io.StringIO()):
+    app.test_client().get('/update')
+first = time.perf_counter()
+print(json.dumps({'create_ms': (created - started) * 1000,
+                  'first_request_ms': (first - started) * 1000,
+                  'heavy_at_create': heavy}))
+"""
+
+
+def _run_probe():
+    output = subprocess.run([sys.executable, '-c', PROBE], capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    _run_probe()  # 학사일정 캐시 채우기
+    results = [_run_probe() for _ in range(RUNS)]
+    create = statistics.median(result['create_ms'] for result in results)
+    first = statistics.median(result['first_request_ms'] for result in results)
+    print(f"import + create_app(): {create:.1f} ms (중앙값, {RUNS}회)")
+    print(f"첫 요청 완료까지:       {first:.1f} ms")
+    print(f"create_app() 시점에 로드된 무거운 모듈: {results[-1]['heavy_at_create'] or '없음'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+import json
+import os
+import random
+import time
+
+from app.models.subscriptions import KeywordAutomaton, normalize_keyword
+from config import Config
+
+"""
+키워드 구독 매칭 측정
+- 구독 키워드 수를 늘려가며 Aho-Corasick 오토마톤과 구독마다 `in` 검사하는 방식의 제목당 매칭 시간 비교
+- 키워드는 실제 키워드 몇 개 + 무작위 한글 2~4글자
+실행: python -m bench.subscriptions
+"""
+
+REAL_KEYWORDS = ['장학', '수강신청', '등록금', '졸업', '기숙사', '교육', '신입학', '모집']
+
+
+def _random_keywords(count, rng):
+    keywords = set(REAL_KEYWORDS)
+    while len(keywords) < count:
+        keywords.add(''.join(chr(rng.randint(0xAC00, 0xD7A3)) for _ in range(rng.randint(2, 4))))
+    return list(keywords)
+
+
+def main():
+    with open(os.path.join(Config.BASE_DIR, 'notice_cache.json'), encoding='utf-8') as f:
+        titles = [normalize_keyword(notice['title']) for notice in json.load(f)['notices']] * 100
+    rng = random.Random(0)
+
+    print(f"제목 {len(titles):,}개")
+    print(f"{'키워드 수':>10}{'오토마톤 생성(초)':>18}{'오토마톤(us/제목)':>18}{'구독별 in(us/제목)':>20}")
+    for count in (100, 1000, 10000, 50000):
+        keywords = _random_keywords(count, rng)
+        started = time.perf_counter()
+        automaton = KeywordAutomaton(keywords)
+        build_sec = time.perf_counter() - started
+
+        started = time.perf_counter()
+        found = [automaton.find(title) for title in titles]
+        automaton_us = (time.perf_counter() - started) / len(titles) * 1e6
+
+        started = time.perf_counter()
+        naive = [{keyword for keyword in keywords if keyword in title} for title in titles]
+        naive_us = (time.perf_counter() - started) / len(titles) * 1e6
+        assert found == naive
+
+        print(f"{count:>10,}{build_sec:>18.3f}{automaton_us:>18.1f}{naive_us:>20.1f}")
+
+
+if __name__ == '__main__':
+    main()
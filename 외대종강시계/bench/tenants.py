@@ -0,0 +1,69 @@
+import copy
+import statistics
+import time
+
+from config import Config
+
+"""
+테넌트 수에 따른 요청당 비용 측정
+- 테넌트를 1/10/100개 정의했을 때 테넌트 결정(resolve) 시간과 /timeline 응답 시간 비교
+- 학사일정은 미리 캐시에 넣어 외부 요청 없이 측정 (memory 캐시, 테넌트별 분할)
+실행: python -m bench.tenants
+"""
+
+TENANT_COUNTS = [1, 10, 100]
+REQUESTS = 300
+
+
+def _make_definitions(count):
+    base = Config.TENANTS[Config.DEFAULT_TENANT]
+    definitions = {Config.DEFAULT_TENANT: copy.deepcopy(base)}
+    for i in range(1, count):
+        definition = copy.deepcopy(base)
+        definition.update(name=f'학교{i}', hosts=[f't{i}.example'], path_prefix=f'/t{i}', features=[])
+        definitions[f't{i}'] = definition
+    return definitions
+
+
+def _time_resolve(registry, host, path, rounds=100000):
+    started = time.perf_counter()
+    for _ in range(rounds):
+        registry.resolve(host, path)
+    return (time.perf_counter() - started) / rounds * 1e9
+
+
+def main():
+    Config.CACHE_TYPE = 'memory'
+    from app import create_app
+    from app.cache import get_cache
+    from app.models.crawler.schedule import DEFAULT_SCHEDULE
+    from app.models.tenants import TenantRegistry
+
+    app = create_app()
+    client = app.test_client()
+    print(f"{'테넌트 수':<10}{'접두사(ns)':>12}{'호스트(ns)':>12}{'기본(ns)':>12}{'/timeline p50(ms)':>20}{'p99(ms)':>10}")
+    for count in TENANT_COUNTS:
+        registry = TenantRegistry(_make_definitions(count), Config.DEFAULT_TENANT)
+        app.wsgi_app.registry = registry  # TenantMiddleware 의 테넌트 목록 교체
+        for tenant in registry:
+            get_cache(tenant.partition).set('schedule', dict(DEFAULT_SCHEDULE), 0)
+
+        last = f'/t{count - 1}' if count > 1 else ''
+        prefix_ns = _time_resolve(registry, 'localhost', f'{last}/timeline')
+        host_ns = _time_resolve(registry, f't{count - 1}.example', '/timeline')
+        default_ns = _time_resolve(registry, 'localhost', '/timeline')
+
+        timings = []
+        for i in range(REQUESTS):
+            path = f'/t{i % count}/timeline' if i % count else '/timeline'
+            started = time.perf_counter()
+            response = client.get(path)
+            timings.append((time.perf_counter() - started) * 1000)
+            assert response.status_code == 200, response.status_code
+        timings.sort()
+        print(f"{count:<10}{prefix_ns:>12.0f}{host_ns:>12.0f}{default_ns:>12.0f}"
+              f"{statistics.median(timings):>20.3f}{timings[int(len(timings) * 0.99) - 1]:>10.3f}")
+
+
+if __name__ == '__main__':
+    main()
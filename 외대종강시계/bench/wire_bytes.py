@@ -0,0 +1,56 @@
+import json
+import os
+
+from app import create_app
+from app.compression import body_cache, brotli
+from app.models.crawler.notice import HUFSNoticeCrawler
+from config import Config
+
+"""
+라우트별 전송 바이트 측정
+- 변경 전: jsonify 기본 출력 (디버그 서버의 들여쓰기 출력, ASCII 이스케이프, 무압축)
+- 변경 후: compact UTF-8 JSON + gzip/br 압축, compact 배열 형식
+- 외부 요청 없이 notice_cache.json 의 공지사항으로 측정
+실행: python -m bench.wire_bytes
+"""
+
+
+def _load_sample_notices():
+    with open(os.path.join(Config.BASE_DIR, 'notice_cache.json'), encoding='utf-8') as f:
+        return json.load(f)['notices']
+
+
+def _before_bytes(payload, pretty):
+    if pretty:
+        return len(json.dumps(payload, ensure_ascii=True, sort_keys=True, indent=2).encode() + b'\n')
+    return len(json.dumps(payload, ensure_ascii=True, sort_keys=True, separators=(',', ':')).encode() + b'\n')
+
+
+def main():
+    notices = _load_sample_notices()
+    HUFSNoticeCrawler.get_notices = lambda self, use_cache=False: notices
+    Config.DETAIL_PREFETCH_ENABLED = False
+    client = create_app().test_client()
+
+    encodings = [('identity', 'identity'), ('gzip', 'gzip')]
+    if brotli is not None:
+        encodings.append(('br', 'br'))
+
+    print(f"{'route':<26}{'before(pretty)':>16}{'before(compact)':>17}"
+          + ''.join(f"{name:>10}" for name, _ in encodings))
+    for url in ['/update', '/schedule', '/notices', '/notices?format=compact']:
+        # 변경 전 기준은 compact 옵션이 없던 기본 형식
+        base_url = url.split('?')[0]
+        payload = json.loads(client.get(base_url, headers={'Accept-Encoding': 'identity'}).get_data())
+        sizes = []
+        for _, header in encodings:
+            response = client.get(url, headers={'Accept-Encoding': header})
+            sizes.append(len(response.get_data()))
+        print(f"{url:<26}{_before_bytes(payload, True):>16}{_before_bytes(payload, False):>17}"
+              + ''.join(f"{size:>10}" for size in sizes))
+
+    print(f"\n압축 본문 캐시: {body_cache.get_stats()}")
+
+
+if __name__ == '__main__':
+    main()
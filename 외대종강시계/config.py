@@ -9,6 +9,143 @@ class Config:
     CACHE_TYPE = 'filesystem'
     CACHE_DIR = 'cache'
     CACHE_DEFAULT_TIMEOUT = 300
+    CACHE_THRESHOLD = 500            # memory 캐시 최대 항목 수 (LRU 퇴출)
+    CACHE_KEY_PREFIX = 'hufs:'
+    CACHE_REDIS_HOST = os.environ.get('CACHE_REDIS_HOST', 'localhost')
+    CACHE_REDIS_PORT = int(os.environ.get('CACHE_REDIS_PORT', 6379))
+    CACHE_REDIS_DB = 0
+    NOTICE_CACHE_TIMEOUT = CACHE_DEFAULT_TIMEOUT
+    SCHEDULE_CACHE_TIMEOUT = 24 * 60 * 60
+
+    # 비동기(ASGI) 서빙 설정
+    ASYNC_CRAWL_WORKERS = 4          # 블로킹 크롤링을 실행할 스레드 수
+    REQUEST_TIMEOUT = 10             # 외부 요청 타임아웃 (초)
+
+    # 공지사항 상세 페이지 미리 수집 설정 (공용 크롤링 작업 풀에서 실행, 결과는 공지사항 저장소에 보관)
+    DETAIL_PREFETCH_ENABLED = True
+    DETAIL_RETRY_SECONDS = 600       # 수집 실패 후 다시 시도하기까지 기다리는 시간 (실패할 때마다 2배)
+    DETAIL_RETRY_MAX_SECONDS = 86400 # 다시 시도 대기 시간 상한
+
+    # 학교/캠퍼스(테넌트) 설정
+    # - 요청의 호스트 이름(hosts) 또는 경로 접두사(path_prefix, 예: '/seoul')로 테넌트 선택
+    # - HUFS_TENANTS_FILE 에 같은 형식의 JSON({테넌트 ID: 정의})을 두면 여기에 더하거나 덮어씀
+    # - features: 'archive'(공지사항 저장소/작성자/검색/내보내기/상세/구독), 'meals'(학식 메뉴)
+    #   (둘 다 프로세스 공용 저장소/크롤러를 쓰므로 기본 테넌트에만 지정 가능)
+    DEFAULT_TENANT = os.environ.get('HUFS_DEFAULT_TENANT', 'hufs')
+    TENANTS_FILE = os.environ.get('HUFS_TENANTS_FILE') or None
+    TENANTS = {
+        'hufs': {
+            'name': 'HUFS',
+            'hosts': [],
+            'path_prefix': None,
+            'features': ['archive', 'meals'],
+            'notice': {
+                'url': "https://www.hufs.ac.kr/hufs/11281/subview.do",
+                'domain': "https://www.hufs.ac.kr",
+            },
+            'schedule': {
+                'url': "https://www.hufs.ac.kr/hufs/index.do#section4",
+                'domain': "https://www.hufs.ac.kr",
+                'link_selector': '#top_k2wiz_GNB_11360',
+                'keywords': {        # 학사일정 항목 -> 일정 이름에 포함된 문자열
+                    'first_start': '제1학기 개강',
+                    'first_end': '제1학기 기말시험',
+                    'second_start': '제2학기 개강',
+                    'second_end': '제2학기 기말시험',
+                },
+            },
+        },
+    }
+    CACHE_PARTITION_THRESHOLD = 100  # 테넌트별 memory 캐시 최대 항목 수 (기본 테넌트는 CACHE_THRESHOLD)
+
+    # 공용 크롤링 작업 풀 (모든 테넌트가 공유, 테넌트별 대기열을 돌아가며 처리)
+    CRAWL_POOL_WORKERS = 4           # 크롤링 스레드 수 (테넌트 수와 무관)
+    CRAWL_POOL_RESERVED = 1          # 요청이 기다리는 크롤링 전용으로 남겨 두는 스레드 수
+    CRAWL_POOL_MAX_PENDING = 100     # 테넌트별 최대 대기 작업 수 (넘으면 백그라운드 작업은 버림)
+    CRAWL_POOL_RUN_TIMEOUT = 20      # 요청이 크롤링 결과를 기다리는 최대 시간 (초, 넘으면 캐시/기본값 응답)
+
+    # hufs.ac.kr 요청 속도 제한 (호스트의 모든 워커 프로세스가 공유)
+    RATE_LIMIT_STATE = os.path.join(CACHE_DIR, 'ratelimit.json')
+    RATE_LIMIT_BUDGETS = {           # 경로 접두사: (초당 요청 수, 최대 버스트)
+        '/': (1.0, 3),
+        '/hufs/': (1.0, 3),          # 공지사항 목록, 학사일정
+        '/bbs/': (0.5, 2),           # 공지사항 상세 페이지
+        '/jsp/': (0.5, 2),           # 학식 주간 메뉴 (wis.hufs.ac.kr)
+    }
+    RATE_LIMIT_MAX_WAIT = 30         # 토큰을 기다리는 최대 시간 (초)
+    RATE_LIMIT_DEFAULT_BACKOFF = 60  # Retry-After 없는 429/503 응답 시 대기 시간 (초)
+
+    # 공지사항 저장소, 원본 HTML 스냅샷 보관소
+    DATA_DIR = 'data'
+    NOTICE_STORE_PATH = os.path.join(DATA_DIR, 'notices.sqlite3')
+    ARCHIVE_ENABLED = True
+    ARCHIVE_DIR = os.path.join(DATA_DIR, 'snapshots')
+    EXPORT_BATCH_SIZE = 1000         # /notices/export 가 한 번에 읽어 내보내는 행 수
+    SEARCH_BODY_CHARS = 2000         # 검색 색인에 넣는 상세 본문 앞부분 길이 (글자)
+    SEARCH_RESULT_LIMIT = 20         # /notices/search 기본 결과 수
+    SEARCH_MAX_CANDIDATES = 2000     # 점수를 계산할 최대 후보 수 (넘으면 최신 게시글부터)
+
+    # 요청 수락 제어 (워커 프로세스별)
+    ADMISSION_ENABLED = True
+    ADMISSION_RATE_LIMITS = {        # 경로 접두사: (클라이언트당 초당 요청 수, 최대 버스트)
+        '/update': (1.0, 10),
+        '/notices': (0.2, 5),        # 목록 새로고침은 실시간 크롤링을 유발
+        '/notices/': (1.0, 10),      # 검색, 상세, 작성자, 내보내기
+        '/meals/': (1.0, 10),
+        '/subscriptions': (0.1, 3),
+    }
+    ADMISSION_MAX_CONCURRENT = int(os.environ.get('HUFS_ADMISSION_MAX_CONCURRENT', 32))  # 동시 처리 상한
+    ADMISSION_PRIORITY_PATHS = ('/',)  # 예약 슬롯을 쓸 수 있는 우선 경로
+    ADMISSION_PRIORITY_RESERVED = 4  # 우선 경로 전용 슬롯 수
+    ADMISSION_MAX_QUEUE = 16         # 슬롯을 기다릴 수 있는 최대 요청 수 (넘으면 바로 503)
+    ADMISSION_QUEUE_TIMEOUT = 0.25   # 슬롯을 기다리는 최대 시간 (초)
+    ADMISSION_RETRY_AFTER = 2        # 503 응답의 Retry-After (초)
+    ADMISSION_MAX_CLIENTS = 10000    # 토큰 버킷을 보관할 최대 클라이언트 수
+    ADMISSION_TRUST_PROXY = os.environ.get('HUFS_TRUST_PROXY') == '1'  # 프록시 한 단계 뒤일 때 X-Forwarded-For 마지막 주소 사용
+
+    # 학식 메뉴 설정
+    MEAL_CAFETERIAS = {              # 식당 코드: 이름 (주간 메뉴 페이지의 caf_id)
+        'h101': '인문관',
+        'h102': '교수회관',
+        'h103': '스카이라운지',
+    }
+    MEAL_PERIODS = [                 # (식사, 끝나는 시각): 이 시각마다 /meals/today 응답이 바뀜
+        ('조식', '09:30'),
+        ('중식', '14:00'),
+        ('석식', '19:30'),
+    ]
+    MEAL_RETRY_TIMEOUT = 10 * 60     # 크롤링 실패 결과를 캐시하는 시간 (초)
+
+    # 키워드 구독 알림 설정
+    SUBSCRIPTION_STORE_PATH = os.path.join(DATA_DIR, 'subscriptions.sqlite3')
+    NOTIFY_ENABLED = True
+    NOTIFY_BATCH_SIZE = 200          # 한 번에 선점해 대상별로 묶어 보낼 알림 수
+    NOTIFY_MAX_ATTEMPTS = 5          # 전달 실패 시 최대 시도 횟수
+    NOTIFY_RETRY_SECONDS = 300       # 전달 실패/선점 만료 후 다시 보내기까지의 시간 (초)
+    SUBSCRIPTION_CONFIRM_RESEND = 60 * 60  # 확인 전 같은 대상에 확인 메시지를 다시 보내기까지의 시간 (초)
+    SMTP_HOST = os.environ.get('SMTP_HOST', 'localhost')
+    SMTP_PORT = int(os.environ.get('SMTP_PORT', 25))
+    SMTP_SENDER = os.environ.get('SMTP_SENDER', 'noreply@localhost')
+
+    # 응답 압축 설정 (brotli 패키지가 있으면 br 도 사용)
+    COMPRESS_MIN_SIZE = 500          # 이보다 작은 응답은 압축하지 않음 (바이트)
+    COMPRESS_LEVEL = 6               # gzip 압축 레벨
+    COMPRESS_BR_LEVEL = 5            # brotli 압축 레벨
+    COMPRESS_CACHE_SIZE = 128        # 미리 압축해 둔 본문 최대 개수
+    COMPRESS_MIMETYPES = {'application/json', 'text/html', 'text/css',
+                          'application/javascript', 'text/javascript', 'image/svg+xml',
+                          'application/manifest+json'}
+
+    # 프로파일링 설정 (기본 비활성)
+    PROFILING_SAMPLE_RATE = float(os.environ.get('PROFILING_SAMPLE_RATE', 0))  # 프로파일링할 요청 비율
+    PROFILING_ROUTE = os.environ.get('PROFILING_ROUTE') or None              # 특정 경로만 프로파일링
+    PROFILING_CRAWLS = os.environ.get('PROFILING_CRAWLS') == '1'             # 크롤링도 프로파일링
+    PROFILING_DIR = 'profiles'         # .prof / .folded 저장 위치
+    PROFILING_INTERVAL = 0.005         # 스택 샘플링 간격 (초)
+    PROFILING_TOKEN = os.environ.get('PROFILING_TOKEN')                      # /debug/profiling 접근 토큰
+
+    # 시작 설정
+    WARMUP_ON_CREATE = os.environ.get('HUFS_WARMUP') == '1'  # create_app() 직후 캐시/모듈 미리 로드
 
     BASE_DIR = os.path.abspath(os.path.dirname(__file__))
     STATIC_FOLDER = os.path.join(BASE_DIR, 'static')
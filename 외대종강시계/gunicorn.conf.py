@@ -0,0 +1,10 @@
+import os
+
+# gunicorn 설정: gunicorn -c gunicorn.conf.py wsgi:app
+# - preload_app: 마스터에서 앱을 불러오고 warm_up()(캐시 읽기만, 크롤링 없음) 실행 후 fork
+#   워커들은 불러온 모듈/학사일정/공지사항을 copy-on-write 로 공유
+
+bind = os.environ.get('HUFS_BIND', '0.0.0.0:8000')
+workers = int(os.environ.get('HUFS_WORKERS', 2))
+threads = int(os.environ.get('HUFS_THREADS', 4))
+preload_app = True
@@ -1,11 +1,6 @@
-import os
-import sys
+from app import create_app
 
-# Add the project root directory to Python path
-project_root = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, project_root)
-
-from app import app
+app = create_app()
 
 if __name__ == '__main__':
     app.run(debug=True)
\ No newline at end of file
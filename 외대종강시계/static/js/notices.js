@@ -1,6 +1,6 @@
 async function refreshNotices() {
     try {
-        const response = await fetch('/notices');
+        const response = await fetch('notices');
         const data = await response.json();
         
         // 테이블 내용 업데이트
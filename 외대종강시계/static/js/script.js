@@ -12,36 +12,150 @@ function getElement(selector) {
 
 /**
  * 시간 정보 업데이트 함수
+ * - 학사일정(/timeline)을 받아두면 남은 시간은 브라우저에서 직접 계산
+ * - 서버(/update)와는 SYNC_INTERVAL 마다 한 번만 동기화
+ * - 오프라인이면 캐시된 학사일정으로 계속 계산
  */
 let logCounter = 0;
+let timeline = null;       // 학기 시작/종료 일시
+let lastSync = 0;          // 마지막 서버 동기화 시각 (ms)
+let clockOffset = 0;       // 서버 시각 - 브라우저 시각 (ms)
+const SYNC_INTERVAL = 60 * 1000;
+
+function pad(value) {
+    return String(value).padStart(2, '0');
+}
+
+function formatDateTime(date) {
+    return `${date.getFullYear()}-${pad(date.getMonth() + 1)}-${pad(date.getDate())} ` +
+        `${pad(date.getHours())}:${pad(date.getMinutes())}:${pad(date.getSeconds())}`;
+}
+
+/**
+ * 서버의 HUFSClock.get_remaining_time() 과 같은 방식으로 남은 시간 계산
+ * @param {Date} now - 기준 시각
+ * @returns {object} /update 응답과 같은 구조
+ */
+function computeRemainingTime(now) {
+    // 서버와 같이 현재 연도 기준으로 학사일정 날짜 계산
+    const inYear = (iso, year) => {
+        const date = new Date(iso);
+        date.setFullYear(year);
+        return date;
+    };
+    const year = now.getFullYear();
+    const firstStart = inYear(timeline.first_start, year);
+    const firstEnd = inYear(timeline.first_end, year);
+    const secondStart = inYear(timeline.second_start, year);
+    const secondEnd = inYear(timeline.second_end, year);
+
+    let semester = 0;
+    if (firstStart <= now && now <= firstEnd) {
+        semester = 1;
+    } else if (secondStart <= now && now <= secondEnd) {
+        semester = 2;
+    }
+
+    let target;
+    if (semester === 1) {
+        target = firstEnd;
+    } else if (semester === 2) {
+        target = secondEnd;
+    } else if (now > secondEnd) {
+        target = inYear(timeline.first_start, year + 1);  // 연말 겨울방학 -> 내년 1학기 개강
+    } else if (now < firstStart) {
+        target = firstStart;  // 연초 겨울방학
+    } else {
+        target = secondStart;  // 여름방학
+    }
+
+    const total = Math.floor((target - now) / 1000);
+    const days = Math.floor(total / 86400);
+    const rest = total - days * 86400;
+    const targetLabel = `${pad(target.getMonth() + 1)}.${pad(target.getDate())}`;
+
+    let periodType;
+    if (days === 0 && semester !== 0) {
+        periodType = '종강! 고생했어요';
+    } else if (semester !== 0) {
+        periodType = `${semester}학기 종강(${targetLabel})까지`;
+    } else {
+        periodType = `다음 학기개강(${targetLabel})까지...`;
+    }
+
+    return {
+        days: days,
+        hours: Math.floor(rest / 3600),
+        minutes: Math.floor((rest % 3600) / 60),
+        seconds: rest % 60,
+        period_type: periodType,
+        current_time: formatDateTime(now)
+    };
+}
+
+function renderTime(data) {
+    const periodType = getElement('.period-type');
+    const timer = getElement('.timer');
+    const currentTime = getElement('#currentTime');
+
+    if (periodType && timer && currentTime) {
+        const timerText = `${data.days}일 ${data.hours}시간 ${data.minutes}분 ${data.seconds}초`;
+        periodType.textContent = data.period_type;
+        timer.textContent = timerText;
+        currentTime.textContent = data.current_time;
+        
+        if (logCounter % 10 === 0) {
+            console.log(`[${new Date().toLocaleTimeString()}] 시간 업데이트: ${timerText}`);
+        }
+        logCounter++;
+    }
+}
+
+function renderLocalTime() {
+    renderTime(computeRemainingTime(new Date(Date.now() + clockOffset)));
+}
 
 function updateTime() {
-    fetch('/update')
+    if (timeline && Date.now() - lastSync < SYNC_INTERVAL) {
+        renderLocalTime();
+        return;
+    }
+
+    lastSync = Date.now();
+    fetch('update')
         .then(response => response.json())
         .then(data => {
-            const periodType = getElement('.period-type');
-            const timer = getElement('.timer');
-            const currentTime = getElement('#currentTime');
-
-            if (periodType && timer && currentTime) {
-                const timerText = `${data.days}일 ${data.hours}시간 ${data.minutes}분 ${data.seconds}초`;
-                periodType.textContent = data.period_type;
-                timer.textContent = timerText;
-                currentTime.textContent = data.current_time;
-                
-                if (logCounter % 10 === 0) {
-                    console.log(`[${new Date().toLocaleTimeString()}] 시간 업데이트: ${timerText}`);
-                }
-                logCounter++;
+            clockOffset = new Date(data.current_time.replace(' ', 'T')) - Date.now();
+            renderTime(data);
+        })
+        .catch(error => {
+            if (timeline) {
+                renderLocalTime();  // 오프라인: 캐시된 학사일정으로 계산
+            } else {
+                console.error('시간 업데이트 실패:', error);
+            }
+        });
+}
+
+/**
+ * 학사일정 로드 (서비스 워커가 캐시해 두므로 오프라인에서도 사용 가능)
+ */
+function loadTimeline() {
+    fetch('timeline')
+        .then(response => response.json())
+        .then(data => {
+            if (!data.error) {
+                timeline = data;
             }
         })
-        .catch(error => console.error('시간 업데이트 실패:', error));
+        .catch(error => console.error('학사일정 로드 실패:', error));
 }
 
 // 자동 시간 업데이트 설정 (1초마다)
 setInterval(updateTime, 1000);
 
 // 초기 실행
+loadTimeline();
 updateTime(); // 초기 실행
 
 /**
@@ -78,7 +192,8 @@ async function refreshNotices() {
     console.log('새로고침 함수 호출됨');  // 디버깅 로그
     
     try {
-        const response = await fetch('/notices');
+        // 서비스 워커 캐시 대신 최신 공지사항 요청
+        const response = await fetch('notices', { cache: 'no-cache' });
         const data = await response.json();
         
         console.log('서버 응답:', data);  // 디버깅 로그
@@ -143,7 +258,7 @@ function showErrorMessage() {
  * 초기 학사일정 정보 로깅
  */
 function logInitialSchedule() {
-    fetch('/schedule')  // 새로운 엔드포인트 필요
+    fetch('schedule')  // 새로운 엔드포인트 필요
         .then(response => response.json())
         .then(data => {
             console.log('=== 학사일정 정보 ===');
@@ -161,6 +276,12 @@ function logInitialSchedule() {
 
 // 페이지 로드 시 저장된 테마 적용
 document.addEventListener('DOMContentLoaded', () => {
+    // 오프라인 지원용 서비스 워커 등록
+    if ('serviceWorker' in navigator) {
+        navigator.serviceWorker.register('sw.js')
+            .catch(error => console.error('서비스 워커 등록 실패:', error));
+    }
+
     // 초기 학사일정 정보 로깅
     logInitialSchedule();
     
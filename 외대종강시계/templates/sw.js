@@ -0,0 +1,72 @@
+/**
+ * HUFS 종강시계 서비스 워커 (서버에서 생성)
+ * - 앱 셸: 버전별 캐시에 미리 저장, 캐시 우선
+ * - 페이지/공지사항/학사일정: stale-while-revalidate
+ * - /update: 네트워크만 사용 (오프라인이면 페이지가 직접 계산)
+ * - 경로 접두사 테넌트(예: /seoul)는 BASE 아래 URL 만 다룸
+ */
+const VERSION = '{{ version }}';
+const BASE = {{ base|tojson }};
+const SHELL_CACHE = `hufs-shell${BASE}-${VERSION}`;
+const DATA_CACHE = `hufs-data${BASE}`;
+const SHELL_URLS = {{ shell_urls|tojson }};
+const DATA_URLS = ['/', '/timeline'].map(path => BASE + path);
+const SWR_PATHS = ['/', '/notices', '/timeline', '/schedule'].map(path => BASE + path);
+
+self.addEventListener('install', event => {
+    event.waitUntil(Promise.all([
+        caches.open(SHELL_CACHE).then(cache => cache.addAll(SHELL_URLS)),
+        caches.open(DATA_CACHE).then(cache => cache.addAll(DATA_URLS)),
+    ]).then(() => self.skipWaiting()));
+});
+
+self.addEventListener('activate', event => {
+    // 이전 버전의 앱 셸 캐시 삭제 (다른 테넌트의 캐시는 그대로 둠)
+    event.waitUntil(
+        caches.keys()
+            .then(keys => Promise.all(keys
+                .filter(key => key.startsWith(`hufs-shell${BASE}-`) && key !== SHELL_CACHE)
+                .map(key => caches.delete(key))))
+            .then(() => self.clients.claim())
+    );
+});
+
+/**
+ * 캐시된 응답을 바로 반환하고 백그라운드에서 갱신
+ * - 새로고침 버튼처럼 cache: 'no-cache' 로 요청하면 네트워크 우선
+ */
+async function staleWhileRevalidate(event) {
+    const cache = await caches.open(DATA_CACHE);
+    const cached = await cache.match(event.request);
+    const network = fetch(event.request)
+        .then(response => {
+            if (response.ok) {
+                cache.put(event.request, response.clone());
+            }
+            return response;
+        })
+        .catch(() => cached || Response.error());
+
+    if (cached && event.request.cache !== 'no-cache') {
+        event.waitUntil(network);
+        return cached;
+    }
+    return network;
+}
+
+async function cacheFirst(request) {
+    const cached = await caches.match(request);
+    return cached || fetch(request);
+}
+
+self.addEventListener('fetch', event => {
+    const url = new URL(event.request.url);
+    if (event.request.method !== 'GET' || url.origin !== self.location.origin) {
+        return;
+    }
+    if (SWR_PATHS.includes(url.pathname)) {
+        event.respondWith(staleWhileRevalidate(event));
+    } else if (url.pathname.startsWith(BASE + '/static/') || SHELL_URLS.includes(url.pathname)) {
+        event.respondWith(cacheFirst(event.request));
+    }
+});
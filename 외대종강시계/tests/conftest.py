@@ -0,0 +1,33 @@
+import os
+import sys
+
+import pytest
+
+"""
+pytest 공용 설정
+- 프로젝트 루트를 import 경로에 추가 (pytest 를 어느 디렉터리에서 실행해도 app, config 를 찾도록)
+- client: 요청 수락 제어와 워밍업을 끈 Flask 테스트 클라이언트
+- notice_store: 임시 파일을 쓰는 프로세스 공용 공지사항 저장소
+실행: python -m pytest -q
+"""
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def client(monkeypatch):
+    from app import create_app
+    from config import Config
+
+    monkeypatch.setattr(Config, 'ADMISSION_ENABLED', False)
+    return create_app(warm_up=False).test_client()
+
+
+@pytest.fixture
+def notice_store(tmp_path, monkeypatch):
+    from app.models import notice_store
+    from app.models.notice_store import NoticeStore
+
+    store = NoticeStore(str(tmp_path / 'notices.sqlite3'))
+    monkeypatch.setattr(notice_store, '_store', store)
+    return store
@@ -0,0 +1,78 @@
+import threading
+
+import pytest
+
+from app.admission import AdmissionController, client_id
+from config import Config
+
+"""
+요청 수락 제어: 클라이언트별 토큰 버킷(429), 동시 처리 상한과 대기열(503), 우선 경로 예약 슬롯
+"""
+
+
+def test_rate_limit_is_per_client_and_prefix():
+    controller = AdmissionController({'/notices': (1.0, 2)}, max_concurrent=10)
+    for _ in range(2):
+        assert controller.admit('1.1.1.1', '/notices') is None
+        controller.release()
+    status, retry_after = controller.admit('1.1.1.1', '/notices')
+    assert status == 429 and retry_after >= 1
+    # 다른 클라이언트, 한도가 없는 경로는 영향 없음
+    assert controller.admit('2.2.2.2', '/notices') is None
+    controller.release()
+    assert controller.admit('1.1.1.1', '/timeline') is None
+    controller.release()
+    stats = controller.get_stats()
+    assert stats['rate_limited'] == 1
+    assert stats['rate_limited_by_route'] == {'/notices': 1}
+    assert stats['shed_by_route'] == {}
+
+
+def test_reserved_slots_are_kept_for_priority_paths():
+    controller = AdmissionController({}, max_concurrent=3, reserved=1, priority_paths=('/',))
+    assert controller.admit('c', '/notices', wait=False) is None
+    assert controller.admit('c', '/notices', wait=False) is None
+    # 일반 경로는 예약 슬롯을 쓰지 않음
+    assert controller.admit('c', '/notices', wait=False)[0] == 503
+    assert controller.admit('c', '/', wait=False) is None
+    stats = controller.get_stats()
+    assert stats['inflight'] == 3
+    assert stats['admitted_priority'] == 1
+    assert stats['shed_by_route'] == {'/notices': 1}
+    for _ in range(3):
+        controller.release()
+
+
+def test_queued_request_gets_slot_when_released():
+    controller = AdmissionController({}, max_concurrent=1, max_queue=1, queue_timeout=5)
+    assert controller.admit('c', '/a') is None
+    result = []
+    waiter = threading.Thread(target=lambda: result.append(controller.admit('c', '/b')))
+    waiter.start()
+    while controller.get_stats()['queue_depth'] == 0:
+        pass
+    # 대기열이 가득 차면 기다리지 않고 바로 503
+    assert controller.admit('c', '/c')[0] == 503
+    controller.release()
+    waiter.join(5)
+    assert result == [None]
+    assert controller.get_stats()['queued'] == 1
+    controller.release()
+
+
+def test_queue_timeout_sheds():
+    controller = AdmissionController({}, max_concurrent=1, max_queue=1, queue_timeout=0.05)
+    assert controller.admit('c', '/a') is None
+    assert controller.admit('c', '/b') == (503, Config.ADMISSION_RETRY_AFTER)
+    controller.release()
+
+
+@pytest.mark.parametrize('trust, forwarded, expected', [
+    (False, '1.1.1.1', '10.0.0.1'),
+    (True, None, '10.0.0.1'),
+    (True, '6.6.6.6, 1.1.1.1', '1.1.1.1'),  # 앞쪽 주소는 클라이언트가 넣을 수 있으므로 마지막 주소 사용
+    (True, ' , ', '10.0.0.1'),
+])
+def test_client_id(monkeypatch, trust, forwarded, expected):
+    monkeypatch.setattr(Config, 'ADMISSION_TRUST_PROXY', trust)
+    assert client_id('10.0.0.1', forwarded) == expected
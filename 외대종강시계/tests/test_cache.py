@@ -0,0 +1,176 @@
+import socket
+import socketserver
+import threading
+import time
+
+import pytest
+
+from app.cache import FileSystemCache, MemoryCache, RedisCache, SQLiteCache
+
+"""
+캐시 백엔드: 공통 TTL 규칙(None=기본값, 0=만료 없음), 통계, 백엔드별 동작
+- redis 는 GET/SET/DEL/KEYS/SELECT 만 구현한 로컬 RESP 서버로 확인
+"""
+
+
+class _RespHandler(socketserver.StreamRequestHandler):
+    def _read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        args = []
+        for _ in range(int(line[1:-2])):
+            length = int(self.rfile.readline()[1:-2])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+    def _reply(self, value):
+        if value is None:
+            self.wfile.write(b'$-1\r\n')
+        elif isinstance(value, int):
+            self.wfile.write(b':%d\r\n' % value)
+        elif isinstance(value, list):
+            self.wfile.write(b'*%d\r\n' % len(value))
+            for item in value:
+                self._reply(item)
+        elif value == 'OK':
+            self.wfile.write(b'+OK\r\n')
+        else:
+            self.wfile.write(b'$%d\r\n%s\r\n' % (len(value), value))
+
+    def handle(self):
+        data = self.server.data
+        while True:
+            args = self._read_command()
+            if args is None:
+                return
+            name, args = args[0].upper(), args[1:]
+            for key, (_, expires_at) in list(data.items()):
+                if expires_at and expires_at <= time.time():
+                    del data[key]
+            if name == b'GET':
+                entry = data.get(args[0])
+                self._reply(entry[0] if entry else None)
+            elif name == b'SET':
+                expires_at = time.time() + int(args[3]) / 1000 if len(args) > 3 else 0
+                data[args[0]] = (args[1], expires_at)
+                self._reply('OK')
+            elif name == b'DEL':
+                self._reply(sum(data.pop(key, None) is not None for key in args))
+            elif name == b'KEYS':
+                prefix = args[0].rstrip(b'*')
+                self._reply([key for key in data if key.startswith(prefix)])
+            elif name == b'SELECT':
+                self._reply('OK')
+
+
+@pytest.fixture
+def resp_server():
+    server = socketserver.ThreadingTCPServer(('127.0.0.1', 0), _RespHandler)
+    server.daemon_threads = True
+    server.data = {}
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(params=['memory', 'filesystem', 'sqlite', 'redis'])
+def cache(request, tmp_path):
+    if request.param == 'memory':
+        return MemoryCache(default_timeout=60)
+    if request.param == 'filesystem':
+        return FileSystemCache(str(tmp_path / 'cache'), default_timeout=60)
+    if request.param == 'sqlite':
+        return SQLiteCache(str(tmp_path / 'cache.sqlite3'), default_timeout=60)
+    server = request.getfixturevalue('resp_server')
+    return RedisCache('127.0.0.1', server.server_address[1], db=1, default_timeout=60)
+
+
+def test_get_set_delete_and_stats(cache):
+    assert cache.get('a:b') is None
+    cache.set('a:b', {'value': [1, 2]})
+    assert cache.get('a:b') == {'value': [1, 2]}
+    assert cache.has('a:b') and not cache.has('missing')
+    cache.delete('a:b')
+    assert cache.get('a:b', 'default') == 'default'
+    stats = cache.get_stats()
+    assert (stats['hits'], stats['misses'], stats['sets'], stats['deletes']) == (1, 2, 1, 1)
+    assert stats['hit_rate'] == round(1 / 3, 4)
+    assert stats['backend'] == type(cache).__name__
+
+
+def test_ttl_rules(cache, monkeypatch):
+    cache.set('default', 1)
+    cache.set('short', 2, timeout=1)
+    cache.set('forever', 3, timeout=0)
+    real_time = time.time
+    monkeypatch.setattr(time, 'time', lambda: real_time() + 30)
+    if isinstance(cache, RedisCache):
+        # 만료는 서버(PX)가 처리하므로 가짜 시계 대신 실제로 기다림
+        monkeypatch.setattr(time, 'time', real_time)
+        time.sleep(1.1)
+    assert cache.get('short') is None
+    assert cache.get('default') == 1
+    assert cache.get('forever') == 3
+
+
+def test_get_or_set_calls_factory_once(cache):
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return 'built'
+
+    assert cache.get_or_set('key', factory) == 'built'
+    assert cache.get_or_set('key', factory) == 'built'
+    assert len(calls) == 1
+
+
+def test_clear(cache):
+    cache.set('a', 1)
+    cache.set('b', 2, timeout=0)
+    cache.clear()
+    assert cache.get('a') is None and cache.get('b') is None
+
+
+def test_filesystem_keys_do_not_collide(tmp_path):
+    cache = FileSystemCache(str(tmp_path))
+    cache.set('a:b', 1)
+    cache.set('a_b', 2)
+    cache.set('../escape', 3)
+    assert (cache.get('a:b'), cache.get('a_b'), cache.get('../escape')) == (1, 2, 3)
+    # 경로 구분자가 든 키도 캐시 디렉터리 안의 파일 하나
+    assert len(list(tmp_path.glob('*.cache'))) == 3
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(threshold=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+    assert cache.get('b') is None and cache.get('a') == 1
+    assert cache.get_stats()['evictions'] == 1
+
+
+def test_redis_prefix_partitions_and_clear(resp_server):
+    port = resp_server.server_address[1]
+    shared, tenant = RedisCache('127.0.0.1', port), RedisCache('127.0.0.1', port, key_prefix='hufs:glc:')
+    shared.set('key', 'shared')
+    tenant.set('key', 'tenant')
+    assert (shared.get('key'), tenant.get('key')) == ('shared', 'tenant')
+    tenant.clear()
+    assert tenant.get('key') is None
+    assert resp_server.data[b'hufs:key'][0]
+
+
+def test_redis_unavailable_degrades_to_misses():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    cache = RedisCache('127.0.0.1', port, socket_timeout=0.5)
+    cache.set('key', 1)
+    assert cache.get('key') is None
+    cache.delete('key')
+    cache.clear()
@@ -0,0 +1,86 @@
+import gzip
+import json
+from datetime import date
+
+import pytest
+from flask import jsonify
+
+from app import compression
+from app.compression import CompressedBodyCache, choose_encoding, compress_body
+from app.encoding import dumps
+from config import Config
+
+"""
+응답 인코딩: compact UTF-8 JSON, Accept-Encoding 협상, 압축 결과 LRU, after_request 압축
+"""
+
+BODY = dumps({'notices': [{'title': f'공지사항 {i}', 'writer': '학생지원팀'} for i in range(50)]})
+
+
+def test_dumps_is_compact_sorted_utf8():
+    assert dumps({'b': 1, 'a': '한글'}) == '{"a":"한글","b":1}'.encode('utf-8')
+    assert json.loads(dumps({'day': date(2026, 10, 19)}))['day']
+
+
+@pytest.mark.parametrize('header, expected', [
+    ('gzip, deflate', 'gzip'),
+    ('GZIP;q=0.5', 'gzip'),
+    ('gzip;q=0', None),
+    ('*', 'gzip'),
+    ('*, gzip;q=0', None),
+    ('deflate', None),
+    ('gzip;q=abc', None),
+    ('', None),
+    (None, None),
+])
+def test_choose_encoding_without_brotli(monkeypatch, header, expected):
+    monkeypatch.setattr(compression, 'brotli', None)
+    assert choose_encoding(header) == expected
+
+
+def test_choose_encoding_prefers_brotli_when_available(monkeypatch):
+    monkeypatch.setattr(compression, 'brotli', object())
+    assert choose_encoding('gzip, br') == 'br'
+    assert choose_encoding('gzip, br;q=0') == 'gzip'
+
+
+def test_compress_body_skips_small_bodies_and_reuses_results(monkeypatch):
+    monkeypatch.setattr(compression, 'brotli', None)
+    monkeypatch.setattr(compression, 'body_cache', CompressedBodyCache(maxsize=1))
+    assert compress_body(b'{}', 'gzip') == (b'{}', None)
+    compressed, encoding = compress_body(BODY, 'gzip')
+    assert encoding == 'gzip' and gzip.decompress(compressed) == BODY
+    assert compress_body(BODY, 'gzip')[0] is compressed
+    compress_body(BODY + b' ', 'gzip')  # maxsize 1 이라 앞 본문은 퇴출
+    assert compression.body_cache.get_stats() == {'hits': 1, 'misses': 2, 'size': 1}
+
+
+@pytest.fixture
+def app_client(client, monkeypatch):
+    monkeypatch.setattr(compression, 'brotli', None)
+    app = client.application
+
+    @app.route('/_test/large')
+    def large():
+        return jsonify(json.loads(BODY))
+
+    @app.route('/_test/small')
+    def small():
+        return jsonify({'ok': True})
+
+    return client
+
+
+def test_after_request_compresses_negotiated_json(app_client):
+    response = app_client.get('/_test/large', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert json.loads(gzip.decompress(response.data)) == json.loads(BODY)
+
+    response = app_client.get('/_test/large')
+    assert 'Content-Encoding' not in response.headers
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert len(response.data) == len(BODY) > Config.COMPRESS_MIN_SIZE
+
+    response = app_client.get('/_test/small', headers={'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in response.headers
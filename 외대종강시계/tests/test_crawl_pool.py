@@ -0,0 +1,100 @@
+import threading
+import time
+
+import pytest
+
+from app.models.crawler.pool import CrawlPool, CrawlQueueFull, CrawlTimeout
+
+"""
+공용 크롤링 작업 풀: 테넌트 간 라운드 로빈, 요청 작업 우선, 예약 스레드, 중복 작업 공유, 대기 시간 제한
+"""
+
+
+def _block(pool, tenant_id='gate'):
+    """풀 스레드 하나를 막아 두고 (시작 이벤트, 해제 이벤트) 반환"""
+    started, release = threading.Event(), threading.Event()
+
+    def gate():
+        started.set()
+        release.wait(5)
+    pool.submit(tenant_id, 'gate', gate, urgent=True)
+    assert started.wait(5)
+    return release
+
+
+def test_round_robin_across_tenants_with_urgent_first():
+    pool = CrawlPool(1, reserved=0)
+    release = _block(pool)
+    order = []
+    futures = [pool.submit('a', f'a{i}', lambda i=i: order.append(f'a{i}')) for i in range(3)]
+    futures += [pool.submit('b', f'b{i}', lambda i=i: order.append(f'b{i}')) for i in range(2)]
+    futures.append(pool.submit('c', 'c', lambda: order.append('c'), urgent=True))
+    release.set()
+    for future in futures:
+        future.result(5)
+    # 요청 작업이 먼저, 나머지는 한 테넌트가 몰아서 넣어도 번갈아 실행
+    assert order == ['c', 'a0', 'b0', 'a1', 'b1', 'a2']
+
+
+def test_background_jobs_leave_reserved_thread_for_requests():
+    pool = CrawlPool(2, reserved=1)
+    started, release = threading.Event(), threading.Event()
+    second_started = threading.Event()
+
+    def first():
+        started.set()
+        release.wait(5)
+    pool.submit('a', 'first', first)
+    assert started.wait(5)
+    pool.submit('a', 'second', second_started.set)
+    # 백그라운드 작업은 예약 스레드를 쓰지 않음
+    assert not second_started.wait(0.2)
+    # 요청이 기다리는 작업은 예약 스레드에서 바로 실행
+    assert pool.run('b', 'urgent', lambda: 'done', timeout=5) == 'done'
+    release.set()
+    assert second_started.wait(5)
+
+
+def test_same_key_is_coalesced():
+    pool = CrawlPool(1, reserved=0)
+    release = _block(pool)
+    calls = []
+    first = pool.submit('a', 'notices', lambda: calls.append(1) or len(calls))
+    second = pool.submit('a', 'notices', lambda: calls.append(2) or len(calls))
+    assert first is second
+    release.set()
+    assert first.result(5) == 1
+    assert calls == [1]
+    assert pool.get_stats()['tenants']['a']['coalesced'] == 1
+
+
+def test_background_queue_limit_is_per_tenant():
+    pool = CrawlPool(1, reserved=0, max_pending=2)
+    release = _block(pool)
+    pool.submit('a', 'a0', lambda: None)
+    pool.submit('a', 'a1', lambda: None)
+    with pytest.raises(CrawlQueueFull):
+        pool.submit('a', 'a2', lambda: None)
+    # 다른 테넌트와 요청 작업은 영향을 받지 않음
+    pool.submit('b', 'b0', lambda: None)
+    pool.submit('a', 'a3', lambda: None, urgent=True)
+    release.set()
+
+
+def test_run_times_out_but_job_keeps_running():
+    pool = CrawlPool(1, reserved=0, run_timeout=0.1)
+    finished = threading.Event()
+
+    def slow():
+        time.sleep(0.3)
+        finished.set()
+        return 'late'
+    with pytest.raises(CrawlTimeout):
+        pool.run('a', 'slow', slow)
+    assert finished.wait(5)
+
+
+def test_run_inside_worker_executes_inline():
+    pool = CrawlPool(1, reserved=0)
+    # 풀 스레드에서 다시 run() 해도 스레드가 하나뿐이라 교착되지 않음
+    assert pool.run('a', 'outer', lambda: pool.run('a', 'inner', lambda: 42), timeout=5) == 42
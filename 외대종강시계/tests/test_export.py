@@ -0,0 +1,82 @@
+import csv
+import io
+import json
+
+import pytest
+
+from app.export import iter_csv, iter_ndjson
+from app.models.notice_store import EXPORT_COLUMNS
+
+"""
+공지사항 내보내기: 배치 단위 스트리밍 직렬화, 작성일/작성자 필터, 잘못된 요청
+"""
+
+
+def _notice(article_id, posted, writer='학생지원팀'):
+    return {'date': posted[5:].replace('-', '.'), 'title': f'공지 {article_id}', 'writer': writer,
+            'posted': posted, 'link': f'https://www.hufs.ac.kr/bbs/hufs/2180/{article_id}/artclView.do'}
+
+
+@pytest.fixture
+def stored(notice_store):
+    notice_store.upsert_many([_notice(1, '2026-09-30'), _notice(2, '2026-10-01', '생활관'),
+                              _notice(3, '2026-10-19'), _notice(4, '2026-10-20')],
+                             seen_at='2026-10-20T09:00:00')
+    return notice_store
+
+
+def _article_ids(response):
+    return [json.loads(line)['article_id'] for line in response.get_data(as_text=True).splitlines()]
+
+
+def test_serializers_emit_one_chunk_per_batch():
+    row = (1, 2180, '2026-10-19', '10.19', '제목, 쉼표', '학생지원팀', 'https://x', '2026-10-19T09:00:00')
+    chunks = list(iter_ndjson([[row], [row, row]]))
+    assert len(chunks) == 2 and chunks[1].count(b'\n') == 2
+    assert json.loads(chunks[0]) == dict(zip(EXPORT_COLUMNS, row))
+
+    chunks = list(iter_csv([[row], [row]]))
+    assert len(chunks) == 2
+    rows = list(csv.reader(io.StringIO(b''.join(chunks).decode('utf-8-sig'))))
+    assert rows[0] == list(EXPORT_COLUMNS) and rows[1][4] == '제목, 쉼표'
+    # 행이 없으면 헤더만
+    assert b''.join(iter_csv([])).decode('utf-8-sig').strip() == ','.join(EXPORT_COLUMNS)
+
+
+def test_export_streams_store_in_batches(client, stored, monkeypatch):
+    from config import Config
+
+    monkeypatch.setattr(Config, 'EXPORT_BATCH_SIZE', 3)
+    response = client.get('/notices/export')
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.mimetype == 'application/x-ndjson'
+    assert 'attachment' in response.headers['Content-Disposition']
+    assert _article_ids(response) == [1, 2, 3, 4]
+
+    response = client.get('/notices/export?format=csv&writer=생활관')
+    assert response.mimetype == 'text/csv'
+    rows = list(csv.reader(io.StringIO(response.get_data().decode('utf-8-sig'))))
+    assert [row[0] for row in rows[1:]] == ['2']
+
+
+@pytest.mark.parametrize('query, expected', [
+    ('since=2026-10-01&until=2026-10-19', [2, 3]),
+    ('since=2026-10-19', [3, 4]),
+    ('until=2026-09-30', [1]),
+    # 다른 ISO 표기도 YYYY-MM-DD 로 맞춰 비교
+    ('since=20261001&until=20261019', [2, 3]),
+])
+def test_export_filters_by_posted_date(client, stored, query, expected):
+    assert _article_ids(client.get(f'/notices/export?{query}')) == expected
+
+
+@pytest.mark.parametrize('query, error', [
+    ('format=xml', 'invalid_format'),
+    ('since=2026-13-01', 'invalid_date'),
+    ('until=yesterday', 'invalid_date'),
+])
+def test_export_rejects_bad_requests(client, stored, query, error):
+    response = client.get(f'/notices/export?{query}')
+    assert response.status_code == 400
+    assert response.get_json()['error'] == error
@@ -0,0 +1,137 @@
+from datetime import date, datetime
+
+import pytest
+import requests
+
+from app import cache as cache_module
+from app.cache import MemoryCache
+from app.models.crawler import meal as meal_module
+from app.models.crawler.meal import HUFSMealCrawler, meal_period, week_key
+from app.models.timesource import FixedTimeSource, set_time_source
+from config import Config
+
+"""
+학식 메뉴: 주간 표 추출, 주 단위 캐시(작업 풀 크롤링, 워커 간 공유, 실패 재시도), 응답 ETag/Cache-Control
+"""
+
+HTML = """
+<table>
+  <tr><th>구분</th><th>월</th><th>화</th><th>수</th><th>목</th><th>금</th><th>토</th><th>일</th></tr>
+  <tr><td>중식<br>11:30~13:30</td><td>김치찌개<br>계란말이<br>5,000원</td><td>돈까스<br>12:00~13:00</td>
+      <td></td><td></td><td></td><td></td><td></td></tr>
+</table>
+"""
+
+
+class _Response:
+    text = HTML
+
+
+class _Pool:
+    def __init__(self):
+        self.jobs = {}
+
+    def submit(self, tenant_id, key, func, urgent=False):
+        self.jobs.setdefault(key, func)
+
+    def run_all(self):
+        jobs, self.jobs = self.jobs, {}
+        for func in jobs.values():
+            func()
+
+
+@pytest.fixture
+def clock():
+    time_source = FixedTimeSource(datetime(2026, 10, 19, 12, 0))  # 월요일 점심
+    previous = set_time_source(time_source)
+    yield time_source
+    set_time_source(previous)
+
+
+@pytest.fixture
+def pool(clock, monkeypatch):
+    pool = _Pool()
+    monkeypatch.setattr(meal_module, 'get_crawl_pool', lambda: pool)
+    monkeypatch.setattr(meal_module, 'fetch', lambda url, headers=None: _Response())
+    monkeypatch.setattr(cache_module, '_cache', MemoryCache())
+    monkeypatch.setattr(HUFSMealCrawler, '_weeks', {})
+    return pool
+
+
+def test_extract_week_splits_menu_price_and_time():
+    days = HUFSMealCrawler()._extract_week(HTML, date(2026, 10, 19))
+    assert len(days) == 7
+    assert days['2026-10-19'] == [{'meal': '중식', 'time': '11:30~13:30', 'price': '5,000원',
+                                   'menu': ['김치찌개', '계란말이']}]
+    assert days['2026-10-20'][0]['time'] == '12:00~13:00'
+    assert days['2026-10-21'] == []
+
+
+def test_meal_period_boundaries():
+    assert meal_period(datetime(2026, 10, 19, 9, 29)) == ('조식', datetime(2026, 10, 19, 9, 30))
+    assert meal_period(datetime(2026, 10, 19, 9, 30)) == ('중식', datetime(2026, 10, 19, 14, 0))
+    assert meal_period(datetime(2026, 10, 19, 20, 0)) == (None, datetime(2026, 10, 20, 0, 0))
+    assert week_key(date(2026, 10, 19)) == '2026-W43'
+
+
+def test_week_is_crawled_once_on_pool_and_shared(pool, clock):
+    crawler = HUFSMealCrawler()
+    week = crawler.get_week()
+    assert week['pending'] and week['updated'] is None
+    crawler.get_week()
+    assert list(pool.jobs) == ['meals:2026-W43']
+
+    pool.run_all()
+    week = crawler.get_week()
+    assert 'pending' not in week and not week['failed']
+    assert week['expires'] == '2026-10-26T00:00:00'
+    assert week['cafeterias'][0]['days']['2026-10-19'][0]['menu'] == ['김치찌개', '계란말이']
+
+    # 메모리에 없는 다른 워커는 공용 캐시에서 읽음
+    HUFSMealCrawler._weeks.clear()
+    assert HUFSMealCrawler().get_week() == week
+    assert pool.jobs == {}
+
+
+def test_failed_crawl_is_retried_after_timeout(pool, clock, monkeypatch):
+    def fail(url, headers=None):
+        raise requests.ConnectionError('down')
+
+    monkeypatch.setattr(meal_module, 'fetch', fail)
+    crawler = HUFSMealCrawler()
+    crawler.get_week()
+    pool.run_all()
+    week = crawler.get_week()
+    assert week['failed'] and week['expires'] == '2026-10-19T12:10:00'
+
+    monkeypatch.setattr(meal_module, 'fetch', lambda url, headers=None: _Response())
+    clock.advance(seconds=Config.MEAL_RETRY_TIMEOUT + 1)
+    # 만료된 실패 결과는 대기 중 표시와 함께 돌려주고 다시 크롤링
+    assert crawler.get_week()['pending']
+    pool.run_all()
+    assert not crawler.get_week()['failed']
+
+
+def test_meal_responses_use_etag_and_cache_control(client, pool, clock):
+    response = client.get('/meals/today')
+    assert response.status_code == 200
+    assert response.get_json()['pending'] and response.cache_control.no_cache
+
+    pool.run_all()
+    response = client.get('/meals/today')
+    body = response.get_json()
+    assert body['current_meal'] == '중식' and body['valid_until'] == '2026-10-19T14:00:00'
+    assert body['cafeterias'][0]['meals'][0]['price'] == '5,000원'
+    assert response.cache_control.public and response.cache_control.max_age == 2 * 3600
+    etag = response.headers['ETag']
+    assert client.get('/meals/today', headers={'If-None-Match': etag}).status_code == 304
+
+    # 식사 구간이 바뀌면 응답과 ETag 도 바뀜
+    clock.set(datetime(2026, 10, 19, 23, 0))
+    response = client.get('/meals/today', headers={'If-None-Match': etag})
+    assert response.status_code == 200 and response.headers['ETag'] != etag
+    assert response.cache_control.max_age == 3600
+
+    # 주간 메뉴는 주가 끝나는 시각(expires)보다 오래 캐시하지 않음
+    clock.set(datetime(2026, 10, 25, 23, 30))
+    assert client.get('/meals/week').cache_control.max_age == 30 * 60
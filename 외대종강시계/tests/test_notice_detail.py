@@ -0,0 +1,84 @@
+import pytest
+import requests
+
+from app.models import search_index
+from app.models.crawler import detail as detail_module
+from app.models.crawler.detail import HUFSNoticeDetailCrawler
+from app.models.search_index import NoticeSearchIndex
+from config import Config
+
+"""
+공지사항 상세 페이지: 저장소 보관, 실패한 게시글의 다시 시도 대기, 미리 수집 예약
+"""
+
+LINK = 'https://www.hufs.ac.kr/bbs/hufs/2180/{}/artclView.do'
+HTML = ('<div class="artclView"><p>신청 기간은 다음 주까지입니다</p></div>'
+        '<dl><dt>작성일</dt><dd>2026.10.19 09:30</dd></dl>'
+        '<a href="/download.do?id=1">신청서.hwp</a>')
+
+
+class _Response:
+    text = HTML
+
+
+class _Pool:
+    def __init__(self):
+        self.keys = []
+
+    def submit(self, tenant_id, key, func, urgent=False):
+        self.keys.append(key)
+
+
+@pytest.fixture
+def crawler(notice_store, monkeypatch):
+    notice_store.upsert_many([{'date': '10.19', 'title': '장학금 안내', 'writer': '학생지원팀',
+                               'posted': '2026-10-19', 'link': LINK.format(article_id)}
+                              for article_id in (1, 2, 3)])
+    index = NoticeSearchIndex(notice_store)
+    index.sync()
+    monkeypatch.setattr(search_index, '_index', index)
+    return HUFSNoticeDetailCrawler()
+
+
+def test_fetched_detail_is_kept_in_store(crawler, notice_store, monkeypatch, client):
+    monkeypatch.setattr(detail_module, 'fetch', lambda url, headers=None: _Response())
+    detail = crawler.fetch_detail(LINK.format(1))
+    assert detail['body'] == '신청 기간은 다음 주까지입니다'
+    assert detail['attachments'] == ['신청서.hwp']
+    assert detail['posted'] == '2026-10-19T09:30:00'
+    assert crawler.get_detail(1) == detail
+    assert notice_store.details_due([1, 2]) == {2}
+    assert [notice['title'] for notice in search_index.get_search_index().search('신청 기간')] == ['장학금 안내']
+
+    assert client.get('/notices/1').get_json()['body'] == detail['body']
+    assert client.get('/notices/2').status_code == 404
+
+
+def test_failed_fetch_backs_off(crawler, notice_store, monkeypatch):
+    def fail(url, headers=None):
+        raise requests.ConnectionError('down')
+
+    monkeypatch.setattr(detail_module, 'fetch', fail)
+    assert crawler.fetch_detail(LINK.format(1)) is None
+    first = notice_store.record_detail_failure(1, now=1000.0)
+    assert first == 1000.0 + Config.DETAIL_RETRY_SECONDS * 2
+    assert notice_store.details_due([1], now=first - 1) == set()
+    assert notice_store.details_due([1], now=first) == {1}
+    # 대기 시간은 실패할 때마다 2배, 상한 DETAIL_RETRY_MAX_SECONDS
+    for _ in range(20):
+        retry_at = notice_store.record_detail_failure(1, now=1000.0)
+    assert retry_at == 1000.0 + Config.DETAIL_RETRY_MAX_SECONDS
+
+    monkeypatch.setattr(detail_module, 'fetch', lambda url, headers=None: _Response())
+    crawler.fetch_detail(LINK.format(1))
+    assert notice_store.details_due([1], now=0) == set()
+
+
+def test_prefetch_schedules_only_due_details(crawler, notice_store, monkeypatch):
+    pool = _Pool()
+    monkeypatch.setattr(detail_module, 'get_crawl_pool', lambda: pool)
+    notice_store.save_detail(1, b'')
+    notice_store.record_detail_failure(2)
+    notices = [{'link': LINK.format(article_id)} for article_id in (1, 2, 3)] + [{'link': 'https://x'}]
+    assert crawler.prefetch(notices) == 1
+    assert pool.keys == ['detail:3']
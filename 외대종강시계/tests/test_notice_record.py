@@ -0,0 +1,85 @@
+from datetime import date, datetime
+
+import pytest
+
+from app.models.notice_record import NoticeRecord
+from app.models.timesource import FixedTimeSource, set_time_source
+from app.models.writer_index import WriterIndex
+
+"""
+공지사항 레코드와 작성자 색인: 작성일 연도 추정(시각 공급자 기준), 저장된 링크 보존, 작성자별 최신순 조회
+"""
+
+LINK = 'https://www.hufs.ac.kr/bbs/hufs/2180/239886/artclView.do'
+
+
+@pytest.fixture
+def clock():
+    time_source = FixedTimeSource(datetime(2026, 1, 5, 9, 0))
+    previous = set_time_source(time_source)
+    yield time_source
+    set_time_source(previous)
+
+
+def _notice(**overrides):
+    return dict({'date': '01.02', 'title': '장학금 안내', 'writer': '학생지원팀', 'link': LINK}, **overrides)
+
+
+def test_year_comes_from_time_source(clock):
+    assert NoticeRecord.from_notice(_notice()).posted == date(2026, 1, 2)
+    # 1월에 본 12월 게시글은 작년 게시글
+    assert NoticeRecord.from_notice(_notice(date='12.30')).posted == date(2025, 12, 30)
+    clock.set(datetime(2027, 3, 1))
+    assert NoticeRecord.from_notice(_notice()).posted == date(2027, 1, 2)
+    # 작성일이 있으면 그대로 사용
+    assert NoticeRecord.from_notice(_notice(date='12.30'), '2026-12-30').posted == date(2026, 12, 30)
+
+
+def test_invalid_notices_are_skipped(clock):
+    assert NoticeRecord.from_notice(_notice(link='https://www.hufs.ac.kr/other')) is None
+    assert NoticeRecord.from_notice(_notice(date='13.40')) is None
+    assert NoticeRecord.from_notice(_notice(posted='2026-02-30')) is None
+
+
+@pytest.mark.parametrize('link', [
+    LINK,
+    LINK + '?layout=unknown&page=2',
+    'http://hufs.ac.kr/bbs/hufs/2180/239886/artclView.do',
+])
+def test_stored_link_is_kept(clock, link):
+    record = NoticeRecord.from_notice(_notice(link=link))
+    assert record.article_id == 239886 and record.board_id == 2180
+    assert record.link == link
+    assert record.to_dict() == {'date': '01.02', 'title': '장학금 안내', 'writer': '학생지원팀', 'link': link}
+
+
+def test_records_are_compact_and_share_writers(clock):
+    first = NoticeRecord.from_notice(_notice(writer=''.join(['학생', '지원팀'])))
+    second = NoticeRecord.from_notice(_notice(link=LINK.replace('239886', '239887')))
+    assert not hasattr(first, '__dict__')
+    assert first.writer is second.writer
+    assert first.date == second.date == '01.02'
+
+
+def _posted(article_id, writer, posted='2026-10-19'):
+    return {'date': posted[5:].replace('-', '.'), 'title': f'공지 {article_id}', 'writer': writer,
+            'posted': posted, 'link': LINK.replace('239886', str(article_id))}
+
+
+def test_writer_index_queries_newest_first():
+    index = WriterIndex(store=object())
+    assert index.update([_posted(1, '학생지원팀'), _posted(3, '생활관'), _posted(2, '학생지원팀'),
+                         {'date': '10.19', 'title': '링크 없음', 'writer': '생활관', 'link': ''}]) == 3
+    assert [notice['title'] for notice in index.query(['학생지원팀', '생활관'])] == ['공지 3', '공지 2', '공지 1']
+    assert [notice['title'] for notice in index.query(['학생지원팀', '없는 부서'], limit=1)] == ['공지 2']
+    assert index.query(['없는 부서']) == []
+    assert index.facets() == [{'writer': '학생지원팀', 'count': 2}, {'writer': '생활관', 'count': 1}]
+
+
+def test_writer_index_moves_notice_when_writer_changes():
+    index = WriterIndex(store=object())
+    index.update([_posted(1, '학생지원팀'), _posted(2, '학생지원팀')])
+    index.update([_posted(1, '생활관')])
+    assert len(index) == 2
+    assert [notice['link'] for notice in index.query(['생활관'])] == [LINK.replace('239886', '1')]
+    assert index.facets() == [{'writer': '생활관', 'count': 1}, {'writer': '학생지원팀', 'count': 1}]
@@ -0,0 +1,96 @@
+import os
+
+import pytest
+
+from app.models.crawler.archive_cli import rebuild_notice_store
+from app.models.notice_store import NoticeStore
+from app.models.search_index import NoticeSearchIndex
+from app.models.writer_index import WriterIndex
+
+"""
+공지사항 저장소: 변경 번호(seq) 기준 색인 동기화, 재구성 결과 교체
+"""
+
+
+def _notice(article_id, title='장학금 안내', writer='학생지원팀'):
+    return {'date': '10.19', 'title': title, 'writer': writer, 'posted': '2026-10-19',
+            'link': f'https://www.hufs.ac.kr/bbs/hufs/2180/{article_id}/artclView.do'}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return NoticeStore(str(tmp_path / 'notices.sqlite3'))
+
+
+def test_seq_only_moves_for_new_or_changed_rows(store):
+    assert store.upsert_many([_notice(1), _notice(2)]) == [1, 2]
+    seq = store.max_seq()
+    assert store.upsert_many([_notice(1), _notice(2)]) == []
+    assert store.changed_since(seq) == []
+    store.upsert_many([_notice(1, title='장학금 안내 (수정)'), _notice(2)])
+    assert [row[3] for row in store.changed_since(seq)] == ['장학금 안내 (수정)']
+
+
+def test_indexes_pick_up_edits_to_existing_rows(store):
+    store.upsert_many([_notice(1), _notice(2, title='수강신청 안내', writer='학사지원팀')])
+    writers, search = WriterIndex(store), NoticeSearchIndex(store)
+    assert writers.sync() == 2 and search.sync() == 2
+    # 다른 워커가 기존 게시글의 작성자와 제목을 바꾼 경우
+    store.upsert_many([_notice(1, title='기숙사 입사 안내', writer='생활관')])
+    assert writers.sync() == 1 and search.sync() == 1
+    assert writers.query(['학생지원팀']) == []
+    assert [notice['title'] for notice in writers.query(['생활관'])] == ['기숙사 입사 안내']
+    assert search.search('장학') == []
+    assert [notice['title'] for notice in search.search('기숙사')] == ['기숙사 입사 안내']
+
+
+class _Archive:
+    """스냅샷 목록만 흉내 내는 보관소"""
+
+    def __init__(self, root, snapshots):
+        self.root = root
+        self.snapshots = snapshots
+
+    def iter_snapshots(self, url):
+        return iter(self.snapshots)
+
+
+def test_rebuild_keeps_live_store_on_failure(store, tmp_path):
+    store.upsert_many([_notice(1), _notice(2)])
+    broken = _Archive(str(tmp_path / 'archive'), [(None, '2026-10-19T00:00:00', 'missing')])
+    with pytest.raises(Exception):
+        rebuild_notice_store(broken, store, workers=1)
+    assert store.count() == 2
+    assert not [name for name in os.listdir(tmp_path) if '.rebuild-' in name]
+
+
+def test_rebuild_replaces_rows_and_indexes_resync(store, tmp_path):
+    store.upsert_many([_notice(1)])
+    writers = WriterIndex(store)
+    writers.sync()
+    result = rebuild_notice_store(_Archive(str(tmp_path / 'archive'), []), store, workers=1)
+    assert result['notices'] == 0
+    assert store.count() == 0
+    store.upsert_many([_notice(3, writer='생활관')])
+    # 교체된 게시글의 변경 번호는 이전 번호 뒤에서 이어지므로 색인이 놓치지 않음
+    assert writers.sync() == 1
+    assert [notice['writer'] for notice in writers.query(['생활관'])] == ['생활관']
+    assert not [name for name in os.listdir(tmp_path) if '.rebuild-' in name]
+
+
+def test_replace_keeps_other_connections_usable(store, tmp_path):
+    # 같은 파일을 연 다른 워커 (연결과 WAL 을 그대로 둔 채 교체되어야 함)
+    other = NoticeStore(store.path)
+    other.upsert_many([_notice(1), _notice(2)])
+    before = other.max_seq()
+
+    rebuilt = NoticeStore(str(tmp_path / 'rebuilt.sqlite3'))
+    rebuilt.upsert_many([_notice(5, writer='생활관')])
+    rebuilt.close()
+    store.replace_with(rebuilt.path)
+
+    assert os.path.exists(store.path + '-wal')
+    assert other.count() == 1
+    assert [row[4] for row in other.changed_since(before)] == ['생활관']
+    other.upsert_many([_notice(6)])
+    assert store.count() == 2
@@ -0,0 +1,51 @@
+from datetime import datetime
+
+import pytest
+
+from app import cache as cache_module
+from app.cache import MemoryCache
+from app.models.crawler.schedule import HUFSScheduleCrawler
+from app.models.timesource import FixedTimeSource, set_time_source
+from app.payloads import build_schedule_payload, build_timeline_payload
+
+"""
+학사일정 응답 캐시: 시스템 시각이면 캐시, 시각 공급자를 바꾸면 매번 그 시각으로 계산
+"""
+
+SCHEDULE = {'first_start': '03.02', 'first_end': '06.20', 'second_start': '09.01', 'second_end': '12.19'}
+
+
+@pytest.fixture(autouse=True)
+def schedule(monkeypatch):
+    calls = []
+
+    def get_schedule(self):
+        calls.append(1)
+        return SCHEDULE
+
+    monkeypatch.setattr(HUFSScheduleCrawler, 'get_schedule', get_schedule)
+    monkeypatch.setattr(cache_module, '_cache', MemoryCache())
+    return calls
+
+
+@pytest.fixture
+def clock():
+    time_source = FixedTimeSource(datetime(2026, 10, 19, 12, 0))
+    previous = set_time_source(time_source)
+    yield time_source
+    set_time_source(previous)
+
+
+def test_system_time_payload_is_cached(schedule):
+    assert build_schedule_payload() == build_schedule_payload()
+    assert len(schedule) == 1
+
+
+def test_fixed_time_source_bypasses_cache(clock):
+    assert build_schedule_payload() == {'is_semester': True, 'current_semester': 2,
+                                        'end_date': '2026년 12월 19일'}
+    clock.set(datetime(2026, 12, 25))
+    assert build_schedule_payload() == {'is_semester': False, 'current_semester': 0,
+                                        'next_start_date': '2027년 03월 02일'}
+    clock.set(datetime(2030, 4, 1))
+    assert build_timeline_payload()['first_start'] == '2030-03-02T00:00:00'
@@ -0,0 +1,78 @@
+import multiprocessing
+
+import pytest
+
+from app.models.crawler.ratelimit import HostRateLimiter, RateLimitTimeout
+
+"""
+호스트 공용 속도 제한기: 접두사/호스트별 버킷, 대기 시간 상한, Retry-After 멈춤, 프로세스 간 파일 잠금
+"""
+
+NOTICE_URL = 'https://www.hufs.ac.kr/hufs/11281/subview.do'
+DETAIL_URL = 'https://www.hufs.ac.kr/bbs/hufs/2180/1/artclView.do'
+
+
+@pytest.fixture
+def state_path(tmp_path):
+    return str(tmp_path / 'ratelimit.json')
+
+
+def _acquire_all(limiter, url, count):
+    acquired = 0
+    for _ in range(count):
+        try:
+            limiter.acquire(url)
+        except RateLimitTimeout:
+            continue
+        acquired += 1
+    return acquired
+
+
+def test_buckets_are_per_host_and_longest_prefix(state_path):
+    limiter = HostRateLimiter(state_path, {'/': (0.01, 2), '/bbs/': (0.01, 1)}, max_wait=0)
+    assert limiter._bucket_for(DETAIL_URL) == ('www.hufs.ac.kr/bbs/', '/bbs/')
+    assert limiter._bucket_for('https://Other.Example/x') == ('other.example/', '/')
+    assert _acquire_all(limiter, NOTICE_URL, 3) == 2
+    assert _acquire_all(limiter, DETAIL_URL, 3) == 1
+    # 다른 학교(호스트)는 따로 예산을 씀
+    assert _acquire_all(limiter, 'https://other.example/notice', 3) == 2
+    stats = limiter.get_stats()
+    assert stats['acquired'] == 5 and stats['timeouts'] == 4 and stats['waiting'] == 0
+
+
+def test_waits_for_refill_within_max_wait(state_path):
+    limiter = HostRateLimiter(state_path, {'/': (20.0, 1)}, max_wait=1)
+    limiter.acquire(NOTICE_URL)
+    limiter.acquire(NOTICE_URL)
+    stats = limiter.get_stats()
+    assert stats['delayed'] == 1 and 0 < stats['max_wait'] < 1
+
+
+def test_penalize_blocks_only_that_bucket(state_path):
+    limiter = HostRateLimiter(state_path, {'/': (100.0, 5), '/bbs/': (100.0, 5)}, max_wait=0.5)
+    limiter.penalize(DETAIL_URL, 30)
+    with pytest.raises(RateLimitTimeout):
+        limiter.acquire(DETAIL_URL)
+    limiter.acquire(NOTICE_URL)
+    # 상태 파일을 읽는 다른 워커도 멈춤을 따름
+    with pytest.raises(RateLimitTimeout):
+        HostRateLimiter(state_path, limiter.budgets, max_wait=0.5).acquire(DETAIL_URL)
+    assert limiter.get_stats()['throttled'] == 1
+
+
+def _worker(state_path, count, results):
+    limiter = HostRateLimiter(state_path, {'/': (0.001, 10)}, max_wait=0)
+    results.put(_acquire_all(limiter, NOTICE_URL, count))
+
+
+def test_workers_share_one_budget_through_file_lock(state_path):
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    workers = [context.Process(target=_worker, args=(state_path, 10, results)) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    acquired = [results.get(timeout=60) for _ in workers]
+    for worker in workers:
+        worker.join(timeout=60)
+    # 네 워커가 동시에 시도해도 버스트 10 개만 나눠 가짐 (잠금 없이 읽고 쓰면 넘침)
+    assert sum(acquired) == 10
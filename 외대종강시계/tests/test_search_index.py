@@ -0,0 +1,63 @@
+import json
+import zlib
+
+from app.models.search_index import NoticeSearchIndex, ngrams
+
+"""
+검색 색인: n-gram 부분 일치, 제목 가중 점수, 저장소 변경분과 상세 본문 동기화
+"""
+
+
+def _notice(article_id, title='장학금 안내', writer='학생지원팀'):
+    return {'date': '10.19', 'title': title, 'writer': writer, 'posted': '2026-10-19',
+            'link': f'https://www.hufs.ac.kr/bbs/hufs/2180/{article_id}/artclView.do'}
+
+
+def test_ngrams_normalize_and_split_words():
+    grams = ngrams('ＡＢ 신입학')
+    assert grams['ab'] == 1 and grams['신입학'] == 1 and grams['입'] == 1
+    assert 'b신' not in grams
+
+
+def test_partial_word_and_all_terms_required():
+    search = NoticeSearchIndex(store=object())
+    search.update([_notice(1, '2026학년도 전기 신입학 모집'), _notice(2, '2026학년도 편입학 모집'),
+                   _notice(3, '신입생 오리엔테이션')])
+    assert [notice['title'] for notice in search.search('신입학')] == ['2026학년도 전기 신입학 모집']
+    assert sorted(notice['title'] for notice in search.search('학년도 모집')) == \
+        ['2026학년도 전기 신입학 모집', '2026학년도 편입학 모집']
+    assert search.search('신입학 편입') == []
+    assert search.search('  ') == []
+
+
+def test_title_match_outranks_body_match():
+    search = NoticeSearchIndex(store=object())
+    search.update([_notice(1, '기숙사 입사 안내'), _notice(2, '생활관 공지')])
+    search.add_body(2, '기숙사 점검 일정을 알려드립니다')
+    results = search.search('기숙사')
+    assert [notice['title'] for notice in results] == ['기숙사 입사 안내', '생활관 공지']
+    assert results[0]['score'] > results[1]['score']
+
+
+def test_retitled_notice_keeps_indexed_body():
+    search = NoticeSearchIndex(store=object())
+    search.update([_notice(7)])
+    search.add_body(7, '신청 기간은 다음 주까지입니다')
+    search.update([_notice(7, title='장학금 안내 (연장)')])
+    assert [notice['title'] for notice in search.search('신청 기간')] == ['장학금 안내 (연장)']
+
+
+def test_body_fetched_by_another_worker_reaches_index(notice_store):
+    notice_store.upsert_many([_notice(1)])
+    fetching, other = NoticeSearchIndex(notice_store), NoticeSearchIndex(notice_store)
+    assert fetching.sync() == 1 and other.sync() == 1
+
+    # 상세 본문을 수집한 워커 (HUFSNoticeDetailCrawler.fetch_detail 과 같은 순서)
+    detail = {'article_id': 1, 'body': '신청 기간은 다음 주까지입니다', 'attachments': [], 'posted': None}
+    notice_store.save_detail(1, zlib.compress(json.dumps(detail, ensure_ascii=False).encode('utf-8')))
+    fetching.add_body(1, detail['body'])
+
+    assert other.search('신청 기간') == []
+    assert other.sync() == 1
+    assert [notice['title'] for notice in other.search('신청 기간')] == ['장학금 안내']
+    assert fetching.sync() == 1 and fetching.get_stats()['bodies'] == 1
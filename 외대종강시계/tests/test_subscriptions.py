@@ -0,0 +1,124 @@
+import random
+import time
+
+import pytest
+
+from app.models.subscriptions import (KeywordAutomaton, SubscriptionMatcher, SubscriptionStore,
+                                      normalize_keyword)
+from config import Config
+
+"""
+키워드 구독: Aho-Corasick 오토마톤 일치 결과, 구독 확인, 전달 대기열 선점/재시도
+"""
+
+NOTICE = {'date': '10.19', 'title': '장학금 신청 안내', 'writer': '학생지원팀',
+          'link': 'https://www.hufs.ac.kr/bbs/hufs/2180/100/artclView.do'}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SubscriptionStore(str(tmp_path / 'subscriptions.sqlite3'))
+
+
+def _confirmed(store, keyword, channel='webhook', target='https://example.com/hook'):
+    subscription_id, _, token = store.add(keyword, channel, target)
+    store.confirm(token)
+    return subscription_id
+
+
+def test_automaton_overlapping_keywords():
+    automaton = KeywordAutomaton(['he', 'she', 'his', 'hers', '장학', '장학금', '학금'])
+    assert automaton.find('ushers') == {'he', 'she', 'hers'}
+    assert automaton.find('2026 장학금 안내') == {'장학', '장학금', '학금'}
+    assert automaton.find('수강신청') == set()
+
+
+def test_automaton_matches_naive_search():
+    rng = random.Random(0)
+    alphabet = 'abc장학금'
+    keywords = {''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(200)}
+    automaton = KeywordAutomaton(keywords)
+    for _ in range(300):
+        text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+        assert automaton.find(text) == {keyword for keyword in keywords if keyword in text}
+
+
+def test_unconfirmed_subscriptions_do_not_match(store):
+    subscription_id, confirmed, token = store.add('장학', 'email', 'a@example.com')
+    assert not confirmed and token
+    matcher = SubscriptionMatcher(store)
+    assert matcher.match([(100, NOTICE)]) == []
+
+    # 같은 대상의 두 번째 구독은 확인 메시지를 다시 보내지 않고 같은 토큰으로 함께 확인
+    second_id, _, second_token = store.add('신청', 'email', 'a@example.com')
+    assert second_token is None
+    assert store.confirm(token) == 2
+    assert store.confirm(token) == 0
+    matched = {(sid, keyword) for sid, _, keyword, _ in matcher.match([(100, NOTICE)])}
+    assert matched == {(subscription_id, '장학'), (second_id, '신청')}
+    assert store.add('장학', 'email', 'a@example.com') == (subscription_id, True, None)
+
+
+def test_keywords_are_normalized(store):
+    _confirmed(store, 'ＨＵＦＳ')
+    matcher = SubscriptionMatcher(store)
+    notice = dict(NOTICE, title='hufs 소식')
+    assert [keyword for _, _, keyword, _ in matcher.match([(1, notice)])] == [normalize_keyword('ＨＵＦＳ')]
+
+
+def test_enqueue_is_idempotent(store):
+    subscription_id = _confirmed(store, '장학')
+    matches = [(subscription_id, 100, '장학', NOTICE)]
+    assert store.enqueue(matches) == 1
+    assert store.enqueue(matches) == 0
+    assert store.get_stats()['pending'] == 1
+
+
+def test_claim_is_exclusive_until_stale(store):
+    subscription_id = _confirmed(store, '장학')
+    store.enqueue([(subscription_id, article_id, '장학', NOTICE) for article_id in (1, 2, 3)])
+    _, first = store.claim(2, stale_after=60)
+    _, second = store.claim(10, stale_after=60)
+    assert [row[3] for row in first] == [1, 2]
+    assert [row[3] for row in second] == [3]
+    # 선점이 만료되면 다른 워커가 다시 선점
+    _, again = store.claim(10, stale_after=0)
+    assert [row[3] for row in again] == [1, 2, 3]
+
+
+def test_release_retries_after_stale_window_until_max_attempts(store, monkeypatch):
+    monkeypatch.setattr(Config, 'NOTIFY_MAX_ATTEMPTS', 2)
+    subscription_id = _confirmed(store, '장학')
+    store.enqueue([(subscription_id, 1, '장학', NOTICE)])
+
+    _, rows = store.claim(10, stale_after=60)
+    store.release([rows[0][0]])
+    assert store.has_pending()
+    # 실패 직후에는 선점 만료 전이라 다시 선점되지 않음
+    assert store.claim(10, stale_after=60)[1] == []
+    time.sleep(0.01)
+    _, rows = store.claim(10, stale_after=0.001)
+    assert len(rows) == 1
+    store.release([rows[0][0]])
+    # 최대 시도 횟수를 넘으면 실패로 남음
+    time.sleep(0.01)
+    assert store.claim(10, stale_after=0.001)[1] == []
+    assert not store.has_pending()
+    assert store.get_stats()['failed'] == 1
+
+
+def test_mark_sent(store):
+    subscription_id = _confirmed(store, '장학')
+    store.enqueue([(subscription_id, 1, '장학', NOTICE)])
+    _, rows = store.claim(10)
+    store.mark_sent([row[0] for row in rows])
+    assert store.claim(10, stale_after=0)[1] == []
+    assert store.get_stats()['sent'] == 1
+
+
+def test_remove_requires_matching_target(store):
+    subscription_id = _confirmed(store, '장학')
+    store.enqueue([(subscription_id, 1, '장학', NOTICE)])
+    assert not store.remove(subscription_id, 'https://other.example/hook')
+    assert store.remove(subscription_id, 'https://example.com/hook')
+    assert store.get_stats() == {'subscriptions': 0, 'unconfirmed': 0, 'pending': 0, 'sent': 0, 'failed': 0}
@@ -0,0 +1,95 @@
+import copy
+
+import pytest
+
+from app.models.tenants import TenantRegistry
+from app.tenancy import TENANT_ENVIRON_KEY, TenantMiddleware
+from config import Config
+
+"""
+테넌트 결정: 경로 접두사 -> 호스트 -> 기본 테넌트 순서, 미들웨어의 SCRIPT_NAME/PATH_INFO 재작성
+"""
+
+
+def _definitions(**extra):
+    base = Config.TENANTS[Config.DEFAULT_TENANT]
+    definitions = {Config.DEFAULT_TENANT: copy.deepcopy(base)}
+    for tenant_id, overrides in extra.items():
+        definitions[tenant_id] = dict(copy.deepcopy(base), features=[])
+        definitions[tenant_id].update(overrides)
+    return definitions
+
+
+@pytest.fixture
+def registry():
+    return TenantRegistry(_definitions(glc={'name': '글로벌캠퍼스', 'hosts': ['glc.example'], 'path_prefix': '/glc'},
+                                       other={'hosts': ['Other.Example']}),
+                          Config.DEFAULT_TENANT)
+
+
+def test_resolve_order(registry):
+    assert registry.resolve('localhost', '/glc/update') == (registry.get('glc'), '/glc')
+    assert registry.resolve('localhost', '/glc') == (registry.get('glc'), '/glc')
+    # 접두사가 호스트보다 우선
+    assert registry.resolve('other.example', '/glc/update') == (registry.get('glc'), '/glc')
+    assert registry.resolve('OTHER.example:8080', '/update') == (registry.get('other'), '')
+    assert registry.resolve('localhost', '/glcx/update') == (registry.default, '')
+    assert registry.resolve(None, '/') == (registry.default, '')
+
+
+def test_default_tenant_uses_unpartitioned_cache(registry):
+    assert registry.default.partition is None
+    assert registry.get('glc').partition == 'glc'
+
+
+@pytest.mark.parametrize('extra, message', [
+    ({'a': {'hosts': ['x.example']}, 'b': {'hosts': ['x.example']}}, '호스트'),
+    ({'a': {'path_prefix': '/x'}, 'b': {'path_prefix': '/x'}}, '경로 접두사'),
+    ({'a': {'path_prefix': 'x'}}, 'path_prefix'),
+    ({'A!': {}}, '테넌트 ID'),
+    # 저장소/학식은 프로세스 공용이라 기본 테넌트만 사용 가능
+    ({'a': {'features': ['archive']}}, '기본 테넌트 전용 기능'),
+    ({'a': {'features': ['meals']}}, 'meals'),
+])
+def test_invalid_definitions(extra, message):
+    with pytest.raises(ValueError, match=message):
+        TenantRegistry(_definitions(**extra), Config.DEFAULT_TENANT)
+
+
+def _call(middleware, path, host='localhost', query='', script_name=''):
+    seen, statuses = {}, []
+
+    def app(environ, start_response):
+        seen.update(environ)
+        start_response('200 OK', [])
+        return [b'ok']
+    middleware.wsgi_app = app
+    environ = {'PATH_INFO': path, 'HTTP_HOST': host, 'QUERY_STRING': query, 'SCRIPT_NAME': script_name}
+    body = middleware(environ, lambda status, headers: statuses.append((status, dict(headers))))
+    return seen, statuses[0], b''.join(body)
+
+
+def test_middleware_moves_prefix_to_script_name(registry):
+    middleware = TenantMiddleware(None, registry)
+    environ, (status, _), _ = _call(middleware, '/glc/notices', script_name='/app')
+    assert status == '200 OK'
+    assert environ['SCRIPT_NAME'] == '/app/glc'
+    assert environ['PATH_INFO'] == '/notices'
+    assert environ[TENANT_ENVIRON_KEY] is registry.get('glc')
+
+
+def test_middleware_redirects_bare_prefix(registry):
+    middleware = TenantMiddleware(None, registry)
+    environ, (status, headers), _ = _call(middleware, '/glc', query='theme=dark')
+    assert status.startswith('301')
+    assert headers['Location'] == '/glc/?theme=dark'
+    assert environ == {}
+
+
+def test_middleware_host_and_default(registry):
+    middleware = TenantMiddleware(None, registry)
+    environ, _, _ = _call(middleware, '/update', host='other.example')
+    assert environ['PATH_INFO'] == '/update' and environ['SCRIPT_NAME'] == ''
+    assert environ[TENANT_ENVIRON_KEY] is registry.get('other')
+    environ, _, _ = _call(middleware, '/update')
+    assert environ[TENANT_ENVIRON_KEY] is registry.default
@@ -0,0 +1,11 @@
+from app import create_app
+from app.warmup import warm_up
+
+"""
+운영 서버용 WSGI 진입점
+- gunicorn -c gunicorn.conf.py wsgi:app
+- preload_app 으로 마스터에서 한 번 불러온 뒤 워커를 fork
+"""
+
+app = create_app(warm_up=False)
+warm_up(app)